@@ -3,26 +3,112 @@ Blockchain Tracker Implementation
 Decentralized Peer Discovery Using Blockchain
 """
 
+import os
 import json
-import hashlib
+import hmac
 import time
+import atexit
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict, Set, Tuple, Union
 from loguru import logger
 
+try:
+    import orjson
+    _Load_JSON = orjson.loads
+except ImportError:
+    _Load_JSON = json.loads
+
+from Config import Blockchain_Config
+from Crypto.Hash_Backend import Fast_SHA256
 from Database import Blockchain_Record, Database_Manager
 
 
+def _PoW_Limit(Difficulty: int) -> bytes:
+    """
+    Largest Raw Digest Satisfying Proof-Of-Work
+    
+    Args:
+        Difficulty: Number Of Leading Hex Zeros Required
+        
+    Returns:
+        32-Byte Big-Endian Bound (Digest <= Bound Means Valid)
+    """
+    return (16 ** (64 - Difficulty) - 1).to_bytes(32, 'big')
+
+
+# Shared Canonical Encoder (json.dumps Builds A New Encoder Per Call When sort_keys Is Set)
+_Canonical_JSON = json.JSONEncoder(sort_keys=True).encode
+
+# Nonces Tested Per Mining Batch
+_NONCE_BATCH = 4096
+
+# Chains Shorter Than This Are Re-Hashed In-Process During Validation
+_PARALLEL_VALIDATION_THRESHOLD = 4096
+
+# Difficulties From This Level Up Are Mined Across Processes
+_PARALLEL_MINING_DIFFICULTY = 6
+
+# A Failed Block Batch Is Retried With Doubling Delays, Then Saved One Block At A Time
+_FLUSH_MAX_RETRIES = 5
+
+
+def _Search_Nonces(Midstate: Any, Suffix: bytes, Limit: bytes, Start: int, Count: int) -> Optional[Tuple[int, bytes]]:
+    """
+    Search A Contiguous Nonce Range For A Valid Proof-Of-Work
+    
+    Args:
+        Midstate: SHA-256 Object That Has Absorbed The Block Prefix
+        Suffix: Serialized Block Fields Following The Nonce
+        Limit: Largest Acceptable Digest (See _PoW_Limit)
+        Start: First Nonce To Try
+        Count: Number Of Nonces To Try
+        
+    Returns:
+        Tuple Of (Nonce, Digest) For The First Match, Or None
+    """
+    Copy = Midstate.copy
+    
+    for Nonce in range(Start, Start + Count):
+        Hash_Obj = Copy()
+        Hash_Obj.update(b'%d%s' % (Nonce, Suffix))
+        Digest = Hash_Obj.digest()
+        
+        if Digest <= Limit:
+            return Nonce, Digest
+    
+    return None
+
+
+def _Search_Nonce_Range(Prefix: bytes, Suffix: bytes, Limit: bytes, Start: int, Count: int) -> Optional[Tuple[int, bytes]]:
+    """Search A Nonce Range From A Fresh Midstate (Process Pool Worker)"""
+    return _Search_Nonces(Fast_SHA256(Prefix), Suffix, Limit, Start, Count)
+
+
 class Block:
     """Blockchain Block For Tracker Data"""
     
+    # Fixed Attribute Layout - No Per-Block __dict__ For Long Chains
+    __slots__ = (
+        'Block_Number',
+        'Previous_Hash',
+        'Timestamp',
+        'Nonce',
+        'Hash',
+        '_Data',
+        '_Data_Raw'
+    )
+    
     def __init__(
         self,
         Block_Number: int,
         Previous_Hash: str,
-        Data: dict,
+        Data: Union[dict, bytes],
         Timestamp: Optional[float] = None,
-        Nonce: int = 0
+        Nonce: int = 0,
+        Hash: Optional[str] = None
     ):
         """
         Initialize Block
@@ -30,28 +116,59 @@ class Block:
         Args:
             Block_Number: Block Index
             Previous_Hash: Hash Of Previous Block
-            Data: Block Data (Peer/Torrent Info)
+            Data: Block Data (Peer/Torrent Info) Or Its Stored JSON Bytes
             Timestamp: Block Creation Time
             Nonce: Proof-Of-Work Nonce
+            Hash: Known Block Hash (Skips Hashing When Loading Stored Blocks)
         """
         self.Block_Number = Block_Number
         self.Previous_Hash = Previous_Hash
-        self.Data = Data
         self.Timestamp = Timestamp or time.time()
         self.Nonce = Nonce
-        self.Hash = self.Calculate_Hash()
+        
+        # Stored Blocks Keep Raw JSON Until Data Is First Read
+        if isinstance(Data, bytes):
+            self._Data, self._Data_Raw = None, Data
+        else:
+            self._Data, self._Data_Raw = Data, None
+        
+        self.Hash = Hash or self.Calculate_Hash()
+    
+    @property
+    def Data(self) -> dict:
+        """Block Data, Decoded On First Access"""
+        if self._Data is None:
+            self._Data = _Load_JSON(self._Data_Raw)
+            self._Data_Raw = None
+        return self._Data
+    
+    def _Hash_Parts(self) -> Tuple[bytes, bytes]:
+        """
+        Split Canonical Block Serialization Around The Nonce
+        
+        Returns:
+            Tuple Of (Prefix, Suffix) So That Prefix + Nonce + Suffix Is The Hash Input
+        """
+        # Fixed Sorted-Key Layout, Byte-Identical To json.dumps(..., sort_keys=True)
+        Prefix = '{"Block_Number": %s, "Data": %s, "Nonce": ' % (
+            _Canonical_JSON(self.Block_Number),
+            _Canonical_JSON(self.Data)
+        )
+        Suffix = ', "Previous_Hash": %s, "Timestamp": %s}' % (
+            _Canonical_JSON(self.Previous_Hash),
+            _Canonical_JSON(self.Timestamp)
+        )
+        
+        return Prefix.encode(), Suffix.encode()
+    
+    def _Calculate_Digest(self) -> bytes:
+        """Calculate Raw Block Digest"""
+        Prefix, Suffix = self._Hash_Parts()
+        return Fast_SHA256(Prefix + str(self.Nonce).encode() + Suffix).digest()
     
     def Calculate_Hash(self) -> str:
         """Calculate Block Hash"""
-        Block_String = json.dumps({
-            'Block_Number': self.Block_Number,
-            'Previous_Hash': self.Previous_Hash,
-            'Data': self.Data,
-            'Timestamp': self.Timestamp,
-            'Nonce': self.Nonce
-        }, sort_keys=True)
-        
-        return hashlib.sha256(Block_String.encode()).hexdigest()
+        return self._Calculate_Digest().hex()
     
     def Mine_Block(self, Difficulty: int = 4):
         """
@@ -60,11 +177,26 @@ class Block:
         Args:
             Difficulty: Number Of Leading Zeros Required
         """
-        Target = '0' * Difficulty
+        # Compare Raw Digests Against A Byte Bound Instead Of Hex Prefixes
+        Limit = _PoW_Limit(Difficulty)
+        
+        # Serialize Fixed Fields Once - Only The Nonce Changes Per Attempt
+        Prefix, Suffix = self._Hash_Parts()
         
-        while self.Hash[:Difficulty] != Target:
-            self.Nonce += 1
-            self.Hash = self.Calculate_Hash()
+        # Absorb The Prefix Once And Resume From Its Midstate Per Attempt
+        Midstate = Fast_SHA256(Prefix)
+        Nonce = self.Nonce
+        Digest = bytes.fromhex(self.Hash)
+        Found = (Nonce, Digest) if Digest <= Limit else None
+        
+        # Test Nonces In Batches To Keep The Hot Loop Tight
+        while Found is None:
+            Found = _Search_Nonces(Midstate, Suffix, Limit, Nonce + 1, _NONCE_BATCH)
+            Nonce += _NONCE_BATCH
+        
+        # Hex-Encode Only The Winning Digest
+        self.Nonce, Digest = Found
+        self.Hash = Digest.hex()
         
         logger.info(f"Block #{self.Block_Number} Mined: {self.Hash}")
     
@@ -80,6 +212,11 @@ class Block:
         }
 
 
+def _Hash_Block_Batch(Blocks: List[Block]) -> List[str]:
+    """Recompute Hashes For A Batch Of Blocks (Process Pool Worker)"""
+    return [Block_Obj.Calculate_Hash() for Block_Obj in Blocks]
+
+
 class Blockchain_Tracker:
     """Decentralized Blockchain-Based Tracker"""
     
@@ -95,9 +232,36 @@ class Blockchain_Tracker:
         self.Difficulty = Difficulty
         self.Chain: List[Block] = []
         
+        # Guards Chain Appends And The Peer Index Catch-Up Against Concurrent Requests
+        self._Chain_Lock = threading.Lock()
+        
+        # Info_Hash -> Peer Announcements (Oldest First), Built Lazily
+        self._Peer_Index: Dict[str, List[dict]] = defaultdict(list)
+        self._Indexed_Blocks = 0
+        
+        # Hashes Of Blocks Already Re-Hashed Or Mined This Session
+        self._Verified_Hashes: Set[str] = set()
+        
+        # Worker Processes For High-Difficulty Mining (Created On First Use)
+        self._Mining_Pool: Optional[ProcessPoolExecutor] = None
+        
+        # Blocks Mined But Not Yet Persisted
+        self._Pending_Blocks: List[Block] = []
+        self._Pending_Lock = threading.Lock()
+        
+        # Consecutive Failed Flushes, The Monotonic Time Before Which None Is Retried,
+        # And Blocks Set Aside After Failing To Save On Their Own
+        self._Flush_Failures = 0
+        self._Retry_At = 0.0
+        self._Quarantined_Blocks: List[Block] = []
+        
         # Initialize Or Load Chain
         self._Initialize_Chain()
         
+        # Persist Pending Blocks Periodically And On Exit
+        self._Start_Flush_Task()
+        atexit.register(self.Flush, True)
+        
         logger.info(f"Blockchain Tracker Initialized With {len(self.Chain)} Blocks")
     
     def _Initialize_Chain(self):
@@ -105,21 +269,22 @@ class Blockchain_Tracker:
         try:
             Session = self.DB.Get_Session()
             
-            # Load Existing Blocks
-            Records = Session.query(Blockchain_Record).order_by(Blockchain_Record.Block_Number).all()
+            # Load Existing Blocks As Plain Column Tuples (No ORM Identity Map)
+            Records = Session.query(
+                Blockchain_Record.Block_Number,
+                Blockchain_Record.Previous_Hash,
+                Blockchain_Record.Data,
+                Blockchain_Record.Timestamp,
+                Blockchain_Record.Nonce,
+                Blockchain_Record.Block_Hash
+            ).order_by(Blockchain_Record.Block_Number).all()
             
             if Records:
-                # Load From Database
-                for Record in Records:
-                    Data = json.loads(Record.Data.decode('utf-8'))
-                    Block_Obj = Block(
-                        Block_Number=Record.Block_Number,
-                        Previous_Hash=Record.Previous_Hash,
-                        Data=Data,
-                        Timestamp=Record.Timestamp.timestamp(),
-                        Nonce=Record.Nonce
-                    )
-                    self.Chain.append(Block_Obj)
+                # Load From Database (Data Decoded And Verified On Demand)
+                self.Chain.extend(
+                    Block(Number, Previous_Hash, Data, Timestamp.timestamp(), Nonce, Block_Hash)
+                    for Number, Previous_Hash, Data, Timestamp, Nonce, Block_Hash in Records
+                )
                 
                 logger.info(f"Loaded {len(self.Chain)} Blocks From Database")
             else:
@@ -141,7 +306,7 @@ class Blockchain_Tracker:
                 Data={'Type': 'Genesis', 'Message': 'DST Blockchain Tracker Genesis Block'}
             )
             
-            Genesis.Mine_Block(self.Difficulty)
+            self._Mine(Genesis)
             self.Chain.append(Genesis)
             
             # Save To Database
@@ -153,28 +318,158 @@ class Blockchain_Tracker:
             logger.error(f"Failed To Create Genesis Block: {E}")
             raise
     
+    def _Mine(self, Block_Obj: Block):
+        """Mine Block, Using All Cores When Difficulty Is High"""
+        if self.Difficulty >= _PARALLEL_MINING_DIFFICULTY:
+            self._Mine_Parallel(Block_Obj, self.Difficulty)
+        else:
+            Block_Obj.Mine_Block(self.Difficulty)
+    
+    def _Mine_Parallel(self, Block_Obj: Block, Difficulty: int):
+        """
+        Mine Block By Striping Nonce Ranges Across Worker Processes
+        
+        Args:
+            Block_Obj: Block To Mine
+            Difficulty: Number Of Leading Zeros Required
+        """
+        Workers = os.cpu_count() or 1
+        if self._Mining_Pool is None:
+            self._Mining_Pool = ProcessPoolExecutor(max_workers=Workers)
+        
+        Limit = _PoW_Limit(Difficulty)
+        Prefix, Suffix = Block_Obj._Hash_Parts()
+        Nonce = Block_Obj.Nonce
+        Digest = bytes.fromhex(Block_Obj.Hash)
+        Found = (Nonce, Digest) if Digest <= Limit else None
+        
+        # Each Round Hands Worker K The K-th Batch After The Current Nonce
+        while Found is None:
+            Starts = [Nonce + 1 + K * _NONCE_BATCH for K in range(Workers)]
+            Results = self._Mining_Pool.map(
+                _Search_Nonce_Range,
+                [Prefix] * Workers, [Suffix] * Workers, [Limit] * Workers,
+                Starts, [_NONCE_BATCH] * Workers
+            )
+            
+            # Results Arrive In Stripe Order, So The Lowest Winning Nonce Wins
+            Found = next((Result for Result in Results if Result is not None), None)
+            Nonce += Workers * _NONCE_BATCH
+        
+        Block_Obj.Nonce, Digest = Found
+        Block_Obj.Hash = Digest.hex()
+        
+        logger.info(f"Block #{Block_Obj.Block_Number} Mined On {Workers} Workers: {Block_Obj.Hash}")
+    
     def _Save_Block_To_DB(self, Block_Obj: Block):
         """Save Block To Database"""
+        self._Save_Blocks_To_DB([Block_Obj])
+    
+    def _Save_Blocks_To_DB(self, Blocks: List[Block], Chunk_Size: int = 1000) -> bool:
+        """
+        Save Blocks To Database In Bulk
+        
+        Args:
+            Blocks: Blocks To Persist
+            Chunk_Size: Rows Per Bulk Insert
+            
+        Returns:
+            True If The Batch Was Committed
+        """
+        Session = None
         try:
             Session = self.DB.Get_Session()
             
-            Record = Blockchain_Record(
-                Block_Hash=Block_Obj.Hash,
-                Previous_Hash=Block_Obj.Previous_Hash,
-                Block_Number=Block_Obj.Block_Number,
-                Timestamp=datetime.fromtimestamp(Block_Obj.Timestamp),
-                Data=json.dumps(Block_Obj.Data).encode('utf-8'),
-                Nonce=Block_Obj.Nonce,
-                Difficulty=self.Difficulty
-            )
-            
-            Session.add(Record)
+            for Start in range(0, len(Blocks), Chunk_Size):
+                Session.bulk_insert_mappings(Blockchain_Record, [
+                    {
+                        'Block_Hash': Block_Obj.Hash,
+                        'Previous_Hash': Block_Obj.Previous_Hash,
+                        'Block_Number': Block_Obj.Block_Number,
+                        'Timestamp': datetime.fromtimestamp(Block_Obj.Timestamp),
+                        'Data': _Canonical_JSON(Block_Obj.Data).encode(),  # Same Bytes As Hashed
+                        'Nonce': Block_Obj.Nonce,
+                        'Difficulty': self.Difficulty
+                    }
+                    for Block_Obj in Blocks[Start:Start + Chunk_Size]
+                ])
+            
+            # Single Commit For The Whole Batch
             Session.commit()
             Session.close()
+            return True
             
         except Exception as E:
-            logger.error(f"Failed To Save Block To Database: {E}")
-            Session.close()
+            logger.error(f"Failed To Save Blocks To Database: {E}")
+            if Session is not None:
+                Session.rollback()
+                Session.close()
+            return False
+    
+    def _Start_Flush_Task(self):
+        """Start Background Task That Persists Pending Blocks"""
+        def Flush_Pending_Blocks():
+            while True:
+                time.sleep(Blockchain_Config.DB_Flush_Seconds)
+                self.Flush()
+        
+        Flush_Thread = threading.Thread(target=Flush_Pending_Blocks, daemon=True)
+        Flush_Thread.start()
+    
+    def Flush(self, Force: bool = False):
+        """
+        Persist All Pending Blocks In One Transaction
+        
+        A Failed Batch Stays Ahead Of Newer Blocks And Is Retried With Exponential
+        Backoff. Once It Has Failed _FLUSH_MAX_RETRIES Times, Blocks Are Saved One
+        At A Time And Any Block That Still Fails Is Quarantined, So One Poisoned
+        Block Cannot Hold Back The Rest Of The Chain.
+        
+        Args:
+            Force: Retry Immediately Even While Backing Off (Used At Exit)
+        """
+        with self._Pending_Lock:
+            if not self._Pending_Blocks or (not Force and time.monotonic() < self._Retry_At):
+                return
+            
+            Blocks, self._Pending_Blocks = self._Pending_Blocks, []
+            
+            if self._Save_Blocks_To_DB(Blocks):
+                logger.debug(f"Flushed {len(Blocks)} Blocks To Database")
+            else:
+                self._Flush_Failures += 1
+                
+                if self._Flush_Failures < _FLUSH_MAX_RETRIES:
+                    Delay = Blockchain_Config.DB_Flush_Seconds * 2 ** self._Flush_Failures
+                    self._Pending_Blocks[:0] = Blocks
+                    self._Retry_At = time.monotonic() + Delay
+                    logger.warning(f"Kept {len(Blocks)} Unsaved Blocks Pending, Retrying In {Delay:g}s")
+                    return
+                
+                for Block_Obj in Blocks:
+                    if not self._Save_Blocks_To_DB([Block_Obj]):
+                        self._Quarantined_Blocks.append(Block_Obj)
+                        logger.error(
+                            f"Quarantined Block #{Block_Obj.Block_Number} ({Block_Obj.Hash}) "
+                            f"After {_FLUSH_MAX_RETRIES} Failed Batch Saves"
+                        )
+            
+            self._Flush_Failures = 0
+            self._Retry_At = 0.0
+    
+    def _Update_Peer_Index(self):
+        """Add Blocks Appended Since The Last Lookup To The Info_Hash Index (Caller Holds _Chain_Lock)"""
+        for Block_Obj in self.Chain[self._Indexed_Blocks:]:
+            if Block_Obj.Data.get('Type') != 'Peer_Announcement':
+                continue
+            
+            Peer_Info = Block_Obj.Data.get('Peer_Info', {})
+            Info_Hash = Peer_Info.get('Info_Hash')
+            
+            if Info_Hash is not None:
+                self._Peer_Index[Info_Hash].append(Peer_Info)
+        
+        self._Indexed_Blocks = len(self.Chain)
     
     def Get_Latest_Block(self) -> Block:
         """Get Latest Block In Chain"""
@@ -193,24 +488,35 @@ class Blockchain_Tracker:
         try:
             Latest = self.Get_Latest_Block()
             
+            # Read The Clock Once For Both The Block And Announcement Times
+            Now = time.time()
+            
             New_Block = Block(
                 Block_Number=Latest.Block_Number + 1,
                 Previous_Hash=Latest.Hash,
                 Data={
                     'Type': 'Peer_Announcement',
                     'Peer_Info': Peer_Info,
-                    'Announced_At': datetime.utcnow().isoformat()
-                }
+                    'Announced_At': datetime.utcfromtimestamp(Now).isoformat()
+                },
+                Timestamp=Now
             )
             
             # Mine Block
-            New_Block.Mine_Block(self.Difficulty)
+            self._Mine(New_Block)
             
-            # Add To Chain
-            self.Chain.append(New_Block)
+            # Add To Chain (Freshly Mined, So Its Hash Is Known Good)
+            with self._Chain_Lock:
+                self.Chain.append(New_Block)
+                self._Verified_Hashes.add(New_Block.Hash)
             
-            # Save To Database
-            self._Save_Block_To_DB(New_Block)
+            # Queue For Batched Persistence
+            with self._Pending_Lock:
+                self._Pending_Blocks.append(New_Block)
+                Should_Flush = len(self._Pending_Blocks) >= Blockchain_Config.DB_Batch_Size
+            
+            if Should_Flush:
+                self.Flush()
             
             logger.info(f"Added Peer Announcement Block #{New_Block.Block_Number}")
             return New_Block
@@ -230,15 +536,11 @@ class Blockchain_Tracker:
             List Of Peer Information
         """
         try:
-            Peers = []
-            
-            # Scan Blockchain For Relevant Peer Announcements
-            for Block_Obj in reversed(self.Chain):
-                if Block_Obj.Data.get('Type') == 'Peer_Announcement':
-                    Peer_Info = Block_Obj.Data.get('Peer_Info', {})
-                    
-                    if Peer_Info.get('Info_Hash') == Info_Hash:
-                        Peers.append(Peer_Info)
+            with self._Chain_Lock:
+                self._Update_Peer_Index()
+                
+                # Index Lookup Instead Of A Full Chain Scan (Newest First)
+                Peers = self._Peer_Index.get(Info_Hash, [])[::-1]
             
             logger.debug(f"Found {len(Peers)} Peers For {Info_Hash} In Blockchain")
             return Peers
@@ -247,27 +549,59 @@ class Blockchain_Tracker:
             logger.error(f"Failed To Get Peers From Blockchain: {E}")
             return []
     
+    def _Recompute_Hashes(self, Blocks: List[Block]) -> List[str]:
+        """
+        Recompute Block Hashes, Spreading Long Chains Across Processes
+        
+        Args:
+            Blocks: Blocks To Re-Hash
+            
+        Returns:
+            Calculated Hashes In Block Order
+        """
+        if len(Blocks) < _PARALLEL_VALIDATION_THRESHOLD:
+            return _Hash_Block_Batch(Blocks)
+        
+        # Hashes Are Independent Per Block - One Contiguous Slice Per Core
+        Workers = os.cpu_count() or 1
+        Batch_Size = -(-len(Blocks) // Workers)
+        Batches = [Blocks[I:I + Batch_Size] for I in range(0, len(Blocks), Batch_Size)]
+        
+        with ProcessPoolExecutor(max_workers=Workers) as Pool:
+            return [Hash for Batch in Pool.map(_Hash_Block_Batch, Batches) for Hash in Batch]
+    
     def Validate_Chain(self) -> bool:
         """Validate Entire Blockchain"""
         try:
-            for I in range(1, len(self.Chain)):
-                Current = self.Chain[I]
-                Previous = self.Chain[I - 1]
-                
-                # Validate Hash
-                if Current.Hash != Current.Calculate_Hash():
+            Chain = self.Chain
+            Limit = _PoW_Limit(self.Difficulty)
+            
+            # Pass 1: Links And Stored Proof-Of-Work (No Hashing Needed)
+            # Compare Whole Hash Columns At Once; Lowercase Hex Orders Like The Digest
+            Hashes = [Block_Obj.Hash for Block_Obj in Chain]
+            Links = [Block_Obj.Previous_Hash for Block_Obj in Chain]
+            
+            if Hashes[:-1] != Links[1:] or max(Hashes[1:], default='') > Limit.hex():
+                # Locate The First Offending Block For The Log
+                for Previous, Current in zip(Chain, Chain[1:]):
+                    if Current.Previous_Hash != Previous.Hash:
+                        logger.error(f"Broken Chain At Block #{Current.Block_Number}")
+                        return False
+                    
+                    if bytes.fromhex(Current.Hash) > Limit:
+                        logger.error(f"Invalid PoW At Block #{Current.Block_Number}")
+                        return False
+            
+            # Pass 2: Re-Hash Blocks Only Once The Chain Structure Holds,
+            # Skipping Blocks Already Verified Earlier In This Session
+            Verified = self._Verified_Hashes
+            Blocks = [Block_Obj for Block_Obj in Chain[1:] if Block_Obj.Hash not in Verified]
+            for Current, Calculated in zip(Blocks, self._Recompute_Hashes(Blocks)):
+                if Calculated != Current.Hash:
                     logger.error(f"Invalid Hash At Block #{Current.Block_Number}")
                     return False
-                
-                # Validate Link
-                if Current.Previous_Hash != Previous.Hash:
-                    logger.error(f"Broken Chain At Block #{Current.Block_Number}")
-                    return False
-                
-                # Validate Proof-Of-Work
-                if not Current.Hash.startswith('0' * self.Difficulty):
-                    logger.error(f"Invalid PoW At Block #{Current.Block_Number}")
-                    return False
+            
+            Verified.update(Block_Obj.Hash for Block_Obj in Blocks)
             
             logger.info("Blockchain Validation Successful")
             return True
@@ -322,10 +656,10 @@ class Dead_Drop_Manager:
             Encrypted_Package = Nonce + Ciphertext
             
             # Generate Drop ID
-            Drop_ID = hashlib.sha256(Encrypted_Package).hexdigest()
+            Drop_ID = Fast_SHA256(Encrypted_Package).hexdigest()
             
-            # Calculate Key Hash
-            Key_Hash = hashlib.sha256(Encryption_Key).hexdigest()
+            # Calculate Key Hash (Raw Digest, Never Hex-Encoded)
+            Key_Hash = Fast_SHA256(Encryption_Key).digest()
             
             # Create Expiration
             Expires_At = datetime.utcnow() + timedelta(hours=Expires_Hours)
@@ -336,6 +670,8 @@ class Dead_Drop_Manager:
             Drop = Dead_Drop(
                 Id=Drop_ID,
                 Encrypted_Data=Encrypted_Package,
+                Nonce=Nonce,
+                Salt=b'',  # Raw Keys Need No KDF Salt
                 Encryption_Key_Hash=Key_Hash,
                 Expires_At=Expires_At,
                 Max_Access=Max_Access,
@@ -386,9 +722,9 @@ class Dead_Drop_Manager:
                 Session.close()
                 return None
             
-            # Verify Key
-            Key_Hash = hashlib.sha256(Encryption_Key).hexdigest()
-            if Key_Hash != Drop.Encryption_Key_Hash:
+            # Verify Key (Constant-Time Compare On Raw Digests)
+            Key_Hash = Fast_SHA256(Encryption_Key).digest()
+            if not hmac.compare_digest(Key_Hash, Drop.Encryption_Key_Hash or b''):
                 logger.warning(f"Invalid Key For Dead Drop: {Drop_ID}")
                 Session.close()
                 return None
@@ -426,15 +762,13 @@ class Dead_Drop_Manager:
             
             Session = self.DB.Get_Session()
             
-            Expired = Session.query(Dead_Drop).filter(
+            # Single DELETE Over The Expires_At Index
+            Expired_Count = Session.query(Dead_Drop).filter(
                 Dead_Drop.Expires_At < datetime.utcnow()
-            ).all()
-            
-            for Drop in Expired:
-                Session.delete(Drop)
+            ).delete(synchronize_session=False)
             
             Session.commit()
-            logger.info(f"Cleaned Up {len(Expired)} Expired Dead Drops")
+            logger.info(f"Cleaned Up {Expired_Count} Expired Dead Drops")
             Session.close()
             
         except Exception as E:
@@ -19,7 +19,7 @@ class Server_Config:
     Host = os.getenv('SERVER_HOST', '0.0.0.0')
     Port = int(os.getenv('SERVER_PORT', 5043))
     Debug = os.getenv('DEBUG_MODE', 'False').lower() == 'true'
-    Secret_Key = os.getenv('SECRET_KEY', os.urandom(32).hex())
+    Secret_Key = os.getenv('SECRET_KEY') or os.urandom(32).hex()  # Random Only When Unset
     
 # Database Configuration
 class Database_Config:
@@ -29,21 +29,40 @@ class Database_Config:
     Pool_Size = 10
     Max_Overflow = 20
     
+    # SQLite Connection PRAGMAs (File Databases Only; WAL Journaling Is Always On)
+    SQLite_Cache_Size_KiB = int(os.getenv('SQLITE_CACHE_SIZE_KIB', 64000))  # Page Cache Per Connection
+    SQLite_Mmap_Size = int(os.getenv('SQLITE_MMAP_SIZE', 268435456))  # Bytes Read Through mmap (0 Disables)
+    SQLite_Busy_Timeout_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))  # Wait For Locks Instead Of Failing
+    SQLite_WAL_Autocheckpoint = int(os.getenv('SQLITE_WAL_AUTOCHECKPOINT', 1000))  # Pages Between Checkpoints
+    
+    # Peer Announces (Write-Behind Batching Into One Upsert Transaction)
+    Announce_Batch_Size = int(os.getenv('ANNOUNCE_BATCH_SIZE', 100))
+    Announce_Flush_MS = int(os.getenv('ANNOUNCE_FLUSH_MS', 50))
+    
 # Cryptography Configuration
 class Crypto_Config:
     """Cryptography Settings"""
     # RSA Configuration
     RSA_Key_Size = 4096
+    RSA_Key_Pool_Size = int(os.getenv('RSA_KEY_POOL_SIZE', 2))  # Keys Pre-Generated In The Background (0 Disables)
     RSA_Private_Key_Path = BASE_DIR / os.getenv('RSA_PRIVATE_KEY_PATH', 'Crypto/Keys/Server_Private.pem')
     RSA_Public_Key_Path = BASE_DIR / os.getenv('RSA_PUBLIC_KEY_PATH', 'Crypto/Keys/Server_Public.pem')
     
     # AES Configuration
     AES_Key_Size = 256  # Bits
-    AES_Master_Key = os.getenv('AES_MASTER_KEY', os.urandom(32).hex())
+    AES_Master_Key = os.getenv('AES_MASTER_KEY') or os.urandom(32).hex()  # Random Only When Unset
+    Require_AES_Hardware = os.getenv('REQUIRE_AES_HARDWARE', 'False').lower() == 'true'  # Refuse Software AES-GCM
+    AEAD_Min_Throughput = int(os.getenv('AEAD_MIN_THROUGHPUT', 500))  # MB/s Startup Self-Test Floor (0 Disables)
+    
+    # PBKDF2-HMAC-SHA256 Iterations For New Password-Encrypted Data (OWASP 2023: 600k)
+    PBKDF2_Iterations = int(os.getenv('PBKDF2_ITERATIONS', 600000))
     
     # Quantum-Resistant Configuration
     Enable_Quantum_Resistance = os.getenv('ENABLE_QUANTUM_RESISTANCE', 'True').lower() == 'true'
     Quantum_Algorithm = 'Kyber1024'  # CRYSTALS-Kyber
+    MLKEM_Native_Library = os.getenv('MLKEM_NATIVE_LIB', 'libmlkem1024.so')  # Serves 'ML-KEM-1024' When Present
+    MLKEM_Native_Library_768 = os.getenv('MLKEM_NATIVE_LIB_768', 'libmlkem768.so')  # Serves 'ML-KEM-768'
+    MLKEM_Native_Library_512 = os.getenv('MLKEM_NATIVE_LIB_512', 'libmlkem512.so')  # Serves 'ML-KEM-512'
     
     # Certificate Configuration
     Cert_Validity_Days = 365
@@ -57,6 +76,10 @@ class Blockchain_Config:
     Contract_Address = os.getenv('CONTRACT_ADDRESS', None)
     Gas_Limit = 3000000
     
+    # Block Persistence (Write-Behind Batching)
+    DB_Batch_Size = int(os.getenv('BLOCKCHAIN_DB_BATCH_SIZE', 32))
+    DB_Flush_Seconds = int(os.getenv('BLOCKCHAIN_DB_FLUSH_SECONDS', 5))
+    
 # Security Configuration
 class Security_Config:
     """Advanced Security Features"""
@@ -84,8 +107,14 @@ class Torrent_Config:
     Max_Piece_Size = int(os.getenv('MAX_PIECE_SIZE', 2097152))  # 2MB
     Min_Piece_Size = int(os.getenv('MIN_PIECE_SIZE', 16384))  # 16KB
     
-    # Hash Algorithm
-    Hash_Algorithm = 'sha256'
+    # Files At Least This Large Hash Their Pieces On A Thread Pool
+    Parallel_Hash_Threshold = int(os.getenv('PARALLEL_HASH_THRESHOLD', 16777216))  # 16MB
+    
+    # Cache Of File/Piece Hashes Keyed On (Path, Size, mtime) - Reused When Re-Creating Torrents
+    Hash_Cache_Path = BASE_DIR / os.getenv('HASH_CACHE_PATH', 'Data/Hash_Cache.db')
+    
+    # Hash Algorithm For New Torrents ('sha256' Or 'blake3' - blake3 Needs The Optional Package)
+    Hash_Algorithm = os.getenv('TORRENT_HASH_ALGORITHM', 'sha256')
     
     # Multi-File Support
     Max_Files_Per_Torrent = 10000
@@ -156,20 +185,6 @@ class Monitoring_Config:
     Log_Max_Size = os.getenv('LOG_MAX_SIZE', '10 MB')
     Log_Retention = os.getenv('LOG_RETENTION', '30 days')
     
-# Paths Configuration (Legacy Support)
-class Paths_Config:
-    """Legacy Path Configuration"""
-    Data_Directory = BASE_DIR / 'Data'
-    Logs_Directory = BASE_DIR / 'Logs'
-    Config_Directory = BASE_DIR / 'Config'
-    
-    # Peer Configuration
-    Max_Peers_Per_Torrent = 50
-    Peer_Timeout = 120
-    
-    # Compact Peer List
-    Use_Compact_Peers = True
-    
 # Logging Configuration
 class Logging_Config:
     """Logging Settings"""
@@ -185,10 +200,15 @@ class Paths_Config:
     Data_Dir = BASE_DIR / 'Data'              # Database files
     Downloads_Dir = BASE_DIR / 'Downloads'    # Downloaded files
     Keys_Dir = BASE_DIR / 'Crypto/Keys'       # Encryption keys
+    
+    _Directories_Created = False
 
     @classmethod
     def Create_All_Directories(cls):
-        """Create Only Essential Directories"""
+        """Create Only Essential Directories (Once Per Process)"""
+        if cls._Directories_Created:
+            return
+        
         essential_dirs = [
             cls.Data_Dir,
             cls.Downloads_Dir,
@@ -197,6 +217,8 @@ class Paths_Config:
 
         for directory in essential_dirs:
             directory.mkdir(parents=True, exist_ok=True)
+        
+        cls._Directories_Created = True
 
 # Initialize Directories On Import
 Paths_Config.Create_All_Directories()
@@ -0,0 +1,150 @@
+"""
+Hash Cache Module
+Remembers File And Piece Hashes So Re-Creating A Torrent Skips Re-Hashing
+"""
+
+import os
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+from loguru import logger
+
+from Config import Torrent_Config
+from Crypto.Hash_Backend import Fast_SHA256
+
+
+class Hash_Cache:
+    """
+    Persistent Cache Of (File Hashes, Piece Hashes) For A Set Of Input Files
+
+    Entries Are Keyed On Every File's (Absolute Path, Size, mtime_ns) Plus The
+    Piece Size, So Touching Any File Or Changing The Piece Size Is A Miss.
+    """
+
+    def __init__(self, Cache_Path: Path = Torrent_Config.Hash_Cache_Path):
+        """
+        Initialize Hash Cache
+
+        Args:
+            Cache_Path: SQLite File Holding The Cache
+        """
+        self.Cache_Path = Path(Cache_Path)
+
+        # A Broken Cache Only Costs Speed - Lookups And Stores Then Just Miss
+        try:
+            self.Cache_Path.parent.mkdir(parents=True, exist_ok=True)
+            with self._Connect() as Conn:
+                Conn.execute(
+                    "CREATE TABLE IF NOT EXISTS Hash_Cache ("
+                    "Signature TEXT PRIMARY KEY, File_Hashes TEXT NOT NULL, Piece_Hashes TEXT NOT NULL)"
+                )
+        except (OSError, sqlite3.Error) as E:
+            logger.warning(f"Hash Cache Unavailable At {self.Cache_Path}: {E}")
+
+    @contextmanager
+    def _Connect(self) -> Iterator[sqlite3.Connection]:
+        """Open A Short-Lived Transaction (Safe To Use From Any Thread)"""
+        Conn = sqlite3.connect(str(self.Cache_Path), timeout=5)
+        try:
+            with Conn:
+                yield Conn
+        finally:
+            Conn.close()
+
+    @staticmethod
+    def _Signature(
+        File_Paths: List[Path],
+        Piece_Size: int,
+        File_Stats: Optional[List[os.stat_result]] = None,
+        Hash_Algo: str = 'sha256'
+    ) -> str:
+        """
+        Build The Cache Key For A File Set
+
+        Args:
+            File_Paths: Input Files In Torrent Order
+            Piece_Size: Piece Size In Bytes
+            File_Stats: stat() Results Already Taken For File_Paths (Optional)
+            Hash_Algo: Piece Hash Algorithm
+
+        Returns:
+            Hex Digest Identifying The Exact File Versions, Piece Size And Algorithm
+        """
+        if File_Stats is None:
+            File_Stats = [os.stat(File_Path) for File_Path in File_Paths]
+
+        Parts = [f"{Piece_Size}\0{Hash_Algo}"]
+        for File_Path, Stat in zip(File_Paths, File_Stats):
+            Parts.append(f"{Path(File_Path).resolve()}\0{Stat.st_size}\0{Stat.st_mtime_ns}")
+
+        return Fast_SHA256('\n'.join(Parts).encode('utf-8')).hexdigest()
+
+    def Get(
+        self,
+        File_Paths: List[Path],
+        Piece_Size: int,
+        File_Stats: Optional[List[os.stat_result]] = None,
+        Hash_Algo: str = 'sha256'
+    ) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Look Up Cached Hashes
+
+        Args:
+            File_Paths: Input Files In Torrent Order
+            Piece_Size: Piece Size In Bytes
+            File_Stats: stat() Results Already Taken For File_Paths (Optional)
+            Hash_Algo: Piece Hash Algorithm
+
+        Returns:
+            (File Hashes, Piece Hashes) On Hit, None On Miss Or Cache Error
+        """
+        try:
+            Signature = self._Signature(File_Paths, Piece_Size, File_Stats, Hash_Algo)
+            with self._Connect() as Conn:
+                Row = Conn.execute(
+                    "SELECT File_Hashes, Piece_Hashes FROM Hash_Cache WHERE Signature = ?",
+                    (Signature,)
+                ).fetchone()
+
+            if Row is None:
+                return None
+
+            logger.debug(f"Hash Cache Hit For {len(File_Paths)} Files")
+            return json.loads(Row[0]), json.loads(Row[1])
+
+        except (OSError, sqlite3.Error, ValueError) as E:
+            logger.warning(f"Hash Cache Lookup Failed: {E}")
+            return None
+
+    def Put(
+        self,
+        File_Paths: List[Path],
+        Piece_Size: int,
+        File_Hashes: List[str],
+        Piece_Hashes: List[str],
+        File_Stats: Optional[List[os.stat_result]] = None,
+        Hash_Algo: str = 'sha256'
+    ):
+        """
+        Store Hashes For A File Set
+
+        Args:
+            File_Paths: Input Files In Torrent Order
+            Piece_Size: Piece Size In Bytes
+            File_Hashes: Whole-File SHA-256 Hashes, One Per File
+            Piece_Hashes: Piece SHA-256 Hashes
+            File_Stats: stat() Results Already Taken For File_Paths (Optional)
+            Hash_Algo: Piece Hash Algorithm
+        """
+        try:
+            Signature = self._Signature(File_Paths, Piece_Size, File_Stats, Hash_Algo)
+            with self._Connect() as Conn:
+                Conn.execute(
+                    "INSERT OR REPLACE INTO Hash_Cache (Signature, File_Hashes, Piece_Hashes) VALUES (?, ?, ?)",
+                    (Signature, json.dumps(File_Hashes), json.dumps(Piece_Hashes))
+                )
+
+        except (OSError, sqlite3.Error) as E:
+            logger.warning(f"Hash Cache Store Failed: {E}")
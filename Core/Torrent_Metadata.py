@@ -5,31 +5,184 @@ Implements .dst File Format, SHA-256 Hashing, Multi-File Support
 
 import os
 import json
+import base64
+import hmac
+import mmap
+import queue
 import hashlib
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
+from functools import cached_property
 import bencodepy
 from loguru import logger
 
+try:
+    import orjson
+    _Load_JSON = orjson.loads
+    
+    def _Dump_JSON(Obj: Any, Indent: bool = False) -> bytes:
+        """Serialize To UTF-8 With orjson (Compact, Or Two-Space Indented)"""
+        return orjson.dumps(Obj, option=orjson.OPT_INDENT_2 if Indent else 0)
+except ImportError:
+    _Load_JSON = json.loads
+    
+    def _Dump_JSON(Obj: Any, Indent: bool = False) -> bytes:
+        """Serialize To UTF-8 With The Standard Library (Compact, Or Two-Space Indented)"""
+        Text = json.dumps(Obj, indent=2) if Indent else json.dumps(Obj, separators=(',', ':'))
+        return Text.encode('utf-8')
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 from Config import Torrent_Config, Crypto_Config
-from Crypto import Hash_Functions, Hybrid_Encryption, RSA_Handler
+from Crypto import Hybrid_Encryption, RSA_Handler
+from Crypto.Hash_Backend import Fast_SHA256, Get_Hash_Constructor
+from .Hash_Cache import Hash_Cache
+
+
+def _Advise_Sequential(Mapped: mmap.mmap):
+    """
+    Hint The Kernel To Read Ahead Aggressively On A Mapping
+
+    Args:
+        Mapped: Memory-Mapped File
+    """
+    # madvise Is Missing On Windows And Python < 3.8 - The Hint Is Optional
+    if not hasattr(Mapped, 'madvise'):
+        return
+    
+    for Advice in ('MADV_SEQUENTIAL', 'MADV_WILLNEED'):
+        if hasattr(mmap, Advice):
+            Mapped.madvise(getattr(mmap, Advice))
+
+
+def _Unpack_Piece_Hashes(Packed: str) -> List[str]:
+    """
+    Decode The Packed 'Pieces' Field Of A .dst File
+    
+    Args:
+        Packed: Base64 Text Of Concatenated 32-Byte Digests
+        
+    Returns:
+        Hex SHA-256 Piece Hashes
+    """
+    Raw = base64.b64decode(Packed, validate=True)
+    if len(Raw) % 32:
+        raise ValueError("Packed Piece Hashes Are Not A Multiple Of 32 Bytes")
+    
+    Hex = Raw.hex()
+    return [Hex[I:I + 64] for I in range(0, len(Hex), 64)]
+
+
+# Buffer Size For Streaming Reads Of Torrent Content
+_READ_BUFFER_SIZE = 1 << 20
+
+# Set Bit Positions (MSB First, As In The BitTorrent Bitfield) For Every Byte Value
+_BIT_POSITIONS = tuple(
+    tuple(Bit for Bit in range(8) if Byte & (0x80 >> Bit)) for Byte in range(256)
+)
+
+
+def Pieces_Bitmap_From_Indices(Piece_Count: int, Indices: Iterable[int]) -> bytes:
+    """
+    Build A Piece Bitmap (Bit N Set = Piece N Present)
+    
+    Args:
+        Piece_Count: Total Number Of Pieces
+        Indices: Piece Indexes To Mark
+        
+    Returns:
+        ceil(Piece_Count / 8) Bytes, MSB-First Within Each Byte
+    """
+    Bitmap = bytearray((Piece_Count + 7) // 8)
+    for Index in Indices:
+        if 0 <= Index < Piece_Count:
+            Bitmap[Index >> 3] |= 0x80 >> (Index & 7)
+    return bytes(Bitmap)
+
+
+def Iter_Present_Pieces(Bitmap: bytes, Piece_Count: int) -> Iterator[int]:
+    """
+    Yield Indexes Of Set Bits In A Piece Bitmap
+    
+    Args:
+        Bitmap: Piece Bitmap
+        Piece_Count: Total Number Of Pieces (Trailing Pad Bits Are Ignored)
+        
+    Returns:
+        Iterator Over Present Piece Indexes In Ascending Order
+    """
+    for Byte_Index, Byte in enumerate(Bitmap[:(Piece_Count + 7) // 8]):
+        # Whole Empty Bytes Are Skipped With A Single Check
+        if Byte:
+            Base = Byte_Index << 3
+            for Bit in _BIT_POSITIONS[Byte]:
+                if Base + Bit < Piece_Count:
+                    yield Base + Bit
+
+
+def Iter_Missing_Pieces(Bitmap: bytes, Piece_Count: int) -> Iterator[int]:
+    """
+    Yield Indexes Of Clear Bits In A Piece Bitmap
+    
+    Args:
+        Bitmap: Piece Bitmap (Shorter Bitmaps Count Absent Bytes As Missing)
+        Piece_Count: Total Number Of Pieces
+        
+    Returns:
+        Iterator Over Missing Piece Indexes In Ascending Order
+    """
+    Padded = bytes(Bitmap).ljust((Piece_Count + 7) // 8, b'\x00')
+    return Iter_Present_Pieces(bytes(Byte ^ 0xFF for Byte in Padded), Piece_Count)
+
+
+def _Scan_Files(Directory: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+    """
+    Recursively Yield Regular Files Under A Directory With Their stat() Results
+    
+    Matches rglob('*') + is_file(): Symlinked Files Are Included, Symlinked
+    Directories Are Not Descended Into. Uses os.scandir So Directory Entries
+    Come With Their Type Already Known.
+    
+    Args:
+        Directory: Root Directory
+        
+    Returns:
+        Iterator Of (File Path, Stat Result) In No Particular Order
+    """
+    Pending = [Directory]
+    while Pending:
+        with os.scandir(Pending.pop()) as Entries:
+            for Entry in Entries:
+                if Entry.is_dir(follow_symlinks=False):
+                    Pending.append(Path(Entry.path))
+                elif Entry.is_file():
+                    yield Path(Entry.path), Entry.stat()
 
 
 class Piece_Manager:
     """Manages Torrent Pieces And Hashing"""
     
-    def __init__(self, Piece_Size: int = Torrent_Config.Default_Piece_Size):
+    def __init__(self, Piece_Size: int = Torrent_Config.Default_Piece_Size, Hash_Algo: str = Torrent_Config.Hash_Algorithm):
         """
         Initialize Piece Manager
         
         Args:
             Piece_Size: Size Of Each Piece In Bytes
+            Hash_Algo: Piece Hash Algorithm ('sha256' Or 'blake3')
         """
         if Piece_Size < Torrent_Config.Min_Piece_Size or Piece_Size > Torrent_Config.Max_Piece_Size:
             raise ValueError(f"Piece Size Must Be Between {Torrent_Config.Min_Piece_Size} And {Torrent_Config.Max_Piece_Size}")
         
         self.Piece_Size = Piece_Size
+        self.Hash_Algo = Hash_Algo
+        self.Hasher = Get_Hash_Constructor(Hash_Algo)
         self.Pieces = []
         logger.info(f"Piece Manager Initialized With Piece Size: {Piece_Size} Bytes")
     
@@ -40,6 +193,33 @@ class Piece_Manager:
         Args:
             File_Path: Path To File
             
+        Returns:
+            List Of Piece Hashes
+        """
+        return self._Calculate_Pieces(File_Path, None)
+    
+    def Calculate_Pieces_And_File_Hash(self, File_Path: Path) -> Tuple[str, List[str]]:
+        """
+        Calculate Whole-File And Piece Hashes In One Pass Over The File
+        
+        Args:
+            File_Path: Path To File
+            
+        Returns:
+            (File Hash, List Of Piece Hashes)
+        """
+        File_Hasher = self.Hasher()
+        Piece_Hashes = self._Calculate_Pieces(File_Path, File_Hasher)
+        return File_Hasher.hexdigest(), Piece_Hashes
+    
+    def _Calculate_Pieces(self, File_Path: Path, File_Hasher: Optional[Any]) -> List[str]:
+        """
+        Hash The Pieces Of A File, Optionally Feeding The Same Bytes To A Whole-File Hasher
+        
+        Args:
+            File_Path: Path To File
+            File_Hasher: SHA-256 Object To Update With The File Contents (Or None)
+            
         Returns:
             List Of Piece Hashes
         """
@@ -47,21 +227,41 @@ class Piece_Manager:
             Piece_Hashes = []
             
             with open(File_Path, 'rb') as F:
-                Piece_Number = 0
+                File_Size = os.fstat(F.fileno()).st_size
                 
-                while True:
-                    Piece_Data = F.read(self.Piece_Size)
-                    if not Piece_Data:
-                        break
-                    
-                    # Calculate SHA-256 Hash
-                    Piece_Hash = Hash_Functions.SHA256(Piece_Data)
-                    Piece_Hashes.append(Piece_Hash)
-                    
-                    Piece_Number += 1
-                    
-                    if Piece_Number % 100 == 0:
-                        logger.debug(f"Processed {Piece_Number} Pieces...")
+                # Zero-Length Files Cannot Be Mapped And Have No Pieces
+                if File_Size:
+                    with mmap.mmap(F.fileno(), 0, access=mmap.ACCESS_READ) as Mapped:
+                        _Advise_Sequential(Mapped)
+                        
+                        # Hash Slices Of The Mapping Directly - No Per-Piece Read Copy
+                        with memoryview(Mapped) as View:
+                            # Bind Everything The Per-Piece Path Touches To Locals Once
+                            Size = self.Piece_Size
+                            Offsets = range(0, File_Size, Size)
+                            
+                            def Hash_Piece(Offset: int, View=View, Size=Size, Hasher=self.Hasher) -> str:
+                                return Hasher(View[Offset:Offset + Size]).hexdigest()
+                            
+                            Workers = os.cpu_count() or 1
+                            if Workers > 1 and File_Size >= Torrent_Config.Parallel_Hash_Threshold:
+                                # hashlib Releases The GIL On Large Buffers, So Threads Scale Across Cores
+                                with ThreadPoolExecutor(max_workers=Workers) as Pool:
+                                    # The Whole-File Hash Is One More Stream Over The Same Mapped Pages
+                                    File_Hash_Future = Pool.submit(File_Hasher.update, View) if File_Hasher is not None else None
+                                    Piece_Hashes = list(Pool.map(Hash_Piece, Offsets))
+                                    
+                                    # Surface Any Whole-File Hash Failure Instead Of Writing A Partial Hash
+                                    if File_Hash_Future is not None:
+                                        File_Hash_Future.result()
+                            elif File_Hasher is None:
+                                Piece_Hashes = [Hash_Piece(Offset) for Offset in Offsets]
+                            else:
+                                Append = Piece_Hashes.append
+                                for Offset in Offsets:
+                                    # Feed Each Piece To Both Hashers While It Is Still In Cache
+                                    File_Hasher.update(View[Offset:Offset + Size])
+                                    Append(Hash_Piece(Offset))
             
             logger.info(f"Calculated {len(Piece_Hashes)} Piece Hashes For {File_Path.name}")
             return Piece_Hashes
@@ -77,60 +277,177 @@ class Piece_Manager:
         Args:
             File_Paths: List Of File Paths
             
+        Returns:
+            List Of Piece Hashes
+        """
+        return self._Calculate_Multi_File_Pieces(File_Paths, None)
+    
+    def Calculate_Multi_File_Pieces_And_File_Hashes(self, File_Paths: List[Path]) -> Tuple[List[str], List[str]]:
+        """
+        Calculate Per-File And Piece Hashes In One Pass Over The Files
+        
+        Args:
+            File_Paths: List Of File Paths
+            
+        Returns:
+            (List Of File Hashes In File Order, List Of Piece Hashes)
+        """
+        File_Hashes = []
+        Piece_Hashes = self._Calculate_Multi_File_Pieces(File_Paths, File_Hashes)
+        return File_Hashes, Piece_Hashes
+    
+    def _Calculate_Multi_File_Pieces(self, File_Paths: List[Path], File_Hashes: Optional[List[str]]) -> List[str]:
+        """
+        Hash Pieces Across Concatenated Files, Optionally Collecting Whole-File Hashes
+        
+        Args:
+            File_Paths: List Of File Paths
+            File_Hashes: List To Append Each File's SHA-256 Hash To (Or None)
+            
         Returns:
             List Of Piece Hashes
         """
         try:
             Piece_Hashes = []
-            Current_Piece = b''
+            
+            # Double Buffering: A Reader Thread Fills One Piece While This Thread Hashes The Other
+            Buffers = [bytearray(self.Piece_Size), bytearray(self.Piece_Size)]
+            Free_Buffers = queue.Queue()
+            Filled_Buffers = queue.Queue()
+            for Index in range(len(Buffers)):
+                Free_Buffers.put(Index)
+            
+            Reader = threading.Thread(
+                target=self._Read_Pieces,
+                args=(File_Paths, Buffers, Free_Buffers, Filled_Buffers, File_Hashes),
+                daemon=True
+            )
+            Reader.start()
+            
+            # One View Per Buffer For The Whole Run, And Hot Methods Bound To Locals
+            Views = [memoryview(Buffer) for Buffer in Buffers]
+            Get_Filled, Put_Free = Filled_Buffers.get, Free_Buffers.put
+            Append, Hasher = Piece_Hashes.append, self.Hasher
+            
+            try:
+                while True:
+                    Item = Get_Filled()
+                    if Item is None:
+                        break
+                    if isinstance(Item, BaseException):
+                        raise Item
+                    
+                    Index, Length = Item
+                    Append(Hasher(Views[Index][:Length]).hexdigest())
+                    Put_Free(Index)
+            finally:
+                # Stop The Reader Even If Hashing Failed, So It Never Waits Forever With A File Open
+                Free_Buffers.put(None)
+                Reader.join()
+                
+                for View in Views:
+                    View.release()
+            
+            logger.info(f"Calculated {len(Piece_Hashes)} Piece Hashes For {len(File_Paths)} Files")
+            return Piece_Hashes
+            
+        except Exception as E:
+            logger.error(f"Failed To Calculate Multi-File Pieces: {E}")
+            raise
+    
+    def _Read_Pieces(
+        self,
+        File_Paths: List[Path],
+        Buffers: List[bytearray],
+        Free_Buffers: queue.Queue,
+        Filled_Buffers: queue.Queue,
+        File_Hashes: Optional[List[str]] = None
+    ):
+        """
+        Producer For Calculate_Multi_File_Pieces
+        
+        Fills Free Piece Buffers In Place Across File Boundaries And Hands Each
+        Completed Piece To The Hasher As (Buffer Index, Length). Posts None When
+        Done, Or The Exception If A Read Fails. Returns Early When The Hasher
+        Frees None Instead Of A Buffer Index.
+        
+        Args:
+            File_Paths: Files To Read In Order
+            Buffers: Piece-Sized Buffers Shared With The Hasher
+            Free_Buffers: Indexes Of Buffers Ready To Be Filled
+            Filled_Buffers: Completed Pieces Ready To Be Hashed
+            File_Hashes: List To Append Each File's SHA-256 Hash To (Or None)
+        """
+        try:
+            Index = Free_Buffers.get()
+            if Index is None:
+                return
+            Offset = 0
             
             for File_Path in File_Paths:
-                with open(File_Path, 'rb') as F:
+                File_Hasher = self.Hasher() if File_Hashes is not None else None
+                
+                # A Large Buffer Absorbs The Short Tail Reads That Finish Each Piece
+                with open(File_Path, 'rb', buffering=_READ_BUFFER_SIZE) as F:
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(F.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    
                     while True:
                         # Read Remaining Space In Current Piece
-                        Bytes_Needed = self.Piece_Size - len(Current_Piece)
-                        Chunk = F.read(Bytes_Needed)
+                        with memoryview(Buffers[Index]) as View:
+                            Bytes_Read = F.readinto(View[Offset:])
+                            
+                            # Whole-File Hash Rides On The Same Read
+                            if File_Hasher is not None and Bytes_Read:
+                                File_Hasher.update(View[Offset:Offset + Bytes_Read])
                         
-                        if not Chunk:
+                        # End Of This File - Carry The Partial Piece Into The Next One
+                        if not Bytes_Read:
                             break
                         
-                        Current_Piece += Chunk
+                        Offset += Bytes_Read
                         
-                        # If Piece Is Complete, Hash It
-                        if len(Current_Piece) == self.Piece_Size:
-                            Piece_Hash = Hash_Functions.SHA256(Current_Piece)
-                            Piece_Hashes.append(Piece_Hash)
-                            Current_Piece = b''
+                        # Piece Complete - Hand It Off And Start Filling The Other Buffer
+                        if Offset == self.Piece_Size:
+                            Filled_Buffers.put((Index, Offset))
+                            Index = Free_Buffers.get()
+                            if Index is None:
+                                return
+                            Offset = 0
+                
+                if File_Hasher is not None:
+                    File_Hashes.append(File_Hasher.hexdigest())
             
-            # Hash Remaining Data
-            if Current_Piece:
-                Piece_Hash = Hash_Functions.SHA256(Current_Piece)
-                Piece_Hashes.append(Piece_Hash)
+            # Remaining Data
+            if Offset:
+                Filled_Buffers.put((Index, Offset))
             
-            logger.info(f"Calculated {len(Piece_Hashes)} Piece Hashes For {len(File_Paths)} Files")
-            return Piece_Hashes
+            Filled_Buffers.put(None)
             
-        except Exception as E:
-            logger.error(f"Failed To Calculate Multi-File Pieces: {E}")
-            raise
+        except BaseException as E:
+            Filled_Buffers.put(E)
     
-    def Verify_Piece(self, Piece_Data: bytes, Expected_Hash: str) -> bool:
+    def Verify_Piece(self, Piece_Data: bytes, Expected_Hash: Union[bytes, str]) -> bool:
         """
         Verify Piece Data Against Expected Hash
         
         Args:
             Piece_Data: Piece Data To Verify
-            Expected_Hash: Expected SHA-256 Hash
+            Expected_Hash: Expected SHA-256 Hash (Raw 32-Byte Digest Or Hex)
             
         Returns:
             True If Valid
         """
         try:
-            Actual_Hash = Hash_Functions.SHA256(Piece_Data)
-            Is_Valid = Actual_Hash == Expected_Hash
+            if isinstance(Expected_Hash, str):
+                Expected_Hash = bytes.fromhex(Expected_Hash)
+            
+            # Constant-Time Compare Of Raw Digests - Hex Is Only Needed For The Failure Log
+            Actual_Digest = self.Hasher(Piece_Data).digest()
+            Is_Valid = hmac.compare_digest(Actual_Digest, Expected_Hash)
             
             if not Is_Valid:
-                logger.warning(f"Piece Verification Failed: Expected {Expected_Hash}, Got {Actual_Hash}")
+                logger.warning(f"Piece Verification Failed: Expected {Expected_Hash.hex()}, Got {Actual_Digest.hex()}")
             
             return Is_Valid
             
@@ -188,7 +505,8 @@ class Torrent_Metadata:
         Tracker_URLs: Optional[List[str]] = None,
         Comment: Optional[str] = None,
         Created_By: Optional[str] = None,
-        Private: bool = False
+        Private: bool = False,
+        Hash_Algo: str = 'sha256'
     ):
         """
         Initialize Torrent Metadata
@@ -202,7 +520,9 @@ class Torrent_Metadata:
             Comment: Optional Comment
             Created_By: Creator Information
             Private: Private Torrent Flag
+            Hash_Algo: Algorithm Used For Piece And Info Hashes ('sha256' Or 'blake3')
         """
+        self.Hash_Algo = Hash_Algo
         self.Name = Name
         self.Files = Files
         self.Piece_Size = Piece_Size
@@ -213,22 +533,84 @@ class Torrent_Metadata:
         self.Private = Private
         self.Creation_Date = int(datetime.utcnow().timestamp())
         
-        # Calculate Info Hash
-        self.Info_Hash = self._Calculate_Info_Hash()
-        
         logger.info(f"Torrent Metadata Created: {Name} ({len(Files)} Files, {len(Piece_Hashes)} Pieces)")
     
+    # Fields Covered By The Info Hash - Assigning Any Of Them Drops The Cached Value
+    _INFO_FIELDS = frozenset({'Name', 'Files', 'Piece_Size', 'Piece_Hashes', 'Hash_Algo'})
+    
+    def __setattr__(self, Name: str, Value: Any):
+        super().__setattr__(Name, Value)
+        if Name == 'Piece_Hashes':
+            self._Invalidate_Info_Hash()
+        elif Name in self._INFO_FIELDS:
+            # Piece-Derived Caches Stay Valid When Only Name/Files/Size/Algorithm Change
+            self.__dict__.pop('Info_Hash', None)
+    
+    def _Invalidate_Info_Hash(self):
+        """Forget The Cached Info Hash And Everything Derived From Piece_Hashes (Call After Mutating Files Or Piece_Hashes In Place)"""
+        for Cached in ('Info_Hash', 'Piece_Digests', '_Pieces_Json'):
+            self.__dict__.pop(Cached, None)
+    
+    @cached_property
+    def Piece_Digests(self) -> bytes:
+        """All Piece Hashes As One Contiguous Blob Of 32-Byte Raw Digests"""
+        return bytes.fromhex(''.join(self.Piece_Hashes))
+    
+    def Get_Piece_Digest(self, Index: int) -> bytes:
+        """
+        Get The Raw SHA-256 Digest Of One Piece
+        
+        Args:
+            Index: Piece Index
+            
+        Returns:
+            32-Byte Digest (Sliced From Piece_Digests, No Hex Parsing)
+        """
+        if not 0 <= Index < len(self.Piece_Hashes):
+            raise IndexError(f"Piece Index {Index} Out Of Range")
+        
+        Offset = Index * 32
+        return self.Piece_Digests[Offset:Offset + 32]
+    
+    @cached_property
+    def Info_Hash(self) -> str:
+        """SHA-256 Info Hash, Computed On First Access"""
+        return self._Calculate_Info_Hash()
+    
+    @cached_property
+    def _Pieces_Json(self) -> bytes:
+        """
+        JSON Encoding Of Piece_Hashes, Kept Until Piece_Hashes Is Reassigned
+        
+        Renaming Or Editing The File List Re-Hashes The Info Dict Without
+        Re-Encoding The (Much Larger) Piece List.
+        """
+        try:
+            Joined = ''.join(self.Piece_Hashes)
+        except TypeError:
+            Joined = None
+        
+        # Alphanumeric ASCII Never Needs JSON Escaping, So Hex Hashes Can Be Quoted As-Is
+        if self.Piece_Hashes and Joined is not None and Joined.isascii() and Joined.isalnum():
+            return ('["' + '", "'.join(self.Piece_Hashes) + '"]').encode('ascii')
+        return json.dumps(self.Piece_Hashes).encode('utf-8')
+    
     def _Calculate_Info_Hash(self) -> str:
-        """Calculate SHA-256 Info Hash"""
-        Info_Dict = {
-            'Name': self.Name,
-            'Piece_Size': self.Piece_Size,
-            'Piece_Hashes': self.Piece_Hashes,
-            'Files': [F.To_Dict() for F in self.Files]
-        }
+        """
+        Calculate SHA-256 Info Hash
         
-        Info_Json = json.dumps(Info_Dict, sort_keys=True)
-        return Hash_Functions.SHA256(Info_Json.encode('utf-8'))
+        Hashes The Same Bytes As json.dumps({Name, Piece_Size, Piece_Hashes, Files},
+        sort_keys=True), Streamed Into The Hasher In Three Parts So The Cached
+        Piece-List Encoding Is Never Copied Into One Large String.
+        """
+        Hasher = Get_Hash_Constructor(self.Hash_Algo)()
+        Hasher.update(('{"Files": %s, "Name": %s, "Piece_Hashes": ' % (
+            json.dumps([F.To_Dict() for F in self.Files], sort_keys=True),
+            json.dumps(self.Name)
+        )).encode('utf-8'))
+        Hasher.update(self._Pieces_Json)
+        Hasher.update((', "Piece_Size": %s}' % json.dumps(self.Piece_Size)).encode('utf-8'))
+        return Hasher.hexdigest()
     
     def To_Dict(self) -> dict:
         """Convert Metadata To Dictionary"""
@@ -237,6 +619,7 @@ class Torrent_Metadata:
             'Files': [F.To_Dict() for F in self.Files],
             'Piece_Size': self.Piece_Size,
             'Piece_Hashes': self.Piece_Hashes,
+            'Hash_Algo': self.Hash_Algo,
             'Tracker_URLs': self.Tracker_URLs,
             'Comment': self.Comment,
             'Created_By': self.Created_By,
@@ -248,18 +631,24 @@ class Torrent_Metadata:
     
     @classmethod
     def From_Dict(cls, Data: dict) -> 'Torrent_Metadata':
-        """Create Metadata From Dictionary"""
+        """Create Metadata From Dictionary (Hex Piece List Or Packed 'Pieces' Field)"""
         Files = [File_Info.From_Dict(F) for F in Data['Files']]
         
+        if 'Pieces' in Data:
+            Piece_Hashes = _Unpack_Piece_Hashes(Data['Pieces'])
+        else:
+            Piece_Hashes = Data['Piece_Hashes']
+        
         Metadata = cls(
             Name=Data['Name'],
             Files=Files,
             Piece_Size=Data['Piece_Size'],
-            Piece_Hashes=Data['Piece_Hashes'],
+            Piece_Hashes=Piece_Hashes,
             Tracker_URLs=Data.get('Tracker_URLs', []),
             Comment=Data.get('Comment'),
             Created_By=Data.get('Created_By'),
-            Private=Data.get('Private', False)
+            Private=Data.get('Private', False),
+            Hash_Algo=Data.get('Hash_Algo', 'sha256')
         )
         
         Metadata.Creation_Date = Data.get('Creation_Date', Metadata.Creation_Date)
@@ -272,6 +661,10 @@ class Torrent_Metadata:
     def Get_Piece_Count(self) -> int:
         """Get Total Number Of Pieces"""
         return len(self.Piece_Hashes)
+    
+    def Empty_Bitmap(self) -> bytes:
+        """Get An All-Missing Piece Bitmap Sized For This Torrent"""
+        return bytes((len(self.Piece_Hashes) + 7) // 8)
 
 
 class DST_File_Handler:
@@ -303,7 +696,9 @@ class DST_File_Handler:
         Piece_Size: Optional[int] = None,
         Comment: Optional[str] = None,
         Private: bool = False,
-        Encrypt: bool = True
+        Encrypt: bool = True,
+        Use_Cache: bool = True,
+        Hash_Algo: Optional[str] = None
     ) -> Torrent_Metadata:
         """
         Create A New .dst Torrent File
@@ -316,6 +711,8 @@ class DST_File_Handler:
             Comment: Torrent Comment
             Private: Private Torrent Flag
             Encrypt: Enable Encryption
+            Use_Cache: Reuse Hashes Of Unchanged Files From Earlier Runs
+            Hash_Algo: Piece/Info Hash Algorithm (Defaults To Torrent_Config.Hash_Algorithm)
             
         Returns:
             Torrent Metadata
@@ -331,39 +728,54 @@ class DST_File_Handler:
             if Piece_Size is None:
                 Piece_Size = Torrent_Config.Default_Piece_Size
             
-            Piece_Mgr = Piece_Manager(Piece_Size)
+            if Hash_Algo is None:
+                Hash_Algo = Torrent_Config.Hash_Algorithm
+            
+            Piece_Mgr = Piece_Manager(Piece_Size, Hash_Algo)
             
-            # Collect Files
+            # Collect Files Along With One stat() Each
             if Input_Path.is_file():
-                Files = [Input_Path]
-                Torrent_Name = Input_Path.name
+                Collected = [(Input_Path, Input_Path.stat())]
             else:
-                Files = sorted(Input_Path.rglob('*'))
-                Files = [F for F in Files if F.is_file()]
-                Torrent_Name = Input_Path.name
+                Collected = sorted(_Scan_Files(Input_Path), key=lambda Item: Item[0])
+            
+            Torrent_Name = Input_Path.name
+            Files = [File_Path for File_Path, _ in Collected]
+            File_Stats = [Stat for _, Stat in Collected]
             
             if not Files:
                 raise ValueError("No Files Found To Create Torrent")
             
             logger.info(f"Found {len(Files)} Files")
             
+            # Reuse Hashes From A Previous Run If No File Changed
+            Cache = Hash_Cache() if Use_Cache else None
+            Cached = Cache.Get(Files, Piece_Size, File_Stats, Hash_Algo) if Cache else None
+            
+            if Cached:
+                File_Hashes, Piece_Hashes = Cached
+                logger.info("Reusing Cached File And Piece Hashes")
+            else:
+                # Calculate File And Piece Hashes In A Single Pass Over The Data
+                logger.info("Calculating Piece Hashes...")
+                if len(Files) == 1:
+                    File_Hash, Piece_Hashes = Piece_Mgr.Calculate_Pieces_And_File_Hash(Files[0])
+                    File_Hashes = [File_Hash]
+                else:
+                    File_Hashes, Piece_Hashes = Piece_Mgr.Calculate_Multi_File_Pieces_And_File_Hashes(Files)
+                
+                if Cache:
+                    Cache.Put(Files, Piece_Size, File_Hashes, Piece_Hashes, File_Stats, Hash_Algo)
+            
             # Calculate File Information
             File_Infos = []
-            for File_Path in Files:
+            for File_Path, File_Stat, File_Hash in zip(Files, File_Stats, File_Hashes):
                 Relative_Path = str(File_Path.relative_to(Input_Path.parent))
-                File_Hash = Hash_Functions.SHA256_File(File_Path)
-                File_Size = File_Path.stat().st_size
+                File_Size = File_Stat.st_size
                 
                 File_Info_Obj = File_Info(Relative_Path, File_Size, File_Hash)
                 File_Infos.append(File_Info_Obj)
             
-            # Calculate Pieces
-            logger.info("Calculating Piece Hashes...")
-            if len(Files) == 1:
-                Piece_Hashes = Piece_Mgr.Calculate_Pieces(Files[0])
-            else:
-                Piece_Hashes = Piece_Mgr.Calculate_Multi_File_Pieces(Files)
-            
             # Create Metadata
             Metadata = Torrent_Metadata(
                 Name=Torrent_Name,
@@ -372,7 +784,8 @@ class DST_File_Handler:
                 Piece_Hashes=Piece_Hashes,
                 Tracker_URLs=Tracker_URLs,
                 Comment=Comment,
-                Private=Private
+                Private=Private,
+                Hash_Algo=Hash_Algo
             )
             
             # Save To File
@@ -395,38 +808,55 @@ class DST_File_Handler:
             Encrypt: Enable Encryption
         """
         try:
-            # Convert To JSON
+            # Convert To Compact JSON - Piece Hashes Travel As One Packed Field
             Metadata_Dict = Metadata.To_Dict()
-            Metadata_Json = json.dumps(Metadata_Dict, indent=2)
-            Metadata_Bytes = Metadata_Json.encode('utf-8')
+            Metadata_Dict.pop('Piece_Hashes')
+            Metadata_Dict['Pieces'] = base64.b64encode(Metadata.Piece_Digests).decode('ascii')
+            Metadata_Dict['DST_Version'] = '1.1'
+            Metadata_Bytes = _Dump_JSON(Metadata_Dict)
+            
+            Will_Encrypt = bool(Encrypt and self.Hybrid_Crypto)
+            
+            # Compress Before Signing And Encrypting So Both Touch Fewer Bytes
+            Compression = 'zstd' if Will_Encrypt and ZSTD_AVAILABLE else None
+            if Compression:
+                Payload = zstandard.ZstdCompressor(level=3).compress(Metadata_Bytes)
+                logger.debug(f"Metadata Compressed {len(Metadata_Bytes)} -> {len(Payload)} Bytes")
+            else:
+                Payload = Metadata_Bytes
             
-            # Sign Metadata
+            # Sign Payload Over A Digest Taken With The OpenSSL SHA-256 Backend
             Signature = None
             if self.RSA and self.RSA.Private_Key:
-                Signature = self.RSA.Sign(Metadata_Bytes)
+                Signature = self.RSA.Sign_Digest(Fast_SHA256(Payload).digest())
                 logger.debug("Metadata Signed With RSA")
             
             # Encrypt If Requested
-            if Encrypt and self.Hybrid_Crypto:
-                Encrypted_Package = self.Hybrid_Crypto.Encrypt(Metadata_Bytes)
+            if Will_Encrypt:
+                Encrypted_Package = self.Hybrid_Crypto.Encrypt(Payload)
                 
-                # Create Encrypted Container
+                # Create Encrypted Container (Base64 Expands 1.33x Where Hex Doubles)
                 Container = {
                     'Encrypted': True,
+                    'Encoding': 'base64',
+                    'Compression': Compression,
                     'Data': {
-                        'Encrypted_Session_Key': Encrypted_Package['Encrypted_Session_Key'].hex(),
-                        'Nonce': Encrypted_Package['Nonce'].hex(),
-                        'Ciphertext': Encrypted_Package['Ciphertext'].hex()
+                        Field: base64.b64encode(Encrypted_Package[Field]).decode('ascii')
+                        for Field in ('Encrypted_Session_Key', 'Nonce', 'Ciphertext')
                     },
                     'Signature': Signature.hex() if Signature else None
                 }
                 
+                # Only Present When The Payload Used ChaCha20-Poly1305
+                if 'AEAD' in Encrypted_Package:
+                    Container['AEAD'] = Encrypted_Package['AEAD'].decode('ascii')
+                
                 logger.debug("Metadata Encrypted With Hybrid Encryption")
             else:
                 # Unencrypted Container
                 Container = {
                     'Encrypted': False,
-                    'Data': Metadata_Json,
+                    'Data': Metadata_Bytes.decode('utf-8'),
                     'Signature': Signature.hex() if Signature else None
                 }
             
@@ -438,8 +868,8 @@ class DST_File_Handler:
             
             # Write To File
             File_Path.parent.mkdir(parents=True, exist_ok=True)
-            with open(File_Path, 'w', encoding='utf-8') as F:
-                json.dump(DST_File, F, indent=2)
+            with open(File_Path, 'wb') as F:
+                F.write(_Dump_JSON(DST_File, Indent=True))
             
             logger.info(f"Torrent Saved To {File_Path}")
             
@@ -462,8 +892,8 @@ class DST_File_Handler:
             logger.info(f"Loading Torrent From {File_Path}...")
             
             # Read File
-            with open(File_Path, 'r', encoding='utf-8') as F:
-                DST_File = json.load(F)
+            with open(File_Path, 'rb') as F:
+                DST_File = _Load_JSON(F.read())
             
             # Validate Magic
             if DST_File.get('DST_Magic') != 'DST_TORRENT_V1':
@@ -478,31 +908,43 @@ class DST_File_Handler:
                 if not self.Hybrid_Crypto:
                     raise ValueError("Cannot Decrypt - No Encryption Handler Provided")
                 
+                # Containers Without An Encoding Field Predate Base64 And Use Hex
                 Data = Container['Data']
+                Decode = base64.b64decode if Container.get('Encoding') == 'base64' else bytes.fromhex
                 Encrypted_Package = {
-                    'Encrypted_Session_Key': bytes.fromhex(Data['Encrypted_Session_Key']),
-                    'Nonce': bytes.fromhex(Data['Nonce']),
-                    'Ciphertext': bytes.fromhex(Data['Ciphertext'])
+                    Field: Decode(Data[Field])
+                    for Field in ('Encrypted_Session_Key', 'Nonce', 'Ciphertext')
                 }
+                if 'AEAD' in Container:
+                    Encrypted_Package['AEAD'] = Container['AEAD'].encode('ascii')
                 
-                Metadata_Bytes = self.Hybrid_Crypto.Decrypt(Encrypted_Package)
-                Metadata_Json = Metadata_Bytes.decode('utf-8')
+                # The Signature Covers The Decrypted Payload, Which May Be Compressed
+                Signed_Bytes = self.Hybrid_Crypto.Decrypt(Encrypted_Package)
+                
+                Compression = Container.get('Compression')
+                if Compression == 'zstd':
+                    if not ZSTD_AVAILABLE:
+                        raise ValueError("Torrent Metadata Is zstd-Compressed But zstandard Is Not Installed")
+                    Metadata_Bytes = zstandard.ZstdDecompressor().decompress(Signed_Bytes)
+                elif Compression is None:
+                    Metadata_Bytes = Signed_Bytes
+                else:
+                    raise ValueError(f"Unsupported Metadata Compression: {Compression}")
                 
                 logger.debug("Metadata Decrypted Successfully")
             else:
-                Metadata_Json = Container['Data']
-                Metadata_Bytes = Metadata_Json.encode('utf-8')
+                Metadata_Bytes = Signed_Bytes = Container['Data'].encode('utf-8')
             
             # Verify Signature
             if Verify_Signature and Signature_Hex and self.RSA:
                 Signature = bytes.fromhex(Signature_Hex)
-                if not self.RSA.Verify(Metadata_Bytes, Signature):
+                if not self.RSA.Verify_Digest(Fast_SHA256(Signed_Bytes).digest(), Signature):
                     logger.warning("Signature Verification Failed!")
                 else:
                     logger.debug("Signature Verified Successfully")
             
             # Parse Metadata
-            Metadata_Dict = json.loads(Metadata_Json)
+            Metadata_Dict = _Load_JSON(Metadata_Bytes)
             Metadata = Torrent_Metadata.From_Dict(Metadata_Dict)
             
             logger.info(f"Torrent Loaded: {Metadata.Name}")
@@ -7,13 +7,21 @@ from .Torrent_Metadata import (
     File_Info,
     Piece_Manager,
     DST_File_Handler,
-    Create_Torrent_From_Path
+    Create_Torrent_From_Path,
+    Pieces_Bitmap_From_Indices,
+    Iter_Present_Pieces,
+    Iter_Missing_Pieces
 )
+from .Hash_Cache import Hash_Cache
 
 __all__ = [
     'Torrent_Metadata',
     'File_Info',
     'Piece_Manager',
     'DST_File_Handler',
-    'Create_Torrent_From_Path'
+    'Create_Torrent_From_Path',
+    'Pieces_Bitmap_From_Indices',
+    'Iter_Present_Pieces',
+    'Iter_Missing_Pieces',
+    'Hash_Cache'
 ]
@@ -4,23 +4,329 @@ Implements AES-256-GCM, RSA-4096, Quantum-Resistant Crypto
 Production-Grade With Full Error Handling
 """
 
+import io
 import os
+import mmap
 import hashlib
+import hmac
 import secrets
-from typing import Tuple, Optional
-from datetime import datetime, timedelta
+import math
+import time
+import queue
+import ctypes
+import ctypes.util
+import struct
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Tuple, Optional, Union
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.asymmetric import rsa, padding, utils
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.backends import default_backend
 from cryptography import x509
+from cryptography.exceptions import InvalidSignature
 from cryptography.x509.oid import NameOID
 from loguru import logger
 
+try:
+    from fastpbkdf2 import pbkdf2_hmac as _Fast_PBKDF2_HMAC
+    FASTPBKDF2_AVAILABLE = True
+except ImportError:
+    FASTPBKDF2_AVAILABLE = False
+
 from Config import Crypto_Config
+from .Hash_Backend import AES_Extensions_Available, Fast_SHA256
+
+
+try:
+    _LIBC = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    _MLOCK_AVAILABLE = hasattr(_LIBC, 'mlock') and hasattr(_LIBC, 'munlock')
+except (OSError, TypeError):
+    _MLOCK_AVAILABLE = False
+
+
+def _Buffer_Address(Buffer: bytearray) -> int:
+    """Address Of A bytearray's Storage (Stable While Its Length Is Unchanged)"""
+    return ctypes.addressof((ctypes.c_char * len(Buffer)).from_buffer(Buffer))
+
+
+def _Lock_Buffer(Buffer: bytearray) -> bool:
+    """
+    Keep A Secret Buffer Out Of Swap With mlock (Best Effort)
+    
+    Args:
+        Buffer: Secret Buffer
+        
+    Returns:
+        True If The Pages Were Locked (RLIMIT_MEMLOCK Can Refuse)
+    """
+    if not _MLOCK_AVAILABLE or not Buffer:
+        return False
+    return _LIBC.mlock(ctypes.c_void_p(_Buffer_Address(Buffer)), ctypes.c_size_t(len(Buffer))) == 0
+
+
+def _Wipe_Buffer(Buffer: bytearray, Locked: bool = False):
+    """
+    Zero A Secret Buffer In Place And Release Its mlock
+    
+    Args:
+        Buffer: Secret Buffer
+        Locked: Buffer Was Locked By _Lock_Buffer
+    """
+    Buffer[:] = bytes(len(Buffer))
+    if Locked:
+        _LIBC.munlock(ctypes.c_void_p(_Buffer_Address(Buffer)), ctypes.c_size_t(len(Buffer)))
+
+
+def _PBKDF2(Password: bytes, Salt: bytes, Iterations: int, Key: bytearray):
+    """
+    PBKDF2-HMAC-SHA256 Through The Fastest Available Implementation
+    
+    fastpbkdf2 Precomputes The HMAC Inner/Outer Pad States Once Per Block; Without
+    It, cryptography's OpenSSL Backend Is Used (Measured Faster Than hashlib's).
+    
+    Args:
+        Password: Password Bytes
+        Salt: PBKDF2 Salt
+        Iterations: Iteration Count
+        Key: Buffer The Derived Key Is Written Into (Its Length Is The Key Length)
+    """
+    if FASTPBKDF2_AVAILABLE:
+        Key[:] = _Fast_PBKDF2_HMAC('sha256', Password, Salt, Iterations, len(Key))
+        return
+    
+    KDF = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=len(Key),
+        salt=Salt,
+        iterations=Iterations
+    )
+    
+    # derive_into (cryptography 47+) Never Materialises The Key As Immutable bytes
+    if hasattr(KDF, 'derive_into'):
+        KDF.derive_into(Password, Key)
+    else:
+        Key[:] = KDF.derive(Password)
+
+
+# Minimum Length And Per-Character Shannon Entropy For The High-Entropy (HKDF) Path;
+# 3.5 Bits Admits Hex Tokens (At Most 4 Bits/Char) While Rejecting Dictionary Words
+_HIGH_ENTROPY_MIN_LENGTH = 32
+_HIGH_ENTROPY_MIN_BITS = 3.5
+
+
+def Assert_High_Entropy(Password: Union[str, bytes, bytearray]):
+    """
+    Check That A Secret Is Machine-Generated Enough To Skip Key Stretching
+    
+    Args:
+        Password: Candidate Secret (E.g. secrets.token_hex(32))
+        
+    Raises:
+        ValueError: If The Secret Is Too Short Or Too Repetitive
+    """
+    if len(Password) < _HIGH_ENTROPY_MIN_LENGTH:
+        raise ValueError(f"High-Entropy Secrets Must Be At Least {_HIGH_ENTROPY_MIN_LENGTH} Characters")
+    
+    Length = len(Password)
+    Entropy = sum(
+        Count / Length * math.log2(Length / Count)
+        for Count in Counter(Password).values()
+    )
+    if Entropy < _HIGH_ENTROPY_MIN_BITS:
+        raise ValueError(f"Secret Entropy {Entropy:.2f} Bits/Char Is Too Low To Skip PBKDF2")
+
+
+def _HKDF(Secret: bytes, Salt: bytes, Key: bytearray):
+    """
+    HKDF-SHA256 Key Derivation For High-Entropy Secrets (One HMAC Extract + Expand)
+    
+    Args:
+        Secret: High-Entropy Input Keying Material
+        Salt: Random Salt
+        Key: Buffer The Derived Key Is Written Into (Its Length Is The Key Length)
+    """
+    KDF = HKDF(
+        algorithm=hashes.SHA256(),
+        length=len(Key),
+        salt=Salt,
+        info=b'DST-AES-KEY'
+    )
+    
+    if hasattr(KDF, 'derive_into'):
+        KDF.derive_into(Secret, Key)
+    else:
+        Key[:] = KDF.derive(Secret)
+
+
+# Password-Derived Ciphers, Least Recently Used Evicted Past 64 Entries And Dropped 300s
+# After Derivation, So A Derived Key Lives No Longer Than Its Cached Cipher. Entries Are
+# Keyed On An HMAC Of (Salt, Iterations, Password) Under A Key Drawn Fresh Per Process -
+# Neither The Password Nor An Unkeyed Hash Of It Is Retained
+_PASSWORD_CIPHER_CACHE_SIZE = 64
+_PASSWORD_CIPHER_TTL = 300.0
+_PASSWORD_CACHE_KEY = secrets.token_bytes(32)
+_Password_Ciphers: 'OrderedDict[Tuple[bytes, bytes, int], Tuple[AESGCM, float]]' = OrderedDict()
+_Password_Ciphers_Lock = threading.Lock()
+
+
+# Password Salts: Legacy Salts Are 16 Random Bytes (Always 100k Iterations); Versioned
+# Salts Are b'\x01' + 4-Byte Big-Endian Iteration Count + 16 Random Bytes, Where A Count
+# Of 0 Marks A High-Entropy Secret Derived With HKDF Instead Of PBKDF2
+_LEGACY_PBKDF2_ITERATIONS = 100000
+_SALT_VERSION = 1
+_SALT_HEADER = struct.Struct('>BI')
+
+
+def _Split_Salt(Salt: bytes) -> Tuple[bytes, int]:
+    """
+    Separate A Stored Salt Into The PBKDF2 Salt And Its Iteration Count
+    
+    Args:
+        Salt: Salt As Returned By Encrypt_With_Password
+        
+    Returns:
+        Tuple Of (PBKDF2 Salt, Iterations)
+    """
+    if len(Salt) == _SALT_HEADER.size + 16 and Salt[0] == _SALT_VERSION:
+        _, Iterations = _SALT_HEADER.unpack_from(Salt)
+        return Salt[_SALT_HEADER.size:], Iterations
+    
+    return Salt, _LEGACY_PBKDF2_ITERATIONS
+
+
+def _Password_Cipher(
+    Password: Union[str, bytes, bytearray],
+    Salt: bytes,
+    Iterations: int = _LEGACY_PBKDF2_ITERATIONS
+) -> AESGCM:
+    """
+    Get The AES-GCM Cipher For A Password And Salt, Running PBKDF2 Only On A Cache Miss
+    
+    PBKDF2 Writes Into An mlock'd bytearray That Is Zeroed Before Returning.
+    AESGCM Is Handed An Immutable bytes Copy, Since Older cryptography Releases
+    Keep A Reference To The Key Rather Than Copying It; The Wipe Covers Only The
+    Derivation Buffer, And The Copy Lives As Long As The Cached Cipher.
+    
+    Args:
+        Password: Password For Key Derivation (bytes-Like Passwords Are Used Without Copying)
+        Salt: PBKDF2 Salt
+        Iterations: PBKDF2 Iteration Count (0 Selects HKDF)
+        
+    Returns:
+        AESGCM Instance Keyed With The Derived 32-Byte Key
+    """
+    Password_Bytes = Password.encode() if isinstance(Password, str) else Password
+    Tag = hmac.new(_PASSWORD_CACHE_KEY, _SALT_HEADER.pack(_SALT_VERSION, Iterations) + bytes(Salt), hashlib.sha256)
+    Tag.update(Password_Bytes)
+    Cache_Key = (Tag.digest(), bytes(Salt), Iterations)
+    
+    Now = time.monotonic()
+    with _Password_Ciphers_Lock:
+        Entry = _Password_Ciphers.get(Cache_Key)
+        if Entry is not None:
+            if Entry[1] > Now:
+                _Password_Ciphers.move_to_end(Cache_Key)
+                return Entry[0]
+            del _Password_Ciphers[Cache_Key]
+    
+    # Derive Outside The Lock So Other Passwords Are Not Blocked Behind 100k Iterations
+    Key = bytearray(32)
+    Locked = _Lock_Buffer(Key)
+    try:
+        if Iterations == 0:
+            _HKDF(Password_Bytes, Salt, Key)
+        else:
+            _PBKDF2(Password_Bytes, Salt, Iterations, Key)
+        Cipher = AESGCM(bytes(Key))
+    finally:
+        _Wipe_Buffer(Key, Locked)
+    
+    with _Password_Ciphers_Lock:
+        _Password_Ciphers[Cache_Key] = (Cipher, Now + _PASSWORD_CIPHER_TTL)
+        _Password_Ciphers.move_to_end(Cache_Key)
+        for Expired in [K for K, (_, Expires) in _Password_Ciphers.items() if Expires <= Now]:
+            del _Password_Ciphers[Expired]
+        while len(_Password_Ciphers) > _PASSWORD_CIPHER_CACHE_SIZE:
+            _Password_Ciphers.popitem(last=False)
+    
+    return Cipher
+
+
+# One-Byte AEAD Algorithm Tags (See AEAD_Cipher)
+_AEAD_AES_GCM = b'A'
+_AEAD_CHACHA20_POLY1305 = b'C'
+
+
+# AEAD Contexts Keyed On (SHA-256(Key), Algorithm Tag) - Raw Keys Are Never Cache Keys
+_AEAD_CACHE_SIZE = 1024
+_AEAD_Contexts: 'OrderedDict[Tuple[bytes, bytes], Union[AESGCM, ChaCha20Poly1305]]' = OrderedDict()
+_AEAD_Contexts_Lock = threading.Lock()
+
+
+def _Get_AEAD(Key: bytes, Algorithm: bytes = _AEAD_AES_GCM):
+    """
+    Get The AEAD Context For A Key, Building It Only On A Cache Miss
+    
+    Each Construction Allocates An OpenSSL Cipher Context And Runs The Key
+    Schedule, Which Dominates Small Decrypts Under A Repeated Key.
+    
+    Args:
+        Key: 32-Byte Key
+        Algorithm: AEAD Algorithm Tag
+        
+    Returns:
+        AESGCM Or ChaCha20Poly1305 Instance
+    """
+    Cache_Key = (Fast_SHA256(Key).digest(), Algorithm)
+    
+    with _AEAD_Contexts_Lock:
+        Cipher = _AEAD_Contexts.get(Cache_Key)
+        if Cipher is not None:
+            _AEAD_Contexts.move_to_end(Cache_Key)
+            return Cipher
+    
+    if Algorithm == _AEAD_AES_GCM:
+        Cipher = AESGCM(Key)
+    elif Algorithm == _AEAD_CHACHA20_POLY1305:
+        Cipher = ChaCha20Poly1305(Key)
+    else:
+        raise ValueError(f"Unknown AEAD Algorithm Tag: {Algorithm!r}")
+    
+    with _AEAD_Contexts_Lock:
+        _AEAD_Contexts[Cache_Key] = Cipher
+        while len(_AEAD_Contexts) > _AEAD_CACHE_SIZE:
+            _AEAD_Contexts.popitem(last=False)
+    
+    return Cipher
+
+
+_AES_Hardware_Checked = False
+
+
+def _Check_AES_Hardware():
+    """
+    Verify AES-GCM Runs On Hardware (Once Per Process)
+    
+    Without AES-NI + CLMUL (Or ARMv8 AES + PMULL) OpenSSL Falls Back To A
+    Table-Based Implementation Roughly 20x Slower. This Is Logged As A Warning,
+    Or Refused Outright When Crypto_Config.Require_AES_Hardware Is Set.
+    """
+    global _AES_Hardware_Checked
+    if _AES_Hardware_Checked:
+        return
+    
+    if not AES_Extensions_Available:
+        if Crypto_Config.Require_AES_Hardware:
+            raise RuntimeError("AES-GCM Hardware Acceleration (AES + CLMUL) Not Available On This CPU")
+        logger.warning("CPU Lacks AES-NI/CLMUL - AES-GCM Will Run In Software And Be Much Slower")
+    
+    _AES_Hardware_Checked = True
 
 
 class AES_Cipher:
@@ -40,8 +346,11 @@ class AES_Cipher:
                 raise ValueError("AES Key Must Be Exactly 32 Bytes")
             else:
                 self.Key = Key
-                
-            self.Cipher = AESGCM(self.Key)
+            
+            _Check_AES_Hardware()
+            
+            # Caller-Supplied Keys Are Often Reused; Fresh Random Keys Never Are
+            self.Cipher = _Get_AEAD(bytes(Key)) if Key is not None else AESGCM(self.Key)
             logger.info("AES-256-GCM Cipher Initialized Successfully")
             
         except Exception as E:
@@ -74,34 +383,36 @@ class AES_Cipher:
             raise
 
     @staticmethod
-    def Encrypt_With_Password(Plaintext: bytes, Password: str, Associated_Data: Optional[bytes] = None) -> Tuple[bytes, bytes, bytes]:
+    def Encrypt_With_Password(
+        Plaintext: bytes,
+        Password: Union[str, bytes, bytearray],
+        Associated_Data: Optional[bytes] = None,
+        High_Entropy: bool = False
+    ) -> Tuple[bytes, bytes, bytes]:
         """
         Encrypt Data Using Password-Based AES-256-GCM
         
         Args:
             Plaintext: Data To Encrypt
-            Password: Password for key derivation
+            Password: Password for key derivation (Prefer A bytearray The Caller Zeroes Afterwards)
             Associated_Data: Additional Authenticated Data (Optional)
+            High_Entropy: Password Is A Machine-Generated Secret - Derive With HKDF
+                Instead Of PBKDF2 (Checked With Assert_High_Entropy)
             
         Returns:
-            Tuple Of (Salt, Nonce, Ciphertext)
+            Tuple Of (Salt, Nonce, Ciphertext) - Salt Embeds The PBKDF2 Iteration Count
         """
         try:
-            # Generate Random Salt
-            Salt = secrets.token_bytes(16)
-            
-            # Derive Key From Password Using PBKDF2
-            KDF = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=Salt,
-                iterations=100000,
-                backend=default_backend()
-            )
-            Key = KDF.derive(Password.encode())
+            if High_Entropy:
+                Assert_High_Entropy(Password)
             
-            # Create Cipher With Derived Key
-            Cipher = AESGCM(Key)
+            # Generate Random Salt, Prefixed With The Iteration Count So It Can Be Raised Later
+            Iterations = 0 if High_Entropy else Crypto_Config.PBKDF2_Iterations
+            KDF_Salt = secrets.token_bytes(16)
+            Salt = _SALT_HEADER.pack(_SALT_VERSION, Iterations) + KDF_Salt
+            
+            # Derive Key From Password Using PBKDF2 (Cached Per Password And Salt)
+            Cipher = _Password_Cipher(Password, KDF_Salt, Iterations)
             
             # Generate Random 96-bit Nonce
             Nonce = secrets.token_bytes(12)
@@ -117,33 +428,31 @@ class AES_Cipher:
             raise
 
     @staticmethod
-    def Decrypt_With_Password(Salt: bytes, Nonce: bytes, Ciphertext: bytes, Password: str, Associated_Data: Optional[bytes] = None) -> bytes:
+    def Decrypt_With_Password(
+        Salt: bytes,
+        Nonce: bytes,
+        Ciphertext: bytes,
+        Password: Union[str, bytes, bytearray],
+        Associated_Data: Optional[bytes] = None
+    ) -> bytes:
         """
         Decrypt Data Using Password-Based AES-256-GCM
         
         Args:
-            Salt: PBKDF2 Salt Used During Encryption
+            Salt: Salt Returned By Encrypt_With_Password (Records PBKDF2 vs HKDF;
+                Legacy 16-Byte Salts Use 100k Iterations)
             Nonce: AES-GCM Nonce Used During Encryption
             Ciphertext: Encrypted Data
-            Password: Password for key derivation
+            Password: Password for key derivation (Prefer A bytearray The Caller Zeroes Afterwards)
             Associated_Data: Additional Authenticated Data (Optional)
             
         Returns:
             Decrypted Plaintext
         """
         try:
-            # Derive Key From Password Using PBKDF2
-            KDF = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=Salt,
-                iterations=100000,
-                backend=default_backend()
-            )
-            Key = KDF.derive(Password.encode())
-            
-            # Create Cipher With Derived Key
-            Cipher = AESGCM(Key)
+            # Derive Key From Password Using PBKDF2 (Cached Per Password And Salt)
+            KDF_Salt, Iterations = _Split_Salt(Salt)
+            Cipher = _Password_Cipher(Password, KDF_Salt, Iterations)
             
             # Decrypt Data
             Plaintext = Cipher.decrypt(Nonce, Ciphertext, Associated_Data)
@@ -179,6 +488,129 @@ class AES_Cipher:
             raise ValueError("Decryption Failed - Data May Be Corrupted Or Tampered")
 
 
+class AEAD_Cipher:
+    """
+    Bulk AEAD Handler - AES-256-GCM On Hardware, ChaCha20-Poly1305 Otherwise
+    
+    Both Take A 32-Byte Key And 96-Bit Nonce, So Callers Only Need To Carry The
+    One-Byte Algorithm Tag To Decrypt.
+    """
+    
+    AES_GCM = _AEAD_AES_GCM
+    CHACHA20_POLY1305 = _AEAD_CHACHA20_POLY1305
+    
+    def __init__(self, Key: Optional[bytes] = None, Algorithm: Optional[bytes] = None):
+        """
+        Initialize AEAD Cipher
+        
+        Args:
+            Key: 32-Byte Encryption Key (Generated If None)
+            Algorithm: AES_GCM Or CHACHA20_POLY1305 (Picked From CPU Support If None)
+        """
+        try:
+            if Key is None:
+                self.Key = secrets.token_bytes(32)
+            elif len(Key) != 32:
+                raise ValueError("AEAD Key Must Be Exactly 32 Bytes")
+            else:
+                self.Key = Key
+            
+            if Algorithm is None:
+                Algorithm = self.AES_GCM if AES_Extensions_Available else self.CHACHA20_POLY1305
+            
+            if Key is not None:
+                self.Cipher = _Get_AEAD(bytes(Key), Algorithm)
+            elif Algorithm == self.AES_GCM:
+                self.Cipher = AESGCM(self.Key)
+            elif Algorithm == self.CHACHA20_POLY1305:
+                self.Cipher = ChaCha20Poly1305(self.Key)
+            else:
+                raise ValueError(f"Unknown AEAD Algorithm Tag: {Algorithm!r}")
+            
+            self.Algorithm = Algorithm
+            
+        except Exception as E:
+            logger.error(f"Failed To Initialize AEAD Cipher: {E}")
+            raise
+    
+    def Encrypt(self, Plaintext: bytes, Associated_Data: Optional[bytes] = None) -> Tuple[bytes, bytes]:
+        """
+        Encrypt Data
+        
+        Args:
+            Plaintext: Data To Encrypt
+            Associated_Data: Additional Authenticated Data (Optional)
+            
+        Returns:
+            Tuple Of (Nonce, Ciphertext)
+        """
+        Nonce = secrets.token_bytes(12)
+        return Nonce, self.Cipher.encrypt(Nonce, Plaintext, Associated_Data)
+    
+    def Decrypt(self, Nonce: bytes, Ciphertext: bytes, Associated_Data: Optional[bytes] = None) -> bytes:
+        """
+        Decrypt And Verify Data
+        
+        Args:
+            Nonce: 96-bit Nonce Used During Encryption
+            Ciphertext: Encrypted Data
+            Associated_Data: Additional Authenticated Data (Optional)
+            
+        Returns:
+            Decrypted Plaintext
+        """
+        try:
+            return self.Cipher.decrypt(Nonce, Ciphertext, Associated_Data)
+        except Exception as E:
+            logger.error(f"AEAD Decryption Failed: {E}")
+            raise ValueError("Decryption Failed - Data May Be Corrupted Or Tampered")
+
+
+# Pre-Generated RSA Private Keys, Filled By Background Threads (OpenSSL Releases The GIL)
+_RSA_Key_Pool: 'queue.Queue[rsa.RSAPrivateKey]' = queue.Queue()
+_RSA_Key_Pool_Lock = threading.Lock()
+_RSA_Key_Pool_Pending = 0
+
+
+def _Generate_RSA_Private_Key() -> rsa.RSAPrivateKey:
+    """Generate One RSA Private Key Of The Configured Size"""
+    return rsa.generate_private_key(
+        public_exponent=65537,
+        key_size=Crypto_Config.RSA_Key_Size
+    )
+
+
+def _RSA_Key_Pool_Worker():
+    """Generate One Key Into The Pool"""
+    global _RSA_Key_Pool_Pending
+    try:
+        _RSA_Key_Pool.put(_Generate_RSA_Private_Key())
+    except Exception as E:
+        logger.warning(f"Background RSA Key Generation Failed: {E}")
+    finally:
+        with _RSA_Key_Pool_Lock:
+            _RSA_Key_Pool_Pending -= 1
+
+
+def Start_RSA_Key_Pool():
+    """
+    Start Background Generation Until The Pool Holds Crypto_Config.RSA_Key_Pool_Size Keys
+    
+    Never Runs At Import - Processes That Only Hash Or Fork Workers Should Not
+    Carry OpenSSL Keygen Threads; Call It Where RSA Keys Will Be Needed.
+    """
+    global _RSA_Key_Pool_Pending
+    with _RSA_Key_Pool_Lock:
+        Missing = Crypto_Config.RSA_Key_Pool_Size - _RSA_Key_Pool.qsize() - _RSA_Key_Pool_Pending
+        if Missing <= 0:
+            return
+        _RSA_Key_Pool_Pending += Missing
+    
+    # Daemon Threads So A Half-Finished Key Never Delays Interpreter Exit
+    for _ in range(Missing):
+        threading.Thread(target=_RSA_Key_Pool_Worker, name='RSA-Key-Pool', daemon=True).start()
+
+
 class RSA_Handler:
     """RSA-4096 Asymmetric Cryptography Handler"""
     
@@ -219,12 +651,12 @@ class RSA_Handler:
         try:
             logger.info("Generating RSA-4096 Key Pair...")
             
-            # Generate Private Key
-            self.Private_Key = rsa.generate_private_key(
-                public_exponent=65537,
-                key_size=Crypto_Config.RSA_Key_Size,
-                backend=default_backend()
-            )
+            # Take A Pre-Generated Key If One Is Ready, Then Top The Pool Back Up
+            try:
+                self.Private_Key = _RSA_Key_Pool.get_nowait()
+            except queue.Empty:
+                self.Private_Key = _Generate_RSA_Private_Key()
+            Start_RSA_Key_Pool()
             
             # Extract Public Key
             self.Public_Key = self.Private_Key.public_key()
@@ -295,8 +727,7 @@ class RSA_Handler:
             
             self.Private_Key = serialization.load_pem_private_key(
                 PEM,
-                password=Password,
-                backend=default_backend()
+                password=Password
             )
             
             self.Public_Key = self.Private_Key.public_key()
@@ -312,8 +743,7 @@ class RSA_Handler:
             PEM = File_Path.read_bytes()
             
             self.Public_Key = serialization.load_pem_public_key(
-                PEM,
-                backend=default_backend()
+                PEM
             )
             
             logger.info(f"Public Key Loaded From {File_Path}")
@@ -329,6 +759,23 @@ class RSA_Handler:
         Args:
             Data: Data To Sign
             
+        Returns:
+            Digital Signature
+        """
+        Signature = self.Sign_Digest(Fast_SHA256(Data).digest())
+        logger.debug(f"Signed {len(Data)} Bytes")
+        return Signature
+    
+    def Sign_Digest(self, Digest: bytes) -> bytes:
+        """
+        Sign A Precomputed SHA-256 Digest Using Private Key
+        
+        Produces The Same Kind Of Signature As Sign(Data) When Digest Is
+        SHA-256(Data), So Verify(Data, Signature) Accepts It.
+        
+        Args:
+            Digest: 32-Byte SHA-256 Digest Of The Data
+            
         Returns:
             Digital Signature
         """
@@ -337,15 +784,15 @@ class RSA_Handler:
                 raise ValueError("Private Key Required For Signing")
             
             Signature = self.Private_Key.sign(
-                Data,
+                Digest,
                 padding.PSS(
                     mgf=padding.MGF1(hashes.SHA256()),
                     salt_length=padding.PSS.MAX_LENGTH
                 ),
-                hashes.SHA256()
+                utils.Prehashed(hashes.SHA256())
             )
             
-            logger.debug(f"Signed {len(Data)} Bytes")
+            logger.debug("Signed Precomputed Digest")
             return Signature
             
         except Exception as E:
@@ -360,6 +807,19 @@ class RSA_Handler:
             Data: Original Data
             Signature: Digital Signature To Verify
             
+        Returns:
+            True If Valid, False Otherwise
+        """
+        return self.Verify_Digest(Fast_SHA256(Data).digest(), Signature)
+    
+    def Verify_Digest(self, Digest: bytes, Signature: bytes) -> bool:
+        """
+        Verify A Digital Signature Against A Precomputed SHA-256 Digest
+        
+        Args:
+            Digest: 32-Byte SHA-256 Digest Of The Original Data
+            Signature: Digital Signature To Verify
+            
         Returns:
             True If Valid, False Otherwise
         """
@@ -369,12 +829,12 @@ class RSA_Handler:
             
             self.Public_Key.verify(
                 Signature,
-                Data,
+                Digest,
                 padding.PSS(
                     mgf=padding.MGF1(hashes.SHA256()),
                     salt_length=padding.PSS.MAX_LENGTH
                 ),
-                hashes.SHA256()
+                utils.Prehashed(hashes.SHA256())
             )
             
             logger.debug("Signature Verified Successfully")
@@ -384,6 +844,32 @@ class RSA_Handler:
             logger.warning(f"Signature Verification Failed: {E}")
             return False
     
+    def Verify_Batch(self, Items: List[Tuple[bytes, bytes]], Prehashed: bool = False) -> List[bool]:
+        """
+        Verify Many Signatures Concurrently
+        
+        Each Item Is Reduced To A 32-Byte Digest First; OpenSSL Releases The GIL
+        During The RSA Public-Key Operation, So Verifications Run In Parallel.
+        
+        Args:
+            Items: (Data, Signature) Pairs, Or (SHA-256 Digest, Signature) If Prehashed
+            Prehashed: Items Already Carry Digests Instead Of Data
+            
+        Returns:
+            One Verification Result Per Item, In Input Order
+        """
+        if Prehashed:
+            Digests = list(Items)
+        else:
+            Digests = [(Fast_SHA256(Data).digest(), Signature) for Data, Signature in Items]
+        
+        Workers = min(os.cpu_count() or 1, len(Digests))
+        if Workers <= 1:
+            return [self.Verify_Digest(Digest, Signature) for Digest, Signature in Digests]
+        
+        with ThreadPoolExecutor(max_workers=Workers) as Pool:
+            return list(Pool.map(lambda Item: self.Verify_Digest(*Item), Digests))
+    
     def Encrypt(self, Plaintext: bytes) -> bytes:
         """
         Encrypt Data Using Public Key (For Small Data Only)
@@ -445,6 +931,31 @@ class RSA_Handler:
             raise
 
 
+# Fixed Subject Attributes Shared By Every Self-Signed Certificate
+_BASE_NAME_ATTRS = (
+    x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+    x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "California"),
+    x509.NameAttribute(NameOID.LOCALITY_NAME, "San Francisco"),
+    x509.NameAttribute(NameOID.ORGANIZATION_NAME, "DST Torrent Network"),
+)
+
+
+# Certificate Signature Results Keyed On (Certificate SHA-256 Fingerprint, Issuer Key DER)
+_VERIFIED_CERTIFICATE_CACHE_SIZE = 4096
+_Verified_Certificates: 'OrderedDict[Tuple[bytes, bytes], bool]' = OrderedDict()
+_Verified_Certificates_Lock = threading.Lock()
+
+
+def _Certificate_Validity(Cert: x509.Certificate) -> Tuple[datetime, datetime]:
+    """Timezone-Aware (Not Before, Not After) - The _utc Properties Need cryptography 42+"""
+    if hasattr(Cert, 'not_valid_before_utc'):
+        return Cert.not_valid_before_utc, Cert.not_valid_after_utc
+    return (
+        Cert.not_valid_before.replace(tzinfo=timezone.utc),
+        Cert.not_valid_after.replace(tzinfo=timezone.utc)
+    )
+
+
 class Certificate_Manager:
     """X.509 Certificate Management For Peer Authentication"""
     
@@ -472,13 +983,13 @@ class Certificate_Manager:
             
             # Subject And Issuer (Same For Self-Signed)
             Subject = Issuer = x509.Name([
-                x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
-                x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "California"),
-                x509.NameAttribute(NameOID.LOCALITY_NAME, "San Francisco"),
-                x509.NameAttribute(NameOID.ORGANIZATION_NAME, "DST Torrent Network"),
+                *_BASE_NAME_ATTRS,
                 x509.NameAttribute(NameOID.COMMON_NAME, Common_Name),
             ])
             
+            # One Clock Read So The Validity Window Is Exactly Validity_Days
+            Now = datetime.now(timezone.utc)
+            
             # Build Certificate
             Cert = (
                 x509.CertificateBuilder()
@@ -486,13 +997,13 @@ class Certificate_Manager:
                 .issuer_name(Issuer)
                 .public_key(Private_Key.public_key())
                 .serial_number(x509.random_serial_number())
-                .not_valid_before(datetime.utcnow())
-                .not_valid_after(datetime.utcnow() + timedelta(days=Validity_Days))
+                .not_valid_before(Now)
+                .not_valid_after(Now + timedelta(days=Validity_Days))
                 .add_extension(
                     x509.SubjectAlternativeName([x509.DNSName(Common_Name)]),
                     critical=False,
                 )
-                .sign(Private_Key, hashes.SHA256(), default_backend())
+                .sign(Private_Key, hashes.SHA256())
             )
             
             # Save Certificate If Path Provided
@@ -513,7 +1024,7 @@ class Certificate_Manager:
         """Load Certificate From File"""
         try:
             Cert_PEM = File_Path.read_bytes()
-            Cert = x509.load_pem_x509_certificate(Cert_PEM, default_backend())
+            Cert = x509.load_pem_x509_certificate(Cert_PEM)
             logger.info(f"Certificate Loaded From {File_Path}")
             return Cert
             
@@ -534,17 +1045,42 @@ class Certificate_Manager:
             True If Valid
         """
         try:
-            Public_Key.verify(
-                Cert.signature,
-                Cert.tbs_certificate_bytes,
-                padding.PKCS1v15(),
-                Cert.signature_hash_algorithm,
+            # Check Expiration First - Stale Peers Then Skip The RSA Operation Entirely
+            Now = datetime.now(timezone.utc)
+            Not_Before, Not_After = _Certificate_Validity(Cert)
+            if Now < Not_Before or Now > Not_After:
+                logger.warning("Certificate Has Expired Or Not Yet Valid")
+                return False
+            
+            # Signature Results Are Fixed Per (Certificate, Issuer Key), So Reuse Them
+            Cache_Key = (
+                Cert.fingerprint(hashes.SHA256()),
+                Public_Key.public_bytes(serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)
             )
+            with _Verified_Certificates_Lock:
+                Cached = _Verified_Certificates.get(Cache_Key)
+                if Cached is not None:
+                    _Verified_Certificates.move_to_end(Cache_Key)
+            
+            if Cached is None:
+                try:
+                    Public_Key.verify(
+                        Cert.signature,
+                        Cert.tbs_certificate_bytes,
+                        padding.PKCS1v15(),
+                        Cert.signature_hash_algorithm,
+                    )
+                    Cached = True
+                except InvalidSignature:
+                    Cached = False
+                
+                with _Verified_Certificates_Lock:
+                    _Verified_Certificates[Cache_Key] = Cached
+                    while len(_Verified_Certificates) > _VERIFIED_CERTIFICATE_CACHE_SIZE:
+                        _Verified_Certificates.popitem(last=False)
             
-            # Check Expiration
-            Now = datetime.utcnow()
-            if Now < Cert.not_valid_before or Now > Cert.not_valid_after:
-                logger.warning("Certificate Has Expired Or Not Yet Valid")
+            if not Cached:
+                logger.error("Certificate Verification Failed: Invalid Signature")
                 return False
             
             logger.info("Certificate Verified Successfully")
@@ -555,8 +1091,76 @@ class Certificate_Manager:
             return False
 
 
+# Streamed Hybrid Format: [Magic][Version][AEAD Tag][u16 Key Length][RSA-Wrapped Key]
+# Followed By Frames Of [u32 Ciphertext Length][12-Byte Nonce][Ciphertext || Tag]
+_STREAM_MAGIC = b'DSTS'
+_STREAM_VERSION = 1
+_STREAM_HEADER = struct.Struct('>4sBcH')
+_FRAME_HEADER = struct.Struct('>I12s')
+_FRAME_COUNTER = struct.Struct('>I')
+_STREAM_CHUNK_SIZE = 1 << 20
+
+# Per-Frame AAD Prefix - Marks The Last Frame So Truncation Fails Authentication
+_FRAME_MORE = b'\x00'
+_FRAME_FINAL = b'\x01'
+
+
+def _Iter_Stream_Chunks(In_File: BinaryIO, Chunk_Size: int) -> Iterator[Tuple[bytes, bool]]:
+    """
+    Yield (Chunk, Is_Final) Slices Of A File From Its Current Position
+    
+    Regular Files Are Memory-Mapped And Sliced Without Copying; Pipes, Sockets
+    And Empty Files Fall Back To read(). At Least One (Possibly Empty) Chunk Is
+    Always Yielded So Every Stream Ends In A Final Frame.
+    
+    Args:
+        In_File: Binary File Object
+        Chunk_Size: Maximum Bytes Per Chunk
+    """
+    try:
+        Start = In_File.tell()
+        Mapped = mmap.mmap(In_File.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        Mapped = None
+    
+    if Mapped is None:
+        Chunk = In_File.read(Chunk_Size)
+        while True:
+            Next = In_File.read(Chunk_Size)
+            yield Chunk, not Next
+            if not Next:
+                return
+            Chunk = Next
+    
+    with Mapped:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            Mapped.madvise(mmap.MADV_SEQUENTIAL)
+        
+        Size = len(Mapped)
+        if Start >= Size:
+            yield b'', True
+            return
+        
+        with memoryview(Mapped) as View:
+            for Offset in range(Start, Size, Chunk_Size):
+                End = min(Offset + Chunk_Size, Size)
+                # Released On Resume So The Map Can Close Once Iteration Ends
+                with View[Offset:End] as Chunk:
+                    yield Chunk, End == Size
+        
+        In_File.seek(Size)
+
+
+def _Read_Exact(In_File: BinaryIO, Length: int) -> bytes:
+    """Read Exactly Length Bytes Or Raise ValueError On A Truncated Stream"""
+    Data = In_File.read(Length)
+    if len(Data) != Length:
+        raise ValueError("Encrypted Stream Is Truncated")
+    return Data
+
+
 class Hybrid_Encryption:
-    """Hybrid Encryption Using RSA + AES For Large Data"""
+    """Hybrid Encryption Using RSA + AEAD (AES-GCM Or ChaCha20-Poly1305) For Large Data"""
     
     def __init__(self, RSA_Handler_Instance: RSA_Handler):
         """
@@ -566,6 +1170,7 @@ class Hybrid_Encryption:
             RSA_Handler_Instance: RSA Handler For Key Exchange
         """
         self.RSA = RSA_Handler_Instance
+        
         logger.info("Hybrid Encryption Initialized")
     
     def Encrypt(self, Plaintext: bytes, Associated_Data: Optional[bytes] = None) -> dict:
@@ -577,27 +1182,33 @@ class Hybrid_Encryption:
             Associated_Data: Additional Authenticated Data
             
         Returns:
-            Dictionary With Encrypted Session Key, Nonce, And Ciphertext
+            Dictionary With Encrypted Session Key, Nonce, And Ciphertext, Plus
+            An 'AEAD' Algorithm Tag When ChaCha20-Poly1305 Was Used
         """
         try:
-            # Generate Random AES Session Key
-            Session_Key = secrets.token_bytes(32)
+            # Random Session Key With AES-GCM, Or ChaCha20-Poly1305 Without AES-NI
+            Cipher = AEAD_Cipher()
             
             # Encrypt Session Key With RSA
-            Encrypted_Session_Key = self.RSA.Encrypt(Session_Key)
+            Encrypted_Session_Key = self.RSA.Encrypt(Cipher.Key)
             
-            # Encrypt Data With AES
-            AES = AES_Cipher(Session_Key)
-            Nonce, Ciphertext = AES.Encrypt(Plaintext, Associated_Data)
+            # Encrypt Data
+            Nonce, Ciphertext = Cipher.Encrypt(Plaintext, Associated_Data)
             
             logger.info(f"Hybrid Encrypted {len(Plaintext)} Bytes")
             
-            return {
+            Encrypted_Package = {
                 'Encrypted_Session_Key': Encrypted_Session_Key,
                 'Nonce': Nonce,
                 'Ciphertext': Ciphertext
             }
             
+            # AES-GCM Packages Stay In The Original Tag-Less Format
+            if Cipher.Algorithm != AEAD_Cipher.AES_GCM:
+                Encrypted_Package['AEAD'] = Cipher.Algorithm
+            
+            return Encrypted_Package
+            
         except Exception as E:
             logger.error(f"Hybrid Encryption Failed: {E}")
             raise
@@ -617,9 +1228,9 @@ class Hybrid_Encryption:
             # Decrypt Session Key With RSA
             Session_Key = self.RSA.Decrypt(Encrypted_Package['Encrypted_Session_Key'])
             
-            # Decrypt Data With AES
-            AES = AES_Cipher(Session_Key)
-            Plaintext = AES.Decrypt(
+            # Decrypt Data With The Tagged AEAD (Untagged Packages Are AES-GCM)
+            Cipher = AEAD_Cipher(Session_Key, Encrypted_Package.get('AEAD', AEAD_Cipher.AES_GCM))
+            Plaintext = Cipher.Decrypt(
                 Encrypted_Package['Nonce'],
                 Encrypted_Package['Ciphertext'],
                 Associated_Data
@@ -631,6 +1242,125 @@ class Hybrid_Encryption:
         except Exception as E:
             logger.error(f"Hybrid Decryption Failed: {E}")
             raise
+    
+    def Encrypt_Stream(
+        self,
+        In_File: BinaryIO,
+        Out_File: BinaryIO,
+        Associated_Data: Optional[bytes] = None,
+        Chunk_Size: int = _STREAM_CHUNK_SIZE
+    ) -> int:
+        """
+        Encrypt A File Into Independently Authenticated Frames
+        
+        Peak Memory Is One Chunk Rather Than The Whole Input. Frame Nonces Are
+        An 8-Byte Random Prefix Plus A 4-Byte Frame Counter, So Frames Cannot Be
+        Reordered, And The Final Frame Is Bound Into The AAD So Truncation Is
+        Detected.
+        
+        Args:
+            In_File: Binary File Object To Read Plaintext From
+            Out_File: Binary File Object To Write The Stream To
+            Associated_Data: Additional Authenticated Data (Applied To Every Frame)
+            Chunk_Size: Plaintext Bytes Per Frame
+            
+        Returns:
+            Number Of Plaintext Bytes Encrypted
+        """
+        try:
+            # Generate Random Session Key And Wrap It With RSA
+            Cipher = AEAD_Cipher()
+            Encrypted_Session_Key = self.RSA.Encrypt(Cipher.Key)
+            
+            Out_File.write(_STREAM_HEADER.pack(
+                _STREAM_MAGIC, _STREAM_VERSION, Cipher.Algorithm, len(Encrypted_Session_Key)
+            ))
+            Out_File.write(Encrypted_Session_Key)
+            
+            Nonce_Prefix = secrets.token_bytes(8)
+            AAD = Associated_Data or b''
+            Total = 0
+            
+            for Index, (Chunk, Is_Final) in enumerate(_Iter_Stream_Chunks(In_File, Chunk_Size)):
+                Nonce = Nonce_Prefix + _FRAME_COUNTER.pack(Index)
+                Ciphertext = Cipher.Cipher.encrypt(
+                    Nonce, Chunk, (_FRAME_FINAL if Is_Final else _FRAME_MORE) + AAD
+                )
+                Out_File.write(_FRAME_HEADER.pack(len(Ciphertext), Nonce))
+                Out_File.write(Ciphertext)
+                Total += len(Chunk)
+            
+            logger.info(f"Hybrid Stream Encrypted {Total} Bytes")
+            return Total
+            
+        except Exception as E:
+            logger.error(f"Hybrid Stream Encryption Failed: {E}")
+            raise
+    
+    def Decrypt_Stream(
+        self,
+        In_File: BinaryIO,
+        Out_File: BinaryIO,
+        Associated_Data: Optional[bytes] = None
+    ) -> int:
+        """
+        Decrypt A Stream Written By Encrypt_Stream
+        
+        Args:
+            In_File: Binary File Object To Read The Stream From
+            Out_File: Binary File Object To Write Plaintext To
+            Associated_Data: Additional Authenticated Data Used During Encryption
+            
+        Returns:
+            Number Of Plaintext Bytes Decrypted
+        """
+        try:
+            Magic, Version, Algorithm, Key_Length = _STREAM_HEADER.unpack(
+                _Read_Exact(In_File, _STREAM_HEADER.size)
+            )
+            if Magic != _STREAM_MAGIC or Version != _STREAM_VERSION:
+                raise ValueError("Not A DST Encrypted Stream")
+            
+            Session_Key = self.RSA.Decrypt(_Read_Exact(In_File, Key_Length))
+            Cipher = AEAD_Cipher(Session_Key, Algorithm)
+            
+            AAD = Associated_Data or b''
+            Nonce_Prefix = None
+            Index = 0
+            Total = 0
+            
+            Frame_Header = In_File.read(_FRAME_HEADER.size)
+            while Frame_Header:
+                if len(Frame_Header) != _FRAME_HEADER.size:
+                    raise ValueError("Encrypted Stream Is Truncated")
+                
+                Length, Nonce = _FRAME_HEADER.unpack(Frame_Header)
+                if Nonce_Prefix is None:
+                    Nonce_Prefix = Nonce[:8]
+                if Nonce != Nonce_Prefix + _FRAME_COUNTER.pack(Index):
+                    raise ValueError("Encrypted Stream Frames Are Out Of Order")
+                
+                Ciphertext = _Read_Exact(In_File, Length)
+                
+                # Whether Another Frame Follows Decides Which AAD Must Verify
+                Frame_Header = In_File.read(_FRAME_HEADER.size)
+                Plaintext = Cipher.Decrypt(
+                    Nonce, Ciphertext, (_FRAME_MORE if Frame_Header else _FRAME_FINAL) + AAD
+                )
+                Out_File.write(Plaintext)
+                
+                Total += len(Plaintext)
+                Index += 1
+            
+            if Index == 0:
+                raise ValueError("Encrypted Stream Has No Frames")
+            
+            logger.info(f"Hybrid Stream Decrypted {Total} Bytes")
+            return Total
+            
+        except Exception as E:
+            logger.error(f"Hybrid Stream Decryption Failed: {E}")
+            raise
 
 
 class Hash_Functions:
@@ -647,29 +1377,85 @@ class Hash_Functions:
         Returns:
             Hex Encoded Hash
         """
-        return hashlib.sha256(Data).hexdigest()
+        return Fast_SHA256(Data).hexdigest()
     
     @staticmethod
-    def SHA256_File(File_Path: Path, Chunk_Size: int = 8192) -> str:
+    def SHA256_Many(Datas: Iterable[bytes]) -> List[str]:
+        """
+        Calculate SHA-256 Hashes Of Many Small Buffers
+        
+        Args:
+            Datas: Buffers To Hash
+            
+        Returns:
+            Hex Encoded Hashes, In Input Order
+        """
+        Hasher = Fast_SHA256
+        return [Hasher(Data).hexdigest() for Data in Datas]
+    
+    @staticmethod
+    def SHA256_Prefix(Prefix: bytes) -> Callable[[bytes], str]:
+        """
+        Build A Hasher For Messages Sharing A Common Prefix
+        
+        The Prefix Is Absorbed Once; Each Call Clones That State With copy()
+        And Only Hashes The Suffix.
+        
+        Args:
+            Prefix: Bytes Every Message Starts With
+            
+        Returns:
+            Function Mapping A Suffix To The Hex Hash Of Prefix + Suffix
+        """
+        Base = Fast_SHA256(Prefix)
+        
+        def Hash_Suffix(Suffix: bytes) -> str:
+            Hash_Obj = Base.copy()
+            Hash_Obj.update(Suffix)
+            return Hash_Obj.hexdigest()
+        
+        return Hash_Suffix
+    
+    @staticmethod
+    def SHA256_File(File_Path: Path, Chunk_Size: int = 1 << 20) -> str:
         """
         Calculate SHA-256 Hash Of File
         
         Args:
             File_Path: Path To File
-            Chunk_Size: Read Buffer Size
+            Chunk_Size: Read Buffer Size (Only Used Before Python 3.11, For Files mmap Refuses)
             
         Returns:
             Hex Encoded Hash
         """
         try:
-            Hash_Obj = hashlib.sha256()
-            
             with open(File_Path, 'rb') as F:
+                # Let The Kernel Read Ahead Aggressively For The Single Pass
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(F.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                
+                # Python 3.11+ Hashes The Whole File In C With The GIL Released
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(F, Fast_SHA256).hexdigest()
+                
+                Hash_Obj = Fast_SHA256()
+                
+                # Older Pythons: Map The File And Hash It In One C Call (GIL Released)
+                try:
+                    with mmap.mmap(F.fileno(), 0, access=mmap.ACCESS_READ) as Mapped:
+                        Hash_Obj.update(Mapped)
+                    return Hash_Obj.hexdigest()
+                except (OSError, ValueError):
+                    pass
+                
+                # Empty Or Unmappable Files - Reuse One Buffer Across Reads
+                Buffer = bytearray(Chunk_Size)
+                View = memoryview(Buffer)
                 while True:
-                    Chunk = F.read(Chunk_Size)
-                    if not Chunk:
+                    Read = F.readinto(Buffer)
+                    if not Read:
                         break
-                    Hash_Obj.update(Chunk)
+                    Hash_Obj.update(View[:Read])
             
             return Hash_Obj.hexdigest()
             
@@ -679,6 +1465,29 @@ class Hash_Functions:
 
 
 # Initialize Global Crypto Objects
+def _AEAD_Self_Test(Size: int = 10 * 1024 * 1024) -> float:
+    """
+    Measure Bulk AEAD Throughput On This Host
+    
+    Portable OpenSSL Builds Or CPUs Without AES/CLMUL Can Be An Order Of
+    Magnitude Slower Than Expected; Timing A Real Encrypt Catches Both.
+    
+    Args:
+        Size: Bytes To Encrypt
+        
+    Returns:
+        Throughput In MB/s For The Algorithm Hybrid_Encryption Will Use
+    """
+    Cipher = AEAD_Cipher()
+    Buffer = bytes(Size)
+    
+    Start = time.perf_counter_ns()
+    Cipher.Encrypt(Buffer)
+    Elapsed = max(time.perf_counter_ns() - Start, 1)
+    
+    return Size / (1024 * 1024) / (Elapsed / 1e9)
+
+
 def Initialize_Crypto_System() -> dict:
     """
     Initialize Core Cryptography System
@@ -689,10 +1498,28 @@ def Initialize_Crypto_System() -> dict:
     try:
         logger.info("Initializing Cryptography System...")
         
+        # First Run Needs A Key Pair - Start Generating It While The Self-Test Runs
+        if not Crypto_Config.RSA_Private_Key_Path.exists():
+            Start_RSA_Key_Pool()
+        
         # Create Directories
         Crypto_Config.RSA_Private_Key_Path.parent.mkdir(parents=True, exist_ok=True)
         Crypto_Config.Cert_Path.mkdir(parents=True, exist_ok=True)
         
+        # Check The Bulk Cipher Is Hardware-Accelerated Before Anything Depends On It
+        if Crypto_Config.AEAD_Min_Throughput > 0:
+            Throughput = _AEAD_Self_Test()
+            if Throughput < Crypto_Config.AEAD_Min_Throughput:
+                logger.error(
+                    f"AEAD Self-Test: {Throughput:.0f} MB/s Is Below {Crypto_Config.AEAD_Min_Throughput} MB/s - "
+                    f"Install cryptography Linked Against A System OpenSSL 3.x With AES-NI/ARMv8-CE "
+                    f"Support, Or Preload A Hardware-Optimized libcrypto"
+                )
+                if Crypto_Config.Require_AES_Hardware:
+                    raise RuntimeError("AEAD Throughput Below Required Minimum")
+            else:
+                logger.debug(f"AEAD Self-Test: {Throughput:.0f} MB/s")
+        
         # Initialize RSA
         RSA = RSA_Handler(
             Crypto_Config.RSA_Private_Key_Path,
@@ -0,0 +1,93 @@
+"""
+Hash Backend Selection
+Probes CPU Hash/Cipher Extensions Once And Binds The Fastest SHA-256 Constructor
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Callable, FrozenSet
+from loguru import logger
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+
+def _Probe_CPU_Features() -> FrozenSet[str]:
+    """
+    Read CPU Feature Flags
+
+    Returns:
+        Set Of Lowercase Feature Names (Empty If The Platform Does Not Expose Them)
+    """
+    try:
+        for Line in Path('/proc/cpuinfo').read_text().splitlines():
+            # x86 Reports 'flags', ARM Reports 'Features'
+            if Line.startswith(('flags', 'Features')):
+                return frozenset(Line.split(':', 1)[1].lower().split())
+    except OSError:
+        pass
+
+    return frozenset()
+
+
+def _Select_SHA256() -> Callable:
+    """
+    Pick The SHA-256 Constructor
+
+    OpenSSL Dispatches To SHA-NI / ARMv8 Crypto Extensions Internally; The
+    Built-In Fallback Used When Python Lacks OpenSSL Does Not.
+
+    Returns:
+        hashlib-Compatible SHA-256 Constructor
+    """
+    try:
+        import _hashlib
+        return _hashlib.openssl_sha256
+    except (ImportError, AttributeError):
+        return hashlib.sha256
+
+
+# Probed Once At Import - Hot Paths Bind Fast_SHA256 Without Per-Call Checks
+CPU_Features = _Probe_CPU_Features()
+SHA_Extensions_Available = bool(CPU_Features & {'sha_ni', 'sha2'})
+
+# AES-GCM Needs Both AES Rounds (AES-NI / ARMv8 'aes') And Carry-Less Multiply
+# For GHASH (PCLMULQDQ / ARMv8 'pmull'); Unknown Platforms Are Assumed Capable
+AES_Extensions_Available = (
+    not CPU_Features
+    or ('aes' in CPU_Features and bool(CPU_Features & {'pclmulqdq', 'pmull'}))
+)
+Fast_SHA256 = _Select_SHA256()
+
+logger.debug(
+    f"SHA-256 Backend: {Fast_SHA256.__name__} "
+    f"(CPU SHA Extensions: {'Yes' if SHA_Extensions_Available else 'No'}, "
+    f"AES-GCM Extensions: {'Yes' if AES_Extensions_Available else 'No'})"
+)
+
+# Piece/Info Hash Algorithms A Torrent May Declare
+SUPPORTED_HASH_ALGORITHMS = ('sha256', 'blake3')
+
+
+def Get_Hash_Constructor(Algorithm: str) -> Callable:
+    """
+    Resolve A Torrent Hash Algorithm Name To A hashlib-Style Constructor
+
+    Args:
+        Algorithm: 'sha256' Or 'blake3'
+
+    Returns:
+        Constructor Taking Optional Initial Data (Objects Expose update/digest/hexdigest/copy)
+    """
+    if Algorithm == 'sha256':
+        return Fast_SHA256
+
+    if Algorithm == 'blake3':
+        if not BLAKE3_AVAILABLE:
+            raise ValueError("BLAKE3 Hashing Requested But The blake3 Package Is Not Installed")
+        return blake3.blake3
+
+    raise ValueError(f"Unsupported Hash Algorithm: {Algorithm}")
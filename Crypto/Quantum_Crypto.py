@@ -4,8 +4,14 @@ Implements Post-Quantum Algorithms (CRYSTALS-Kyber, Dilithium)
 """
 
 import os
-import secrets
-from typing import Tuple, Optional
+import asyncio
+import ctypes
+import struct
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple, Optional, Union
 from loguru import logger
 
 try:
@@ -15,6 +21,162 @@ except ImportError:
     QUANTUM_AVAILABLE = False
     logger.warning("liboqs Not Available - Quantum-Resistant Crypto Disabled")
 
+from . import _mlkem_native
+from .Core_Crypto import _Lock_Buffer, _Wipe_Buffer
+from ._mlkem_native import MLKEM_NATIVE_AVAILABLE
+from .Hash_Backend import BLAKE3_AVAILABLE
+
+if BLAKE3_AVAILABLE:
+    import blake3
+
+# liboqs Randomness: Served From A Per-Thread 4 KiB Buffer Filled By One getrandom(2)
+# Call (os.urandom) Instead Of Reading /dev/urandom On Every Request
+_RANDOM_BUFFER_SIZE = 4096
+_Random_State = threading.local()
+_Random_Generation = 0
+
+
+def _Reset_Random_Buffers():
+    """Invalidate Every Thread's Buffer In A Forked Child So It Never Replays The Parent's Bytes"""
+    global _Random_Generation
+    _Random_Generation += 1
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_Reset_Random_Buffers)
+
+
+def _Random_Bytes(Count: int) -> bytes:
+    """
+    Take Count Bytes From This Thread's Random Buffer, Refilling It When Short
+    
+    Args:
+        Count: Bytes Needed
+        
+    Returns:
+        Random Bytes (Consumed Bytes Are Zeroed In The Buffer)
+    """
+    if Count >= _RANDOM_BUFFER_SIZE:
+        return os.urandom(Count)
+    
+    State = _Random_State
+    if getattr(State, 'Generation', None) != _Random_Generation or State.Offset + Count > _RANDOM_BUFFER_SIZE:
+        State.Buffer = bytearray(os.urandom(_RANDOM_BUFFER_SIZE))
+        State.Offset = 0
+        State.Generation = _Random_Generation
+    
+    Start = State.Offset
+    State.Offset += Count
+    Chunk = bytes(State.Buffer[Start:State.Offset])
+    State.Buffer[Start:State.Offset] = bytes(Count)
+    return Chunk
+
+
+_RANDOMBYTES_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t)
+
+
+@_RANDOMBYTES_CALLBACK
+def _Oqs_Random_Bytes(Output, Count):
+    """OQS_randombytes Callback - Copies From The Buffered Source Into liboqs' Output"""
+    ctypes.memmove(Output, _Random_Bytes(Count), Count)
+
+
+@functools.lru_cache(maxsize=None)
+def _Liboqs_Library() -> ctypes.CDLL:
+    """liboqs Handle Loaded By liboqs-python (native() In Newer Releases, _liboqs In Older)"""
+    Native = getattr(oqs.oqs, 'native', None)
+    return Native() if callable(Native) else getattr(oqs.oqs, '_liboqs')
+
+
+def _Output_Buffer(Out: bytearray, Offset: int, Required: int) -> ctypes.Array:
+    """ctypes View Of Out[Offset:] For A C Function To Write Into Without A Copy"""
+    if len(Out) - Offset < Required:
+        raise ValueError(f"Output Buffer Needs At Least {Offset + Required} Bytes")
+    return (ctypes.c_uint8 * (len(Out) - Offset)).from_buffer(Out, Offset)
+
+
+def _Install_Random_Source():
+    """Point liboqs' randombytes At The Buffered Source (Best Effort Across liboqs-python Versions)"""
+    try:
+        _Liboqs_Library().OQS_randombytes_custom_algorithm(_Oqs_Random_Bytes)
+        logger.debug("liboqs Randomness Routed Through Buffered getrandom")
+    except Exception as E:
+        logger.debug("Keeping liboqs Default Randomness: {}", E)
+
+
+if QUANTUM_AVAILABLE:
+    _Install_Random_Source()
+
+
+# Keyless liboqs Objects Per Thread - Encapsulate/Verify Need No Secret Key, And A
+# liboqs Object Must Not Be Shared Across Threads, So Each Thread Keeps Warm Ones
+_Thread_Objects = threading.local()
+
+
+def _Thread_KEM(Algorithm: str) -> 'oqs.KeyEncapsulation':
+    """Get This Thread's Keyless KeyEncapsulation For Algorithm"""
+    Pool = getattr(_Thread_Objects, 'KEMs', None)
+    if Pool is None:
+        Pool = _Thread_Objects.KEMs = {}
+    
+    KEM = Pool.get(Algorithm)
+    if KEM is None:
+        KEM = Pool[Algorithm] = oqs.KeyEncapsulation(Algorithm)
+    return KEM
+
+
+def _Thread_Signature(Algorithm: str) -> 'oqs.Signature':
+    """Get This Thread's Keyless Signature Object For Algorithm"""
+    Pool = getattr(_Thread_Objects, 'Signatures', None)
+    if Pool is None:
+        Pool = _Thread_Objects.Signatures = {}
+    
+    Sig = Pool.get(Algorithm)
+    if Sig is None:
+        Sig = Pool[Algorithm] = oqs.Signature(Algorithm)
+    return Sig
+
+
+# Every Signature Starts With A One-Byte Scheme Id Naming What Was Signed. Untagged
+# Signatures From Before Scheme Ids Are Exactly length_signature Bytes (Dilithium
+# Signatures Are Fixed-Length), One Byte Short Of Any Tagged Signature.
+_SCHEME_PLAIN = 0x01
+_SCHEME_BLAKE3_PREHASH = 0x02
+
+# Hash-Then-Sign For Long Messages: The Scheme Signs PREHASH_DOMAIN || BLAKE3-512(M).
+# Sign Never Plain-Signs A Message Starting With The Domain, And Verify Rejects Plain
+# And Untagged Signatures Over One, So No Plain Signature Can Be Re-Tagged As A
+# Prehashed One.
+_PREHASH_THRESHOLD = 4096
+_PREHASH_DOMAIN = b"DST-BLAKE3-PREHASH\x00"
+
+
+def _Has_Prehash_Domain(Message: bytes) -> bool:
+    """True If Message Starts With _PREHASH_DOMAIN (Works For Any bytes-Like Message)"""
+    return Message[:len(_PREHASH_DOMAIN)] == _PREHASH_DOMAIN
+
+
+def _Prehash(Message: bytes) -> bytes:
+    """Domain-Separated 64-Byte BLAKE3 Digest Of Message (Multithreaded On Large Inputs)"""
+    return _PREHASH_DOMAIN + blake3.blake3(Message, max_threads=blake3.blake3.AUTO).digest(length=64)
+
+
+class _Locked_Secret(bytearray):
+    """Fixed-Size bytearray Pinned Out Of Swap With mlock And Zeroed Before It Is Freed"""
+    
+    def __init__(self, Size: int):
+        super().__init__(Size)
+        self._Locked = _Lock_Buffer(self)
+    
+    def Wipe(self):
+        """Zero The Secret And Release Its mlock"""
+        if len(self):
+            _Wipe_Buffer(self, getattr(self, '_Locked', False))
+            self._Locked = False
+    
+    def __del__(self):
+        self.Wipe()
+
 
 class Quantum_Key_Exchange:
     """Quantum-Resistant Key Exchange Using CRYSTALS-Kyber"""
@@ -24,58 +186,171 @@ class Quantum_Key_Exchange:
         Initialize Quantum Key Exchange
         
         Args:
-            Algorithm: Kyber Variant (Kyber512, Kyber768, Kyber1024)
+            Algorithm: Kyber Variant (Kyber512, Kyber768, Kyber1024) Or ML-KEM Variant
         """
-        if not QUANTUM_AVAILABLE:
+        # FIPS 203 ML-KEM Runs On mlkem-native's Build For That Parameter Set When Installed
+        self._Native_KEM = _mlkem_native.NATIVE_KEMS.get(Algorithm)
+        self.Native = self._Native_KEM is not None
+        
+        if not self.Native and not QUANTUM_AVAILABLE:
             raise ImportError("liboqs Library Not Available")
         
         try:
             self.Algorithm = Algorithm
-            self.KEM = oqs.KeyEncapsulation(Algorithm)
-            logger.info(f"Quantum Key Exchange Initialized With {Algorithm}")
+            self.KEM = None if self.Native else oqs.KeyEncapsulation(Algorithm)
+            self._Secret_Key: Optional[_Locked_Secret] = None
+            
+            Backend = "mlkem-native" if self.Native else "liboqs"
+            logger.info("Quantum Key Exchange Initialized With {} ({})", Algorithm, Backend)
             
         except Exception as E:
-            logger.error(f"Failed To Initialize Quantum Key Exchange: {E}")
+            logger.error("Failed To Initialize Quantum Key Exchange: {}", E)
             raise
     
-    def Generate_Keypair(self) -> Tuple[bytes, bytes]:
+    def Generate_Keypair(self, Export_Secret_Key: bool = True) -> Tuple[bytes, Optional[bytes]]:
         """
         Generate Quantum-Resistant Key Pair
         
+        Args:
+            Export_Secret_Key: Return A Copy Of The Secret Key; Pass False When It Is
+                Never Persisted So It Stays Only In Memory The Library Owns (mlock'd
+                On mlkem-native) And Is Never Copied Onto The Python Heap
+            
         Returns:
-            Tuple Of (Public_Key, Secret_Key)
+            Tuple Of (Public_Key, Secret_Key) - Secret_Key Is None When Not Exported
         """
         try:
-            Public_Key = self.KEM.generate_keypair()
-            Secret_Key = self.KEM.export_secret_key()
+            if self.Native:
+                self._Set_Secret_Key(_Locked_Secret(self._Native_KEM.Secret_Key_Bytes))
+                Public_Key, _ = self._Native_KEM.Generate_Keypair(self._Secret_Key)
+                Secret_Key = bytes(self._Secret_Key) if Export_Secret_Key else None
+            else:
+                Public_Key, Secret_Key = self._Generate_Liboqs_Keypair(Export_Secret_Key)
             
             logger.info("Quantum Keypair Generated")
             return Public_Key, Secret_Key
             
         except Exception as E:
-            logger.error(f"Failed To Generate Quantum Keypair: {E}")
+            logger.error("Failed To Generate Quantum Keypair: {}", E)
+            raise
+    
+    def _Generate_Liboqs_Keypair(self, Export_Secret_Key: bool) -> Tuple[bytes, Optional[bytes]]:
+        """
+        Generate Through One OQS_KEM_keypair Call Into Buffers Allocated Up Front
+        
+        Args:
+            Export_Secret_Key: Also Return A Copy Of The Secret Key
+            
+        Returns:
+            Tuple Of (Public_Key, Secret_Key Or None)
+        """
+        KEM = self.KEM
+        
+        try:
+            Public_Key = ctypes.create_string_buffer(KEM.details['length_public_key'])
+            Secret_Key = ctypes.create_string_buffer(KEM.details['length_secret_key'])
+            Status = _Liboqs_Library().OQS_KEM_keypair(KEM._kem, Public_Key, Secret_Key)
+        except (AttributeError, TypeError, ctypes.ArgumentError):
+            # liboqs-python Internals Differ - Use Its Wrapper And Export Separately
+            Public_Key = KEM.generate_keypair()
+            return Public_Key, KEM.export_secret_key() if Export_Secret_Key else None
+        
+        if Status != 0:
+            raise RuntimeError("OQS_KEM_keypair Failed")
+        
+        # decap_secret Reads The Secret Key From Here, As After generate_keypair
+        KEM.secret_key = Secret_Key
+        return Public_Key.raw, Secret_Key.raw if Export_Secret_Key else None
+    
+    def Load_Keypair(self, Secret_Key: bytes):
+        """
+        Adopt A Previously Exported Secret Key (Warm Restarts Skip Key Generation)
+        
+        Args:
+            Secret_Key: Secret Key Returned By An Earlier Generate_Keypair
+        """
+        try:
+            if self.Native:
+                if len(Secret_Key) != self._Native_KEM.Secret_Key_Bytes:
+                    raise ValueError(f"{self.Algorithm} Secret Key Must Be {self._Native_KEM.Secret_Key_Bytes} Bytes")
+                Locked = _Locked_Secret(len(Secret_Key))
+                Locked[:] = Secret_Key
+                self._Set_Secret_Key(Locked)
+            else:
+                self.KEM = oqs.KeyEncapsulation(self.Algorithm, secret_key=bytes(Secret_Key))
+            
+            logger.info("Quantum Keypair Loaded")
+            
+        except Exception as E:
+            logger.error("Failed To Load Quantum Keypair: {}", E)
             raise
     
-    def Encapsulate(self, Public_Key: bytes) -> Tuple[bytes, bytes]:
+    def _Set_Secret_Key(self, Secret_Key: Optional[_Locked_Secret]):
+        """Replace The mlkem-native Secret Key, Zeroing The Previous One Immediately"""
+        if self._Secret_Key is not None:
+            self._Secret_Key.Wipe()
+        self._Secret_Key = Secret_Key
+    
+    def Encapsulate(
+        self,
+        Public_Key: bytes,
+        Out: Optional[bytearray] = None
+    ) -> Tuple[Union[bytes, memoryview], bytes]:
         """
         Encapsulate Shared Secret
         
         Args:
             Public_Key: Recipient's Public Key
+            Out: Caller-Owned Buffer (E.g. A Send Buffer) To Write The Ciphertext
+                Into Directly, Skipping The Intermediate bytes Object (Optional)
             
         Returns:
-            Tuple Of (Ciphertext, Shared_Secret)
+            Tuple Of (Ciphertext, Shared_Secret) - Ciphertext Is A memoryview Into Out When Given
         """
         try:
-            Ciphertext, Shared_Secret = self.KEM.encap_secret(Public_Key)
+            if self.Native:
+                Ciphertext, Shared_Secret = self._Native_KEM.Encapsulate(Public_Key, Out)
+            elif Out is not None:
+                Ciphertext, Shared_Secret = self._Encapsulate_Into(bytes(Public_Key), Out)
+            else:
+                Ciphertext, Shared_Secret = _Thread_KEM(self.Algorithm).encap_secret(Public_Key)
             
             logger.debug("Shared Secret Encapsulated")
             return Ciphertext, Shared_Secret
             
         except Exception as E:
-            logger.error(f"Failed To Encapsulate: {E}")
+            logger.error("Failed To Encapsulate: {}", E)
             raise
     
+    def _Encapsulate_Into(self, Public_Key: bytes, Out: bytearray) -> Tuple[memoryview, bytes]:
+        """
+        Encapsulate Through OQS_KEM_encaps With The Ciphertext Written Straight Into Out
+        
+        Args:
+            Public_Key: Recipient's Public Key
+            Out: Destination Buffer
+            
+        Returns:
+            Tuple Of (memoryview Of Out Holding The Ciphertext, Shared_Secret)
+        """
+        KEM = _Thread_KEM(self.Algorithm)
+        Length = KEM.details['length_ciphertext']
+        
+        try:
+            Target = _Output_Buffer(Out, 0, Length)
+            Shared_Secret = ctypes.create_string_buffer(KEM.details['length_shared_secret'])
+            Status = _Liboqs_Library().OQS_KEM_encaps(KEM._kem, Target, Shared_Secret, Public_Key)
+        except (AttributeError, TypeError, ctypes.ArgumentError):
+            # liboqs-python Internals Differ - Fall Back To Its Wrapper Plus One Copy
+            Ciphertext, Secret = KEM.encap_secret(Public_Key)
+            Out[:Length] = Ciphertext
+            return memoryview(Out)[:Length], Secret
+        
+        if Status != 0:
+            raise RuntimeError("OQS_KEM_encaps Failed")
+        
+        return memoryview(Out)[:Length], Shared_Secret.raw
+    
     def Decapsulate(self, Ciphertext: bytes) -> bytes:
         """
         Decapsulate Shared Secret
@@ -87,16 +362,42 @@ class Quantum_Key_Exchange:
             Shared Secret
         """
         try:
-            Shared_Secret = self.KEM.decap_secret(Ciphertext)
+            if self.Native:
+                if self._Secret_Key is None:
+                    raise ValueError("Generate_Keypair Must Be Called Before Decapsulate")
+                Shared_Secret = self._Native_KEM.Decapsulate(Ciphertext, self._Secret_Key)
+            else:
+                Shared_Secret = self.KEM.decap_secret(Ciphertext)
             
             logger.debug("Shared Secret Decapsulated")
             return Shared_Secret
             
         except Exception as E:
-            logger.error(f"Failed To Decapsulate: {E}")
+            logger.error("Failed To Decapsulate: {}", E)
             raise
 
 
+# Length Prefix Written By Quantum_Signature.Sign_Framed
+_FRAME_LENGTH = struct.Struct('>H')
+
+# Shared By Every Quantum_Signature's Verify_Async; Created On First Use
+_Verify_Pool: Optional[ThreadPoolExecutor] = None
+_Verify_Pool_Lock = threading.Lock()
+
+
+def _Get_Verify_Pool() -> ThreadPoolExecutor:
+    """Get The Process-Wide Verification Pool, One Worker Per Core"""
+    global _Verify_Pool
+    if _Verify_Pool is None:
+        with _Verify_Pool_Lock:
+            if _Verify_Pool is None:
+                _Verify_Pool = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    thread_name_prefix="Quantum_Verify"
+                )
+    return _Verify_Pool
+
+
 class Quantum_Signature:
     """Quantum-Resistant Digital Signatures Using CRYSTALS-Dilithium"""
     
@@ -107,16 +408,17 @@ class Quantum_Signature:
         Args:
             Algorithm: Dilithium Variant (Dilithium2, Dilithium3, Dilithium5)
         """
-        if not QUANTUM_AVAILABLE:
-            raise ImportError("liboqs Library Not Available")
-        
         try:
             self.Algorithm = Algorithm
             self.Sig = oqs.Signature(Algorithm)
-            logger.info(f"Quantum Signature Initialized With {Algorithm}")
+            
+            # Bound Once So The Hot Path Is A Single Call Into liboqs
+            self._Sign = self.Sig.sign
+            
+            logger.info("Quantum Signature Initialized With {}", Algorithm)
             
         except Exception as E:
-            logger.error(f"Failed To Initialize Quantum Signature: {E}")
+            logger.error("Failed To Initialize Quantum Signature: {}", E)
             raise
     
     def Generate_Keypair(self) -> Tuple[bytes, bytes]:
@@ -134,29 +436,104 @@ class Quantum_Signature:
             return Public_Key, Secret_Key
             
         except Exception as E:
-            logger.error(f"Failed To Generate Signature Keypair: {E}")
+            logger.error("Failed To Generate Signature Keypair: {}", E)
             raise
     
-    def Sign(self, Message: bytes) -> bytes:
+    def Sign(self, Message: bytes, Out: Optional[bytearray] = None) -> Union[bytes, memoryview]:
         """
         Sign Message With Quantum-Resistant Algorithm
         
+        Messages Of 4 KiB Or More Are Reduced To A BLAKE3 Digest First When
+        blake3 Is Installed (Hash-Then-Sign; EUF-CMA Under BLAKE3 Collision
+        Resistance), Since liboqs' Own SHAKE-256 Pass Is Far Slower. The First
+        Byte Of The Signature Is The Scheme Id Telling Verify Which Was Used.
+        Messages Starting With The Prehash Domain Are Always Prehashed, So They
+        Cannot Be Signed Without blake3.
+        
         Args:
             Message: Data To Sign
+            Out: Caller-Owned Buffer To Write The Signature Into Directly,
+                Skipping liboqs-python's Message And Signature Copies (Optional)
             
         Returns:
-            Signature
+            Signature - A memoryview Into Out When Given
         """
         try:
-            Signature = self.Sig.sign(Message)
+            Domain_Prefixed = _Has_Prehash_Domain(Message)
+            if Domain_Prefixed and not BLAKE3_AVAILABLE:
+                raise ValueError("Message Starts With The Prehash Domain And blake3 Is Not Installed")
+            
+            Prehashed = Domain_Prefixed or (BLAKE3_AVAILABLE and len(Message) >= _PREHASH_THRESHOLD)
+            Payload = _Prehash(Message) if Prehashed else Message
+            Scheme = _SCHEME_BLAKE3_PREHASH if Prehashed else _SCHEME_PLAIN
             
-            logger.debug(f"Signed {len(Message)} Bytes")
+            if Out is None:
+                Signature = bytes((Scheme,)) + self._Sign(Payload)
+            else:
+                Out[0] = Scheme
+                Length = self._Sign_Into(bytes(Payload), Out, 1)
+                Signature = memoryview(Out)[:1 + Length]
+            
+            # Positional Arguments Are Only Formatted If A Sink Accepts DEBUG
+            logger.debug("Signed {} Bytes", len(Message))
             return Signature
             
         except Exception as E:
-            logger.error(f"Failed To Sign Message: {E}")
+            logger.error("Failed To Sign Message: {}", E)
             raise
     
+    def Sign_Framed(self, Message: bytes, Out: bytearray) -> int:
+        """
+        Sign Message Into A Length-Prefixed Wire Frame (Big-Endian u16 Length || Signature)
+        
+        The Signature Is Written Straight After The Length Field, So No Separate
+        Signature Object Is Built And Copied Into The Frame.
+        
+        Args:
+            Message: Data To Sign
+            Out: Send Buffer Receiving The Frame At Offset 0
+            
+        Returns:
+            Frame Length In Bytes
+        """
+        with memoryview(Out) as View:
+            Signature = self.Sign(Message, View[_FRAME_LENGTH.size:])
+            Length = len(Signature)
+            Signature.release()
+        
+        _FRAME_LENGTH.pack_into(Out, 0, Length)
+        return _FRAME_LENGTH.size + Length
+    
+    def _Sign_Into(self, Message: bytes, Out: bytearray, Offset: int) -> int:
+        """
+        Sign Through OQS_SIG_sign With The Signature Written Straight Into Out[Offset:]
+        
+        Args:
+            Message: Data To Sign
+            Out: Destination Buffer
+            Offset: Position In Out Where The Signature Starts
+            
+        Returns:
+            Signature Length
+        """
+        try:
+            Target = _Output_Buffer(Out, Offset, self.Sig.details['length_signature'])
+            Length = ctypes.c_size_t(0)
+            Status = _Liboqs_Library().OQS_SIG_sign(
+                self.Sig._sig, Target, ctypes.byref(Length),
+                Message, ctypes.c_size_t(len(Message)), self.Sig.secret_key
+            )
+        except (AttributeError, TypeError, ctypes.ArgumentError):
+            # liboqs-python Internals Differ - Fall Back To Its Wrapper Plus One Copy
+            Signature = self._Sign(Message)
+            Out[Offset:Offset + len(Signature)] = Signature
+            return len(Signature)
+        
+        if Status != 0:
+            raise RuntimeError("OQS_SIG_sign Failed")
+        
+        return Length.value
+    
     def Verify(self, Message: bytes, Signature: bytes, Public_Key: bytes) -> bool:
         """
         Verify Quantum-Resistant Signature
@@ -170,7 +547,25 @@ class Quantum_Signature:
             True If Valid
         """
         try:
-            Is_Valid = self.Sig.verify(Message, Signature, Public_Key)
+            Verifier = _Thread_Signature(self.Algorithm)
+            Untagged = len(Signature) == Verifier.details['length_signature']
+            
+            if not Signature:
+                raise ValueError("Empty Signature")
+            elif (Untagged or Signature[0] == _SCHEME_PLAIN) and _Has_Prehash_Domain(Message):
+                # A Plain Signature Over PREHASH_DOMAIN || Digest Would Verify As A Prehashed One
+                raise ValueError("Plain Signature Over A Prehash-Domain Message")
+            elif Untagged:
+                # Untagged Signature From Before Scheme Ids
+                Is_Valid = Verifier.verify(Message, Signature, Public_Key)
+            elif Signature[0] == _SCHEME_PLAIN:
+                Is_Valid = Verifier.verify(Message, Signature[1:], Public_Key)
+            elif Signature[0] == _SCHEME_BLAKE3_PREHASH:
+                if not BLAKE3_AVAILABLE:
+                    raise ValueError("Signature Is BLAKE3-Prehashed But blake3 Is Not Installed")
+                Is_Valid = Verifier.verify(_Prehash(Message), Signature[1:], Public_Key)
+            else:
+                raise ValueError(f"Unknown Signature Scheme Id: {Signature[0]}")
             
             if Is_Valid:
                 logger.debug("Quantum Signature Verified")
@@ -180,16 +575,88 @@ class Quantum_Signature:
             return Is_Valid
             
         except Exception as E:
-            logger.error(f"Signature Verification Error: {E}")
+            logger.error("Signature Verification Error: {}", E)
             return False
+    
+    async def Verify_Async(self, Message: bytes, Signature: bytes, Public_Key: bytes) -> bool:
+        """
+        Verify A Signature Without Blocking The Event Loop
+        
+        Runs Verify On The Shared Verification Pool; Batches Scale Across
+        Cores Through asyncio.gather Since liboqs Runs Without The GIL.
+        
+        Args:
+            Message: Original Message
+            Signature: Signature To Verify
+            Public_Key: Signer's Public Key
+            
+        Returns:
+            True If Valid
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            _Get_Verify_Pool(),
+            self.Verify,
+            Message,
+            Signature,
+            Public_Key
+        )
+    
+    def Verify_Batch(
+        self,
+        Messages: Sequence[bytes],
+        Signatures: Sequence[bytes],
+        Public_Keys: Sequence[bytes]
+    ) -> List[bool]:
+        """
+        Verify Many Quantum-Resistant Signatures Concurrently
+        
+        liboqs Is Called Through ctypes, Which Releases The GIL, So The
+        SHAKE/NTT Work Of Each Verification Runs In Parallel Across Cores.
+        
+        Args:
+            Messages: Original Messages
+            Signatures: Signatures, One Per Message
+            Public_Keys: Signers' Public Keys, One Per Message
+            
+        Returns:
+            One Verification Result Per Message, In Input Order
+        """
+        if not len(Messages) == len(Signatures) == len(Public_Keys):
+            raise ValueError("Messages, Signatures And Public_Keys Must Be The Same Length")
+        
+        Workers = min(os.cpu_count() or 1, len(Messages))
+        if Workers <= 1:
+            return [self.Verify(*Item) for Item in zip(Messages, Signatures, Public_Keys)]
+        
+        with ThreadPoolExecutor(max_workers=Workers) as Pool:
+            return list(Pool.map(self.Verify, Messages, Signatures, Public_Keys))
+
+
+class _Unavailable_Signature:
+    """Bound As Quantum_Signature When liboqs Is Missing, So The Real Class Never Checks"""
+    
+    def __init__(self, *Args, **Kwargs):
+        raise ImportError("liboqs Library Not Available")
+
+
+if not QUANTUM_AVAILABLE:
+    Quantum_Signature = _Unavailable_Signature
+
+
+@dataclass(frozen=True)
+class Quantum_Crypto_Bundle:
+    """Quantum Crypto Objects Returned By Initialize_Quantum_Crypto"""
+    __slots__ = ('KEM', 'Signature')
+    KEM: Quantum_Key_Exchange
+    Signature: Quantum_Signature
 
 
-def Initialize_Quantum_Crypto() -> Optional[dict]:
+def Initialize_Quantum_Crypto() -> Optional[Quantum_Crypto_Bundle]:
     """
     Initialize Quantum-Resistant Cryptography
     
     Returns:
-        Dictionary Of Quantum Crypto Objects Or None
+        Bundle Of Quantum Crypto Objects Or None
     """
     if not QUANTUM_AVAILABLE:
         logger.warning("Quantum Cryptography Not Available")
@@ -203,13 +670,10 @@ def Initialize_Quantum_Crypto() -> Optional[dict]:
         
         logger.info("Quantum Cryptography Initialized Successfully")
         
-        return {
-            'KEM': Quantum_KEM,
-            'Signature': Quantum_Sig
-        }
+        return Quantum_Crypto_Bundle(KEM=Quantum_KEM, Signature=Quantum_Sig)
         
     except Exception as E:
-        logger.error(f"Failed To Initialize Quantum Cryptography: {E}")
+        logger.error("Failed To Initialize Quantum Cryptography: {}", E)
         return None
 
 
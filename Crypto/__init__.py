@@ -4,29 +4,56 @@ Crypto Package Initialization
 
 from .Core_Crypto import (
     AES_Cipher,
+    AEAD_Cipher,
     RSA_Handler,
     Certificate_Manager,
     Hybrid_Encryption,
     Hash_Functions,
-    Initialize_Crypto_System
+    Assert_High_Entropy,
+    Initialize_Crypto_System,
+    Start_RSA_Key_Pool
+)
+
+from .Hash_Backend import (
+    Fast_SHA256,
+    CPU_Features,
+    SHA_Extensions_Available,
+    AES_Extensions_Available,
+    Get_Hash_Constructor,
+    SUPPORTED_HASH_ALGORITHMS,
+    BLAKE3_AVAILABLE
 )
 
 from .Quantum_Crypto import (
     Quantum_Key_Exchange,
     Quantum_Signature,
     Initialize_Quantum_Crypto,
-    QUANTUM_AVAILABLE
+    Quantum_Crypto_Bundle,
+    QUANTUM_AVAILABLE,
+    MLKEM_NATIVE_AVAILABLE
 )
 
 __all__ = [
     'AES_Cipher',
+    'AEAD_Cipher',
     'RSA_Handler',
     'Certificate_Manager',
     'Hybrid_Encryption',
     'Hash_Functions',
+    'Assert_High_Entropy',
     'Initialize_Crypto_System',
+    'Start_RSA_Key_Pool',
+    'Fast_SHA256',
+    'CPU_Features',
+    'SHA_Extensions_Available',
+    'AES_Extensions_Available',
+    'Get_Hash_Constructor',
+    'SUPPORTED_HASH_ALGORITHMS',
+    'BLAKE3_AVAILABLE',
     'Quantum_Key_Exchange',
     'Quantum_Signature',
     'Initialize_Quantum_Crypto',
-    'QUANTUM_AVAILABLE'
+    'Quantum_Crypto_Bundle',
+    'QUANTUM_AVAILABLE',
+    'MLKEM_NATIVE_AVAILABLE'
 ]
@@ -0,0 +1,182 @@
+"""
+mlkem-native Binding
+ctypes Wrapper Around pq-code-package/mlkem-native's ML-KEM Shared Libraries,
+Whose AVX2/NEON Backends Vectorise The NTT And Keccak-f[1600]x4
+"""
+
+import ctypes
+import ctypes.util
+from typing import Dict, Optional, Tuple, Union
+from loguru import logger
+
+from Config import Crypto_Config
+
+# FIPS 203 Sizes Per Parameter Set: (Public Key, Secret Key, Ciphertext)
+_PARAMETER_SETS = {
+    512: (800, 1632, 768),
+    768: (1184, 2400, 1088),
+    1024: (1568, 3168, 1568),
+}
+SHARED_SECRET_BYTES = 32
+
+# mlkem-native Builds One Library Per Parameter Set, So k Is A Compile-Time
+# Constant Inside Each; Exported Names Depend On The Namespace Prefix Used
+_SYMBOL_PREFIXES = ('PQCP_MLKEM_NATIVE_MLKEM{}_', 'crypto_kem_')
+
+_LIBRARY_SETTINGS = {
+    512: Crypto_Config.MLKEM_Native_Library_512,
+    768: Crypto_Config.MLKEM_Native_Library_768,
+    1024: Crypto_Config.MLKEM_Native_Library,
+}
+
+
+def _Input_Buffer(Data: Union[bytes, bytearray]) -> Union[bytes, ctypes.Array]:
+    """Pass A bytearray (E.g. An mlock'd Secret) By Reference Instead Of Copying It To bytes"""
+    if isinstance(Data, bytearray):
+        return (ctypes.c_char * len(Data)).from_buffer(Data)
+    return bytes(Data)
+
+
+class Native_KEM:
+    """One ML-KEM Parameter Set Bound To Its Own mlkem-native Library"""
+
+    def __init__(self, Level: int, Functions: Tuple[ctypes._CFuncPtr, ctypes._CFuncPtr, ctypes._CFuncPtr]):
+        """
+        Initialize Native KEM
+
+        Args:
+            Level: 512, 768 Or 1024
+            Functions: (Keypair, Encapsulate, Decapsulate) C Functions
+        """
+        self.Algorithm = f"ML-KEM-{Level}"
+        self.Public_Key_Bytes, self.Secret_Key_Bytes, self.Ciphertext_Bytes = _PARAMETER_SETS[Level]
+        self._Keypair, self._Encapsulate, self._Decapsulate = Functions
+
+    def Generate_Keypair(self, Secret_Out: Optional[bytearray] = None) -> Tuple[bytes, Union[bytes, bytearray]]:
+        """
+        Generate A Key Pair
+
+        Args:
+            Secret_Out: Buffer To Generate The Secret Key Into Directly (Optional)
+
+        Returns:
+            Tuple Of (Public_Key, Secret_Key) - Secret_Key Is Secret_Out When Given
+        """
+        if Secret_Out is not None and len(Secret_Out) != self.Secret_Key_Bytes:
+            raise ValueError(f"{self.Algorithm} Secret Key Buffer Must Be {self.Secret_Key_Bytes} Bytes")
+
+        Public_Key = ctypes.create_string_buffer(self.Public_Key_Bytes)
+        if Secret_Out is None:
+            Secret_Key = ctypes.create_string_buffer(self.Secret_Key_Bytes)
+        else:
+            Secret_Key = (ctypes.c_char * self.Secret_Key_Bytes).from_buffer(Secret_Out)
+
+        if self._Keypair(Public_Key, Secret_Key) != 0:
+            raise RuntimeError("mlkem-native Key Generation Failed")
+
+        return Public_Key.raw, (Secret_Key.raw if Secret_Out is None else Secret_Out)
+
+    def Encapsulate(self, Public_Key: bytes, Out: Optional[bytearray] = None) -> Tuple[Union[bytes, memoryview], bytes]:
+        """
+        Encapsulate A Shared Secret To A Public Key
+
+        Args:
+            Public_Key: Recipient's Public Key
+            Out: Buffer To Write The Ciphertext Into Directly (Optional)
+
+        Returns:
+            Tuple Of (Ciphertext, Shared_Secret) - Ciphertext Is A memoryview Into Out When Given
+        """
+        if len(Public_Key) != self.Public_Key_Bytes:
+            raise ValueError(f"{self.Algorithm} Public Key Must Be {self.Public_Key_Bytes} Bytes")
+        if Out is not None and len(Out) < self.Ciphertext_Bytes:
+            raise ValueError(f"Output Buffer Needs At Least {self.Ciphertext_Bytes} Bytes")
+
+        if Out is None:
+            Ciphertext = ctypes.create_string_buffer(self.Ciphertext_Bytes)
+        else:
+            Ciphertext = (ctypes.c_char * len(Out)).from_buffer(Out)
+        Shared_Secret = ctypes.create_string_buffer(SHARED_SECRET_BYTES)
+
+        # The Library Validates The Public Key (FIPS 203 Modulus Check) And Fails Here
+        if self._Encapsulate(Ciphertext, Shared_Secret, bytes(Public_Key)) != 0:
+            raise ValueError("mlkem-native Rejected The Public Key")
+
+        if Out is None:
+            return Ciphertext.raw, Shared_Secret.raw
+        return memoryview(Out)[:self.Ciphertext_Bytes], Shared_Secret.raw
+
+    def Decapsulate(self, Ciphertext: bytes, Secret_Key: Union[bytes, bytearray]) -> bytes:
+        """
+        Recover The Shared Secret From A Ciphertext
+
+        Args:
+            Ciphertext: Ciphertext Produced By Encapsulate
+            Secret_Key: Matching Secret Key
+
+        Returns:
+            Shared Secret (Implicit Rejection Yields A Pseudorandom Secret On Tampering)
+        """
+        if len(Ciphertext) != self.Ciphertext_Bytes:
+            raise ValueError(f"{self.Algorithm} Ciphertext Must Be {self.Ciphertext_Bytes} Bytes")
+        if len(Secret_Key) != self.Secret_Key_Bytes:
+            raise ValueError(f"{self.Algorithm} Secret Key Must Be {self.Secret_Key_Bytes} Bytes")
+
+        Shared_Secret = ctypes.create_string_buffer(SHARED_SECRET_BYTES)
+
+        if self._Decapsulate(Shared_Secret, bytes(Ciphertext), _Input_Buffer(Secret_Key)) != 0:
+            raise ValueError("mlkem-native Rejected The Secret Key")
+
+        return Shared_Secret.raw
+
+
+def _Load_Library(Level: int) -> Optional[Native_KEM]:
+    """
+    Locate One Parameter Set's Shared Library And Bind keypair/enc/dec
+
+    Args:
+        Level: 512, 768 Or 1024
+
+    Returns:
+        Bound Native_KEM, Or None If Not Installed
+    """
+    Candidates = (
+        _LIBRARY_SETTINGS[Level],
+        ctypes.util.find_library(f'mlkem{Level}'),
+        # Unsuffixed Builds Have Always Been Taken As ML-KEM-1024
+        ctypes.util.find_library('mlkem') if Level == 1024 else None,
+    )
+
+    for Name in filter(None, Candidates):
+        try:
+            Library = ctypes.CDLL(Name)
+        except OSError:
+            continue
+
+        for Prefix in _SYMBOL_PREFIXES:
+            Prefix = Prefix.format(Level)
+            try:
+                Keypair = getattr(Library, Prefix + 'keypair')
+                Encapsulate = getattr(Library, Prefix + 'enc')
+                Decapsulate = getattr(Library, Prefix + 'dec')
+            except AttributeError:
+                continue
+
+            Keypair.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+            Encapsulate.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p]
+            Decapsulate.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p]
+            for Function in (Keypair, Encapsulate, Decapsulate):
+                Function.restype = ctypes.c_int
+
+            logger.debug("mlkem-native ML-KEM-{} Loaded From {}", Level, Name)
+            return Native_KEM(Level, (Keypair, Encapsulate, Decapsulate))
+
+    return None
+
+
+# Bound Once At Import - Each Algorithm Name Maps Straight To Its Specialised Build
+NATIVE_KEMS: Dict[str, Native_KEM] = {
+    KEM.Algorithm: KEM
+    for KEM in filter(None, map(_Load_Library, _PARAMETER_SETS))
+}
+MLKEM_NATIVE_AVAILABLE = bool(NATIVE_KEMS)
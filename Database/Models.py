@@ -3,22 +3,31 @@ Database Models And Operations
 SQLite Backend With Thread-Safe Operations
 """
 
+import atexit
+import socket
+import struct
 import threading
 import hashlib
+import time
 import uuid
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 
 from sqlalchemy import (
     create_engine, Column, String, Integer, Float, Boolean,
-    DateTime, LargeBinary, ForeignKey, Table, Text, text
+    DateTime, LargeBinary, ForeignKey, Table, Text, Index, TypeDecorator,
+    bindparam, delete, func, select, text, event
 )
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker, scoped_session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool
 from loguru import logger
 
 from Config import Database_Config
+from Crypto.Hash_Backend import Fast_SHA256
 
 # Base Class For Models
 Base = declarative_base()
@@ -28,12 +37,71 @@ Session_Factory = None
 Session_Lock = threading.Lock()
 
 
+class Hex_Digest(TypeDecorator):
+    """
+    Hex Digest Column Stored As Raw Bytes
+    
+    Python Code Keeps Reading And Filtering By Hex Strings, But Rows And Index
+    Entries Hold The Digest Itself - Half The Width Of The Hex Text.
+    """
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, Value, Dialect):
+        if Value is None or isinstance(Value, (bytes, bytearray)):
+            return Value
+        # Malformed Hex Raises ValueError, So It Is Never Written
+        return bytes.fromhex(Value)
+    
+    def process_result_value(self, Value, Dialect):
+        # Text Rows Are Left From Before The Blob Migration
+        if Value is None or isinstance(Value, str):
+            return Value
+        return bytes(Value).hex()
+
+
+# Bound In Place Of Malformed Hex - One Byte, So No Stored Digest Can Equal It
+_NO_DIGEST_MATCH = b'\xff'
+
+
+class Hex_Digest_Lookup(Hex_Digest):
+    """
+    Hex_Digest For Lookup Parameters Only
+    
+    Malformed Hex (E.g. A Bad Info Hash In A URL) Is Simply A Miss Rather
+    Than An Error. Never Used For Columns, So Writes Still Raise.
+    """
+    cache_ok = True
+    
+    def process_bind_param(self, Value, Dialect):
+        try:
+            return super().process_bind_param(Value, Dialect)
+        except ValueError:
+            return _NO_DIGEST_MATCH
+
+
+# SQLite user_version Once Hex_Digest Columns Hold Blobs
+_HEX_DIGEST_SCHEMA_VERSION = 1
+
+
+def _Hex_To_Blob(Value):
+    """SQLite Function Converting A Stored Hex String To Bytes (Anything Else Is Kept)"""
+    if isinstance(Value, str):
+        try:
+            return bytes.fromhex(Value)
+        except ValueError:
+            pass
+    return Value
+
+
 # Association Table For Many-To-Many Relationship
 Torrent_Peers = Table(
     'Torrent_Peers',
     Base.metadata,
-    Column('Torrent_Id', String, ForeignKey('Torrents.Info_Hash')),
-    Column('Peer_Id', String, ForeignKey('Peers.Peer_Id'))
+    Column('Torrent_Id', Hex_Digest(32), ForeignKey('Torrents.Info_Hash')),
+    Column('Peer_Id', String, ForeignKey('Peers.Peer_Id')),
+    # Peer List Lookups By Torrent, And One Link Per (Torrent, Peer)
+    Index('ix_torrent_peers_torrent_peer', 'Torrent_Id', 'Peer_Id', unique=True)
 )
 
 
@@ -41,7 +109,7 @@ class Torrent(Base):
     """Torrent Model"""
     __tablename__ = 'Torrents'
     
-    Info_Hash = Column(String(64), primary_key=True, index=True)
+    Info_Hash = Column(Hex_Digest(32), primary_key=True, index=True)
     Name = Column(String(255), nullable=False)
     Total_Size = Column(Integer, nullable=False)
     Piece_Count = Column(Integer, nullable=False)
@@ -96,7 +164,7 @@ class Peer(Base):
     
     # Security
     Public_Key = Column(LargeBinary)  # RSA/Quantum Public Key
-    Certificate_Hash = Column(String(64))
+    Certificate_Hash = Column(Hex_Digest(32))
     
     # Relationships
     Torrents = relationship('Torrent', secondary=Torrent_Peers, back_populates='Peers')
@@ -122,11 +190,11 @@ class File(Base):
     __tablename__ = 'Files'
     
     Id = Column(Integer, primary_key=True, autoincrement=True)
-    Torrent_Info_Hash = Column(String(64), ForeignKey('Torrents.Info_Hash'), nullable=False)
+    Torrent_Info_Hash = Column(Hex_Digest(32), ForeignKey('Torrents.Info_Hash'), nullable=False)
     
     Path = Column(String(500), nullable=False)
     Length = Column(Integer, nullable=False)
-    Hash = Column(String(64))
+    Hash = Column(Hex_Digest(32))
     
     # Relationships
     Torrent = relationship('Torrent', back_populates='Files')
@@ -138,10 +206,14 @@ class File(Base):
 class Announcement(Base):
     """Announcement Log"""
     __tablename__ = 'Announcements'
+    __table_args__ = (
+        # Per-Torrent Announce History In Time Order
+        Index('ix_announce_hash_ts', 'Info_Hash', 'Timestamp'),
+    )
     
     Id = Column(Integer, primary_key=True, autoincrement=True)
     Peer_Id = Column(String(40), nullable=False, index=True)
-    Info_Hash = Column(String(64), nullable=False, index=True)
+    Info_Hash = Column(Hex_Digest(32), nullable=False, index=True)
     
     Event = Column(String(20))  # Started, Stopped, Completed
     IP_Address = Column(String(45), nullable=False)
@@ -161,12 +233,13 @@ class Dead_Drop(Base):
     """Dead Drop Storage For Anonymous File Exchange"""
     __tablename__ = 'Dead_Drops'
 
-    Id = Column(String(64), primary_key=True)  # SHA-256 Of Drop Location
+    Id = Column(Hex_Digest(32), primary_key=True)  # SHA-256 Of Drop Location
 
     # Encrypted Payload
     Encrypted_Data = Column(LargeBinary, nullable=False)
     Nonce = Column(LargeBinary, nullable=False)  # AES-GCM Nonce
     Salt = Column(LargeBinary, nullable=False)  # PBKDF2 Salt For Password-Based Key Derivation
+    Encryption_Key_Hash = Column(LargeBinary(32))  # Raw SHA-256 Of Key For Key-Based Drops
 
     # Metadata
     Created_At = Column(DateTime, default=datetime.utcnow, index=True)
@@ -185,8 +258,8 @@ class Blockchain_Record(Base):
     """Blockchain Tracker Records"""
     __tablename__ = 'Blockchain_Records'
 
-    Block_Hash = Column(String(64), primary_key=True)
-    Previous_Hash = Column(String(64), nullable=False, index=True)
+    Block_Hash = Column(Hex_Digest(32), primary_key=True)
+    Previous_Hash = Column(Hex_Digest(32), nullable=False, index=True)
     Block_Number = Column(Integer, nullable=False, unique=True, index=True)
 
     # Block Data
@@ -203,6 +276,51 @@ class Blockchain_Record(Base):
         return f"<Block #{self.Block_Number} {self.Block_Hash[:8]}>"
 
 
+def _Set_SQLite_Pragmas(DBAPI_Connection, Connection_Record):
+    """Enable WAL Journaling And Tune Caching On Every New SQLite Connection"""
+    Cursor = DBAPI_Connection.cursor()
+    Cursor.execute("PRAGMA journal_mode=WAL")
+    Cursor.execute("PRAGMA synchronous=NORMAL")
+    Cursor.execute("PRAGMA temp_store=MEMORY")
+    Cursor.execute(f"PRAGMA cache_size=-{int(Database_Config.SQLite_Cache_Size_KiB)}")
+    Cursor.execute(f"PRAGMA mmap_size={int(Database_Config.SQLite_Mmap_Size)}")
+    Cursor.execute(f"PRAGMA busy_timeout={int(Database_Config.SQLite_Busy_Timeout_MS)}")
+    Cursor.execute(f"PRAGMA wal_autocheckpoint={int(Database_Config.SQLite_WAL_Autocheckpoint)}")
+    Cursor.close()
+
+
+def _Is_SQLite_File(DB_URL: str) -> bool:
+    """True For A File-Backed SQLite URL (In-Memory Databases Have No Journal To Tune)"""
+    return DB_URL.startswith('sqlite') and ':memory:' not in DB_URL and DB_URL.split('://', 1)[-1] not in ('', '/')
+
+
+# Hot Lookups Built Once - Reusing The Same Statement Object Keeps Every Call On
+# SQLAlchemy's Compiled Cache Instead Of Rebuilding A Query Per Call
+_TORRENT_BY_HASH = select(Torrent).where(Torrent.Info_Hash == bindparam('Info_Hash', type_=Hex_Digest_Lookup(32)))
+_TORRENT_EXISTS = select(Torrent.Info_Hash).where(Torrent.Info_Hash == bindparam('Info_Hash', type_=Hex_Digest_Lookup(32)))
+_PEER_BY_ID = select(Peer).where(Peer.Peer_Id == bindparam('Peer_Id'))
+_TORRENT_PEERS = (
+    select(Peer)
+    .join(Torrent_Peers, Torrent_Peers.c.Peer_Id == Peer.Peer_Id)
+    .where(Torrent_Peers.c.Torrent_Id == bindparam('Info_Hash', type_=Hex_Digest_Lookup(32)))
+    .limit(bindparam('Limit'))
+)
+_COMPACT_PEERS = (
+    select(Peer.IP_Address, Peer.Port)
+    .join(Torrent_Peers, Torrent_Peers.c.Peer_Id == Peer.Peer_Id)
+    .where(Torrent_Peers.c.Torrent_Id == bindparam('Info_Hash', type_=Hex_Digest_Lookup(32)))
+    .limit(bindparam('Limit'))
+)
+_DEAD_DROP_BY_ID = select(Dead_Drop).where(Dead_Drop.Id == bindparam('Drop_Id', type_=Hex_Digest_Lookup(32)))
+_EXPIRED_DROP_IDS = select(Dead_Drop.Id).where(Dead_Drop.Expires_At < bindparam('Now'))
+_DELETE_EXPIRED_DROPS = delete(Dead_Drop).where(Dead_Drop.Expires_At < bindparam('Now'))
+_LATEST_BLOCK = (
+    select(Blockchain_Record.Block_Number, Blockchain_Record.Block_Hash)
+    .order_by(Blockchain_Record.Block_Number.desc())
+    .limit(1)
+)
+
+
 # Database Manager
 class Database_Manager:
     """Thread-Safe Database Manager"""
@@ -219,20 +337,31 @@ class Database_Manager:
         self.Session = None
         self.Lock = threading.Lock()
         
+        # Info Hashes Known To Exist (Torrents Are Never Deleted, So Entries Never Go Stale)
+        self._Torrent_Hashes: Set[str] = set()
+        
         logger.info(f"Database Manager Initialized: {self.DB_URL}")
     
     def Initialize(self):
         """Initialize Database Connection And Create Tables"""
         try:
             with self.Lock:
-                # Create Engine
+                SQLite_File = _Is_SQLite_File(self.DB_URL)
+                
+                # Create Engine - A File Database Gets A Real Connection Pool So
+                # Concurrent Readers Run In Parallel Under WAL
                 self.Engine = create_engine(
                     self.DB_URL,
                     echo=Database_Config.Echo,
                     pool_size=Database_Config.Pool_Size,
                     max_overflow=Database_Config.Max_Overflow,
-                    connect_args={'check_same_thread': False} if 'sqlite' in self.DB_URL else {}
+                    connect_args={'check_same_thread': False} if 'sqlite' in self.DB_URL else {},
+                    **({'poolclass': QueuePool} if SQLite_File else {})
                 )
+                
+                # WAL Lets Readers Proceed During Commits And Avoids An fsync Per Commit
+                if SQLite_File:
+                    event.listen(self.Engine, 'connect', _Set_SQLite_Pragmas)
 
                 # Check If We Need To Recreate Tables (Schema Migration)
                 try:
@@ -251,11 +380,11 @@ class Database_Manager:
                             with self.Engine.connect() as conn:
                                 conn.execute(text("DROP TABLE IF EXISTS Dead_Drops"))
                                 conn.commit()
-                        elif 'Encryption_Key_Hash' in columns:
-                            logger.info("Dead_Drops Table Has Old Schema, Recreating...")
-                            # Drop old table
+                        elif 'Encryption_Key_Hash' not in columns:
+                            logger.info("Dead_Drops Table Missing Key Hash Column, Adding...")
+                            Column_Type = LargeBinary(32).compile(dialect=self.Engine.dialect)
                             with self.Engine.connect() as conn:
-                                conn.execute(text("DROP TABLE IF EXISTS Dead_Drops"))
+                                conn.execute(text(f"ALTER TABLE Dead_Drops ADD COLUMN Encryption_Key_Hash {Column_Type}"))
                                 conn.commit()
 
                 except Exception as schema_check_error:
@@ -263,9 +392,19 @@ class Database_Manager:
 
                 # Create All Tables
                 Base.metadata.create_all(self.Engine)
+                
+                # create_all Skips Tables That Already Exist, So Add Newer Indexes Here
+                self._Create_Missing_Indexes()
+                
+                if self.Engine.dialect.name == 'sqlite':
+                    self._Migrate_Hex_Digests()
+                
+                # Announces Check Torrent Existence Against Memory Instead Of A SELECT
+                with self.Engine.connect() as conn:
+                    self._Torrent_Hashes = set(conn.execute(select(Torrent.Info_Hash)).scalars())
 
-                # Create Session Factory
-                Session_Factory_Obj = sessionmaker(bind=self.Engine)
+                # Create Session Factory - Objects Stay Readable After Session_Scope Commits And Closes
+                Session_Factory_Obj = sessionmaker(bind=self.Engine, expire_on_commit=False)
                 self.Session = scoped_session(Session_Factory_Obj)
 
                 logger.info("Database Initialized Successfully")
@@ -274,12 +413,103 @@ class Database_Manager:
             logger.error(f"Database Initialization Failed: {E}")
             raise
 
+    def _Create_Missing_Indexes(self):
+        """Create Indexes Added Since An Existing Database Was Created"""
+        from sqlalchemy import inspect
+        inspector = inspect(self.Engine)
+        
+        for Table_Obj in Base.metadata.sorted_tables:
+            Existing = {Index_Info['name'] for Index_Info in inspector.get_indexes(Table_Obj.name)}
+            
+            for Index_Obj in Table_Obj.indexes:
+                if Index_Obj.name in Existing:
+                    continue
+                
+                try:
+                    if Index_Obj.unique and Table_Obj is Torrent_Peers and self.Engine.dialect.name == 'sqlite':
+                        # Older Databases May Hold Repeated Links - Keep One Of Each
+                        with self.Engine.begin() as conn:
+                            conn.execute(text(
+                                "DELETE FROM Torrent_Peers WHERE rowid NOT IN "
+                                "(SELECT MIN(rowid) FROM Torrent_Peers GROUP BY Torrent_Id, Peer_Id)"
+                            ))
+                    
+                    Index_Obj.create(self.Engine)
+                    logger.info(f"Created Index {Index_Obj.name}")
+                    
+                except Exception as Index_Error:
+                    logger.warning(f"Could Not Create Index {Index_Obj.name}: {Index_Error}")
+    
+    def _Migrate_Hex_Digests(self):
+        """Rewrite Hex Text Left In Hex_Digest Columns Of An Older SQLite Database As Blobs"""
+        with self.Engine.begin() as conn:
+            if conn.execute(text("PRAGMA user_version")).scalar() >= _HEX_DIGEST_SCHEMA_VERSION:
+                return
+            
+            conn.connection.dbapi_connection.create_function('Hex_To_Blob', 1, _Hex_To_Blob, deterministic=True)
+            
+            for Table_Obj in Base.metadata.sorted_tables:
+                for Column_Obj in Table_Obj.columns:
+                    if isinstance(Column_Obj.type, Hex_Digest):
+                        conn.execute(text(
+                            f"UPDATE {Table_Obj.name} SET {Column_Obj.name} = Hex_To_Blob({Column_Obj.name}) "
+                            f"WHERE typeof({Column_Obj.name}) = 'text'"
+                        ))
+            
+            conn.execute(text(f"PRAGMA user_version = {_HEX_DIGEST_SCHEMA_VERSION}"))
+            logger.info("Hash Columns Migrated To Binary Storage")
+    
+    def Has_Torrent(self, Info_Hash: str) -> bool:
+        """
+        Check Whether A Torrent Exists
+        
+        Known Hashes Are Answered From Memory; Others Fall Back To The Database
+        (Torrents Inserted Through A Raw Session Are Picked Up That Way).
+        
+        Args:
+            Info_Hash: Torrent Info Hash
+            
+        Returns:
+            True If The Torrent Is Stored
+        """
+        if Info_Hash in self._Torrent_Hashes:
+            return True
+        
+        with self.Session_Scope() as Session:
+            Found = Session.execute(_TORRENT_EXISTS, {'Info_Hash': Info_Hash}).first() is not None
+        
+        if Found:
+            self._Torrent_Hashes.add(Info_Hash)
+        return Found
+    
+    def Remember_Torrent(self, Info_Hash: str):
+        """Record A Torrent Just Committed So Has_Torrent Answers From Memory"""
+        self._Torrent_Hashes.add(Info_Hash)
+    
     def Get_Session(self):
         """Get Thread-Safe Database Session"""
         if self.Session is None:
             raise RuntimeError("Database Not Initialized")
         return self.Session()
     
+    @contextmanager
+    def Session_Scope(self) -> Iterator:
+        """
+        Run A Unit Of Work In This Thread's Scoped Session
+        
+        Commits When The Block Exits Normally, Rolls Back If It Raises, And Always
+        Closes, Returning The Connection To The Pool.
+        """
+        Session = self.Get_Session()
+        try:
+            yield Session
+            Session.commit()
+        except BaseException:
+            Session.rollback()
+            raise
+        finally:
+            Session.close()
+    
     def Close(self):
         """Close Database Connection"""
         try:
@@ -303,58 +533,54 @@ class Torrent_Operations:
     def Add_Torrent(self, Torrent_Metadata) -> Torrent:
         """Add New Torrent To Database"""
         try:
-            Session = self.DB.Get_Session()
-            
-            # Check If Exists
-            Existing = Session.query(Torrent).filter_by(Info_Hash=Torrent_Metadata.Info_Hash).first()
-            if Existing:
-                logger.info(f"Torrent Already Exists: {Torrent_Metadata.Info_Hash}")
-                Session.close()
-                return Existing
-            
-            # Create Torrent
-            Torrent_Obj = Torrent(
-                Info_Hash=Torrent_Metadata.Info_Hash,
-                Name=Torrent_Metadata.Name,
-                Total_Size=Torrent_Metadata.Get_Total_Size(),
-                Piece_Count=Torrent_Metadata.Get_Piece_Count(),
-                Piece_Size=Torrent_Metadata.Piece_Size,
-                Created_By=Torrent_Metadata.Created_By,
-                Comment=Torrent_Metadata.Comment,
-                Private=Torrent_Metadata.Private
-            )
-            
-            # Add Files
-            for File_Info in Torrent_Metadata.Files:
-                File_Obj = File(
-                    Path=File_Info.Path,
-                    Length=File_Info.Length,
-                    Hash=File_Info.Hash
+            with self.DB.Session_Scope() as Session:
+                # Check If Exists
+                Existing = Session.execute(_TORRENT_BY_HASH, {'Info_Hash': Torrent_Metadata.Info_Hash}).scalar()
+                if Existing:
+                    logger.info(f"Torrent Already Exists: {Torrent_Metadata.Info_Hash}")
+                    self.DB.Remember_Torrent(Torrent_Metadata.Info_Hash)
+                    return Existing
+                
+                # Create Torrent
+                Torrent_Obj = Torrent(
+                    Info_Hash=Torrent_Metadata.Info_Hash,
+                    Name=Torrent_Metadata.Name,
+                    Total_Size=Torrent_Metadata.Get_Total_Size(),
+                    Piece_Count=Torrent_Metadata.Get_Piece_Count(),
+                    Piece_Size=Torrent_Metadata.Piece_Size,
+                    Created_By=Torrent_Metadata.Created_By,
+                    Comment=Torrent_Metadata.Comment,
+                    Private=Torrent_Metadata.Private
                 )
-                Torrent_Obj.Files.append(File_Obj)
-            
-            Session.add(Torrent_Obj)
-            Session.commit()
+                
+                Session.add(Torrent_Obj)
+                Session.flush()
+                
+                # Add Files - One executemany Instead Of An ORM INSERT Per File
+                if Torrent_Metadata.Files:
+                    Session.execute(File.__table__.insert(), [
+                        {
+                            'Torrent_Info_Hash': Torrent_Metadata.Info_Hash,
+                            'Path': File_Info.Path,
+                            'Length': File_Info.Length,
+                            'Hash': File_Info.Hash
+                        }
+                        for File_Info in Torrent_Metadata.Files
+                    ])
             
+            self.DB.Remember_Torrent(Torrent_Metadata.Info_Hash)
             logger.info(f"Torrent Added: {Torrent_Metadata.Name}")
-            
-            Result = Torrent_Obj
-            Session.close()
-            return Result
+            return Torrent_Obj
             
         except Exception as E:
             logger.error(f"Failed To Add Torrent: {E}")
-            Session.rollback()
-            Session.close()
             raise
     
     def Get_Torrent(self, Info_Hash: str) -> Optional[Torrent]:
         """Get Torrent By Info Hash"""
         try:
-            Session = self.DB.Get_Session()
-            Torrent_Obj = Session.query(Torrent).filter_by(Info_Hash=Info_Hash).first()
-            Session.close()
-            return Torrent_Obj
+            with self.DB.Session_Scope() as Session:
+                return Session.execute(_TORRENT_BY_HASH, {'Info_Hash': Info_Hash}).scalar()
             
         except Exception as E:
             logger.error(f"Failed To Get Torrent: {E}")
@@ -363,19 +589,66 @@ class Torrent_Operations:
     def Update_Stats(self, Info_Hash: str, Complete: int, Incomplete: int):
         """Update Torrent Statistics"""
         try:
-            Session = self.DB.Get_Session()
-            Torrent_Obj = Session.query(Torrent).filter_by(Info_Hash=Info_Hash).first()
-            
-            if Torrent_Obj:
-                Torrent_Obj.Complete = Complete
-                Torrent_Obj.Incomplete = Incomplete
-                Session.commit()
-            
-            Session.close()
+            with self.DB.Session_Scope() as Session:
+                Torrent_Obj = Session.execute(_TORRENT_BY_HASH, {'Info_Hash': Info_Hash}).scalar()
+                
+                if Torrent_Obj:
+                    Torrent_Obj.Complete = Complete
+                    Torrent_Obj.Incomplete = Incomplete
             
         except Exception as E:
             logger.error(f"Failed To Update Stats: {E}")
-            Session.close()
+
+
+# Dialects With INSERT ... ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {'sqlite': sqlite.insert, 'postgresql': postgresql.insert}
+
+# Bound Parameters Per Statement (SQLite Builds Before 3.32 Cap At 999)
+_MAX_STATEMENT_PARAMETERS = 999
+
+_PEER_COLUMNS = frozenset(Peer.__table__.columns.keys())
+
+# A Failed Announce Batch Is Retried After 2s, 4s, 8s And 16s, Then Written One Announce At A Time
+_FLUSH_MAX_RETRIES = 5
+_FLUSH_RETRY_SECONDS = 1.0
+
+# Links A Peer To An Existing Torrent Once, However Often It Announces
+_LINK_PEER_SQL = text(
+    "INSERT INTO Torrent_Peers (Torrent_Id, Peer_Id) SELECT :Torrent_Id, :Peer_Id "
+    "WHERE EXISTS (SELECT 1 FROM Torrents WHERE Info_Hash = :Torrent_Id) "
+    "AND NOT EXISTS (SELECT 1 FROM Torrent_Peers WHERE Torrent_Id = :Torrent_Id AND Peer_Id = :Peer_Id)"
+).bindparams(bindparam('Torrent_Id', type_=Hex_Digest(32)))
+
+
+# Compact Peer Entry: 4-Byte IPv4 Address Then Big-Endian Port
+_COMPACT_PEER_SIZE = 6
+_COMPACT_PORT = struct.Struct('>H')
+
+
+def _Pack_Compact_Peers(Rows) -> bytes:
+    """
+    Pack (IP_Address, Port) Rows Into One Compact Peer String
+    
+    Args:
+        Rows: Iterable Of (IP_Address, Port)
+        
+    Returns:
+        Concatenated 6-Byte Entries (Rows Without An IPv4 Address Are Skipped)
+    """
+    Rows = list(Rows)
+    Compact = bytearray(_COMPACT_PEER_SIZE * len(Rows))
+    Offset = 0
+    
+    for IP_Address, Port in Rows:
+        try:
+            Compact[Offset:Offset + 4] = socket.inet_aton(IP_Address)
+            _COMPACT_PORT.pack_into(Compact, Offset + 4, Port)
+        except (OSError, TypeError, struct.error):
+            continue
+        Offset += _COMPACT_PEER_SIZE
+    
+    del Compact[Offset:]
+    return bytes(Compact)
 
 
 class Peer_Operations:
@@ -383,6 +656,17 @@ class Peer_Operations:
     
     def __init__(self, DB_Manager: Database_Manager):
         self.DB = DB_Manager
+        
+        # Announces Queued For The Next Batched Write
+        self._Pending_Peers: List[dict] = []
+        self._Pending_Lock = threading.Lock()
+        self._Pending_Event = threading.Event()
+        self._Flush_Lock = threading.Lock()
+        self._Flush_Thread: Optional[threading.Thread] = None
+        
+        # Consecutive Failed Flushes And The Monotonic Time Before Which None Is Retried
+        self._Flush_Failures = 0
+        self._Retry_At = 0.0
     
     def Add_Or_Update_Peer(
         self,
@@ -394,72 +678,230 @@ class Peer_Operations:
     ) -> Peer:
         """Add Or Update Peer"""
         try:
-            Session = self.DB.Get_Session()
+            with self.DB.Session_Scope() as Session:
+                # Get Or Create Peer
+                Peer_Obj = Session.execute(_PEER_BY_ID, {'Peer_Id': Peer_Id}).scalar()
+                
+                if Peer_Obj:
+                    # Update Existing
+                    Peer_Obj.IP_Address = IP_Address
+                    Peer_Obj.Port = Port
+                    Peer_Obj.Last_Announced = datetime.utcnow()
+                    
+                    # Update Optional Fields
+                    for Key, Value in Kwargs.items():
+                        if hasattr(Peer_Obj, Key):
+                            setattr(Peer_Obj, Key, Value)
+                else:
+                    # Create New
+                    Peer_Obj = Peer(
+                        Peer_Id=Peer_Id,
+                        IP_Address=IP_Address,
+                        Port=Port,
+                        **Kwargs
+                    )
+                    Session.add(Peer_Obj)
+                
+                # Associate With Torrent
+                Torrent_Obj = Session.execute(_TORRENT_BY_HASH, {'Info_Hash': Info_Hash}).scalar()
+                if Torrent_Obj and Torrent_Obj not in Peer_Obj.Torrents:
+                    Peer_Obj.Torrents.append(Torrent_Obj)
             
-            # Get Or Create Peer
-            Peer_Obj = Session.query(Peer).filter_by(Peer_Id=Peer_Id).first()
+            return Peer_Obj
             
-            if Peer_Obj:
-                # Update Existing
-                Peer_Obj.IP_Address = IP_Address
-                Peer_Obj.Port = Port
-                Peer_Obj.Last_Announced = datetime.utcnow()
-                
-                # Update Optional Fields
-                for Key, Value in Kwargs.items():
-                    if hasattr(Peer_Obj, Key):
-                        setattr(Peer_Obj, Key, Value)
-            else:
-                # Create New
-                Peer_Obj = Peer(
-                    Peer_Id=Peer_Id,
-                    IP_Address=IP_Address,
-                    Port=Port,
-                    **Kwargs
-                )
-                Session.add(Peer_Obj)
+        except Exception as E:
+            logger.error(f"Failed To Add/Update Peer: {E}")
+            raise
+    
+    def Add_Or_Update_Peers(self, Records: List[dict]) -> int:
+        """
+        Add Or Update Many Peers In One Transaction
+        
+        Peers Are Written With Multi-Row INSERT ... ON CONFLICT(Peer_Id) DO UPDATE
+        And Linked To Their Torrents In The Same Commit, So A Batch Costs One fsync.
+        
+        Args:
+            Records: Dicts With Peer_Id, IP_Address, Port, Info_Hash And Optional Peer Columns
             
-            # Associate With Torrent
-            Torrent_Obj = Session.query(Torrent).filter_by(Info_Hash=Info_Hash).first()
-            if Torrent_Obj and Torrent_Obj not in Peer_Obj.Torrents:
-                Peer_Obj.Torrents.append(Torrent_Obj)
+        Returns:
+            Number Of Announces Written
+        """
+        if not Records:
+            return 0
+        
+        Insert = _UPSERT_INSERTS.get(self.DB.Engine.dialect.name)
+        if Insert is None:
+            for Record in Records:
+                self.Add_Or_Update_Peer(**Record)
+            return len(Records)
+        
+        Now = datetime.utcnow()
+        Peer_Rows = {}
+        Links = {}
+        for Record in Records:
+            Row = {Key: Value for Key, Value in Record.items() if Key in _PEER_COLUMNS}
+            Row['Last_Announced'] = Now
             
-            Session.commit()
-            Result = Peer_Obj
-            Session.close()
+            # A Peer's Latest Announce In The Batch Wins
+            Peer_Rows[Row['Peer_Id']] = Row
+            Links[(Record['Info_Hash'], Record['Peer_Id'])] = None
+        
+        # Rows With The Same Columns Share One Multi-Row Statement
+        Groups = defaultdict(list)
+        for Row in Peer_Rows.values():
+            Groups[tuple(sorted(Row))].append(Row)
+        
+        try:
+            with self.DB.Session_Scope() as Session:
+                for Columns, Rows in Groups.items():
+                    Rows_Per_Statement = max(1, _MAX_STATEMENT_PARAMETERS // len(Columns))
+                    
+                    for Start in range(0, len(Rows), Rows_Per_Statement):
+                        Statement = Insert(Peer.__table__).values(Rows[Start:Start + Rows_Per_Statement])
+                        Statement = Statement.on_conflict_do_update(
+                            index_elements=['Peer_Id'],
+                            set_={Column_Name: Statement.excluded[Column_Name] for Column_Name in Columns if Column_Name != 'Peer_Id'}
+                        )
+                        Session.execute(Statement)
+                
+                Session.execute(
+                    _LINK_PEER_SQL,
+                    [{'Torrent_Id': Info_Hash, 'Peer_Id': Peer_Id} for Info_Hash, Peer_Id in Links]
+                )
             
-            return Result
+            return len(Records)
             
         except Exception as E:
-            logger.error(f"Failed To Add/Update Peer: {E}")
-            Session.rollback()
-            Session.close()
+            logger.error(f"Failed To Add/Update {len(Records)} Peers: {E}")
             raise
     
-    def Get_Peers(self, Info_Hash: str, Limit: int = 50) -> List[Peer]:
-        """Get Peers For Torrent"""
-        try:
-            Session = self.DB.Get_Session()
+    def Queue_Peer(
+        self,
+        Peer_Id: str,
+        IP_Address: str,
+        Port: int,
+        Info_Hash: str,
+        **Kwargs
+    ):
+        """
+        Queue An Announce For The Next Batched Add_Or_Update_Peers Call
+        
+        Written Within Announce_Flush_MS, Or Immediately Once Announce_Batch_Size
+        Announces Are Waiting.
+        
+        Args:
+            Peer_Id: Peer ID
+            IP_Address: Peer IP
+            Port: Peer Port
+            Info_Hash: Torrent Announced For
+            **Kwargs: Optional Peer Columns (Uploaded, Left, Is_Seeder, ...)
+        """
+        with self._Pending_Lock:
+            self._Pending_Peers.append(
+                dict(Kwargs, Peer_Id=Peer_Id, IP_Address=IP_Address, Port=Port, Info_Hash=Info_Hash)
+            )
+            Should_Flush = len(self._Pending_Peers) >= Database_Config.Announce_Batch_Size
             
-            Torrent_Obj = Session.query(Torrent).filter_by(Info_Hash=Info_Hash).first()
+            if self._Flush_Thread is None:
+                self._Start_Flush_Task()
+        
+        if Should_Flush:
+            self.Flush()
+        else:
+            self._Pending_Event.set()
+    
+    def _Start_Flush_Task(self):
+        """Start Background Task That Writes Queued Announces"""
+        def Flush_Pending_Peers():
+            while True:
+                # Idle Until An Announce Arrives, Then Let The Batch Window Fill
+                self._Pending_Event.wait()
+                time.sleep(Database_Config.Announce_Flush_MS / 1000)
+                self._Pending_Event.clear()
+                
+                Delay = self._Retry_At - time.monotonic()
+                if Delay > 0:
+                    time.sleep(Delay)
+                self.Flush()
+        
+        self._Flush_Thread = threading.Thread(target=Flush_Pending_Peers, daemon=True)
+        self._Flush_Thread.start()
+        atexit.register(self.Flush, True)
+    
+    def Flush(self, Force: bool = False):
+        """
+        Write All Queued Announces In One Transaction
+        
+        A Failed Batch Goes Back To The Front Of The Queue And Is Retried With
+        Exponential Backoff. Once It Has Failed _FLUSH_MAX_RETRIES Times It Is
+        Written One Announce At A Time, And Announces That Still Fail Are Dropped.
+        
+        Args:
+            Force: Retry Immediately Even While Backing Off (Used At Exit)
+        """
+        # Serialised So An Older Batch Never Lands After A Newer One
+        with self._Flush_Lock:
+            with self._Pending_Lock:
+                if not Force and time.monotonic() < self._Retry_At:
+                    return
+                Records, self._Pending_Peers = self._Pending_Peers, []
             
-            if Torrent_Obj:
-                Peers = Torrent_Obj.Peers[:Limit]
-            else:
-                Peers = []
+            if not Records:
+                return
             
-            Session.close()
-            return Peers
+            try:
+                self.Add_Or_Update_Peers(Records)
+                logger.debug(f"Flushed {len(Records)} Peer Announces To Database")
+            except Exception:
+                self._Flush_Failures += 1
+                
+                if self._Flush_Failures < _FLUSH_MAX_RETRIES:
+                    Delay = _FLUSH_RETRY_SECONDS * 2 ** self._Flush_Failures
+                    
+                    # Keep The Batch Ahead Of Newer Announces So A Later Stopped Event Still Wins
+                    with self._Pending_Lock:
+                        self._Pending_Peers[:0] = Records
+                        self._Retry_At = time.monotonic() + Delay
+                    
+                    self._Pending_Event.set()
+                    logger.warning(f"Kept {len(Records)} Unsaved Peer Announces Pending, Retrying In {Delay:g}s")
+                    return
+                
+                # Isolate Announces The Database Keeps Rejecting So They Cannot Hold Back The Queue
+                for Record in Records:
+                    try:
+                        self.Add_Or_Update_Peers([Record])
+                    except Exception:
+                        logger.error(
+                            f"Dropped Announce From Peer {Record['Peer_Id']} For {Record['Info_Hash']} "
+                            f"After {_FLUSH_MAX_RETRIES} Failed Batch Writes"
+                        )
+            
+            self._Flush_Failures = 0
+            self._Retry_At = 0.0
+    
+    def Get_Peers(self, Info_Hash: str, Limit: int = 50) -> List[Peer]:
+        """Get Peers For Torrent"""
+        try:
+            with self.DB.Session_Scope() as Session:
+                # Limit In SQL Rather Than Loading Every Peer Of The Torrent
+                return Session.execute(_TORRENT_PEERS, {'Info_Hash': Info_Hash, 'Limit': Limit}).scalars().all()
             
         except Exception as E:
             logger.error(f"Failed To Get Peers: {E}")
             return []
     
     def Get_Compact_Peers(self, Info_Hash: str, Limit: int = 50) -> bytes:
-        """Get Compact Peer List"""
-        Peers = self.Get_Peers(Info_Hash, Limit)
-        Compact_Data = b''.join([P.To_Compact() for P in Peers])
-        return Compact_Data
+        """Get Compact Peer List (Reads Only IP_Address And Port - No Peer Objects)"""
+        try:
+            with self.DB.Session_Scope() as Session:
+                Rows = Session.execute(_COMPACT_PEERS, {'Info_Hash': Info_Hash, 'Limit': Limit}).all()
+            
+            return _Pack_Compact_Peers(Rows)
+            
+        except Exception as E:
+            logger.error(f"Failed To Get Compact Peers: {E}")
+            return b''
 
 
 class Dead_Drop_Operations:
@@ -473,8 +915,6 @@ class Dead_Drop_Operations:
         try:
             from Crypto.Core_Crypto import AES_Cipher
 
-            Session = self.DB.Get_Session()
-
             # Read File
             with open(File_Path, 'rb') as f:
                 File_Data = f.read()
@@ -499,19 +939,14 @@ class Dead_Drop_Operations:
                 Self_Destruct=True
             )
 
-            Session.add(Dead_Drop_Obj)
-            Session.commit()
-
-            Result = Drop_Id
-            Session.close()
+            with self.DB.Session_Scope() as Session:
+                Session.add(Dead_Drop_Obj)
 
             logger.info(f"Password-Protected Dead Drop Created : {Drop_Id}")
-            return Result
+            return Drop_Id
 
         except Exception as E:
             logger.error(f"Failed To Create Password-Protected Dead Drop: {E}")
-            Session.rollback()
-            Session.close()
             raise
 
     def Access_Dead_Drop(self, Drop_Id: str, Password: str) -> Optional[bytes]:
@@ -519,57 +954,47 @@ class Dead_Drop_Operations:
         try:
             from Crypto.Core_Crypto import AES_Cipher
 
-            Session = self.DB.Get_Session()
+            with self.DB.Session_Scope() as Session:
+                # Find Dead Drop
+                Dead_Drop_Obj = Session.execute(_DEAD_DROP_BY_ID, {'Drop_Id': Drop_Id}).scalar()
 
-            # Find Dead Drop
-            Dead_Drop_Obj = Session.query(Dead_Drop).filter_by(Id=Drop_Id).first()
+                if not Dead_Drop_Obj:
+                    return None
 
-            if not Dead_Drop_Obj:
-                Session.close()
-                return None
-
-            # Check If Expired
-            if datetime.utcnow() > Dead_Drop_Obj.Expires_At:
-                Session.delete(Dead_Drop_Obj)
+                # Check If Expired
+                if datetime.utcnow() > Dead_Drop_Obj.Expires_At:
+                    Session.delete(Dead_Drop_Obj)
+                    logger.info(f"Dead Drop Expired And Removed: {Drop_Id}")
+                    return None
+
+                # Check Access Count
+                if Dead_Drop_Obj.Access_Count >= Dead_Drop_Obj.Max_Access:
+                    if Dead_Drop_Obj.Self_Destruct:
+                        Session.delete(Dead_Drop_Obj)
+                    logger.info(f"Dead Drop Access Limit Reached : {Drop_Id}")
+                    return None
+
+                # Increment Access Count - Counted Even If The Password Turns Out Wrong
+                Dead_Drop_Obj.Access_Count += 1
                 Session.commit()
-                Session.close()
-                logger.info(f"Dead Drop Expired And Removed: {Drop_Id}")
-                return None
 
-            # Check Access Count
-            if Dead_Drop_Obj.Access_Count >= Dead_Drop_Obj.Max_Access:
-                if Dead_Drop_Obj.Self_Destruct:
+                # Decrypt Data With Password
+                try:
+                    Plaintext = AES_Cipher.Decrypt_With_Password(
+                        Dead_Drop_Obj.Salt,
+                        Dead_Drop_Obj.Nonce,
+                        Dead_Drop_Obj.Encrypted_Data,
+                        Password
+                    )
+                except Exception as Decrypt_Error:
+                    # Wrong Password Or Corrupted Data
+                    logger.warning(f"Failed To Decrypt Dead Drop {Drop_Id}: {Decrypt_Error}")
+                    return None
+
+                # Self-Destruct If Enabled
+                if Dead_Drop_Obj.Self_Destruct and Dead_Drop_Obj.Access_Count >= Dead_Drop_Obj.Max_Access:
                     Session.delete(Dead_Drop_Obj)
-                    Session.commit()
-                Session.close()
-                logger.info(f"Dead Drop Access Limit Reached : {Drop_Id}")
-                return None
-
-            # Increment Access Count
-            Dead_Drop_Obj.Access_Count += 1
-            Session.commit()
-
-            # Decrypt Data With Password
-            try:
-                Plaintext = AES_Cipher.Decrypt_With_Password(
-                    Dead_Drop_Obj.Salt,
-                    Dead_Drop_Obj.Nonce,
-                    Dead_Drop_Obj.Encrypted_Data,
-                    Password
-                )
-            except Exception as Decrypt_Error:
-                # Wrong Password Or Corrupted Data
-                logger.warning(f"Failed To Decrypt Dead Drop {Drop_Id}: {Decrypt_Error}")
-                Session.close()
-                return None
-
-            # Self-Destruct If Enabled
-            if Dead_Drop_Obj.Self_Destruct and Dead_Drop_Obj.Access_Count >= Dead_Drop_Obj.Max_Access:
-                Session.delete(Dead_Drop_Obj)
-                logger.info(f"Dead Drop Self-Destructed: {Drop_Id}")
-
-            Session.commit()
-            Session.close()
+                    logger.info(f"Dead Drop Self-Destructed: {Drop_Id}")
 
             return Plaintext
 
@@ -580,92 +1005,104 @@ class Dead_Drop_Operations:
     def Cleanup_Expired_Drops(self):
         """Remove Expired Dead Drops"""
         try:
-            Session = self.DB.Get_Session()
+            with self.DB.Session_Scope() as Session:
+                Now = {'Now': datetime.utcnow()}
 
-            Expired_Drops = Session.query(Dead_Drop).filter(
-                Dead_Drop.Expires_At < datetime.utcnow()
-            ).all()
+                # Fetch Only The Ids For Logging, Then Delete In One Statement
+                Expired_Ids = Session.execute(_EXPIRED_DROP_IDS, Now).scalars().all()
+                Session.execute(_DELETE_EXPIRED_DROPS, Now, execution_options={'synchronize_session': False})
 
-            for Drop in Expired_Drops:
-                Session.delete(Drop)
-                logger.info(f"Cleaned Up Expired Dead Drop: {Drop.Id}")
-
-            Session.commit()
-            Session.close()
+            for Drop_Id in Expired_Ids:
+                logger.info(f"Cleaned Up Expired Dead Drop: {Drop_Id}")
 
         except Exception as E:
             logger.error(f"Failed To Cleanup Dead Drops: {E}")
 
 
+def _Find_Nonce(Block_Hash: str, Difficulty: int) -> int:
+    """
+    Proof-Of-Work Search For The Smallest Nonce Whose SHA-256(Block_Hash + Nonce) Has Difficulty Leading Hex Zeros
+    
+    The 64-Character Block Hash Fills Exactly One SHA-256 Block, So It Is Compressed
+    Once And Every Attempt Resumes From That Midstate; Digests Are Compared Raw
+    Against A Bound Instead Of Formatting hexdigest() Per Nonce.
+    
+    Args:
+        Block_Hash: Hex Block Hash
+        Difficulty: Leading Hex Zeros Required
+        
+    Returns:
+        Nonce
+    """
+    Limit = (16 ** (64 - Difficulty) - 1).to_bytes(32, 'big')
+    Copy = Fast_SHA256(Block_Hash.encode()).copy
+    
+    Nonce = 0
+    while True:
+        Hash_Obj = Copy()
+        Hash_Obj.update(b'%d' % Nonce)
+        if Hash_Obj.digest() <= Limit:
+            return Nonce
+        Nonce += 1
+
+
 class Blockchain_Operations:
     """Blockchain Database Operations"""
 
     def __init__(self, DB_Manager: Database_Manager):
         self.DB = DB_Manager
 
+        # (Block_Number, Block_Hash) Of The Last Block Already Validated
+        self._Validated_Tip: Optional[Tuple[int, str]] = None
+
     def Add_Block(self, Data: bytes, Validator: str = "system") -> Blockchain_Record:
         """Add a new block to the blockchain"""
         try:
-            Session = self.DB.Get_Session()
-
-            # Get Previous Block Hash
-            Prev_Block = Session.query(Blockchain_Record).order_by(
-                Blockchain_Record.Block_Number.desc()
-            ).first()
-
-            Prev_Hash = Prev_Block.Block_Hash if Prev_Block else "0" * 64
-            Block_Number = (Prev_Block.Block_Number + 1) if Prev_Block else 1
-
-            # Create Block Hash (Simplified - In Real Blockchain Would Include Proof-Of-Work)
-            # Use A Consistent Timestamp For Both Hash And Storage
-            Block_Timestamp = datetime.utcnow()
-            Block_Content = f"{Block_Number}{Prev_Hash}{Data.hex()}{Block_Timestamp.isoformat()}".encode()
-            Block_Hash = hashlib.sha256(Block_Content).hexdigest()
-
-            # Find Nonce (Simplified Proof-Of-Work)
-            Nonce = 0
-            Difficulty = 4  # Require 4 Leading Zeros
-            while True:
-                Test_Hash = hashlib.sha256(f"{Block_Hash}{Nonce}".encode()).hexdigest()
-                if Test_Hash.startswith("0" * Difficulty):
-                    break
-                Nonce += 1
-
-            # Create Block Record
-            Block_Obj = Blockchain_Record(
-                Block_Hash=Block_Hash,
-                Previous_Hash=Prev_Hash,
-                Block_Number=Block_Number,
-                Data=Data,
-                Timestamp=Block_Timestamp,  # Use The Same Timestamp
-                Nonce=Nonce,
-                Difficulty=Difficulty,
-                Validator=Validator
-            )
-
-            Session.add(Block_Obj)
-            Session.commit()
+            with self.DB.Session_Scope() as Session:
+                # Get Previous Block Hash (Only The Two Columns - Not Its Data Blob)
+                Prev_Block = Session.execute(_LATEST_BLOCK).first()
+
+                Prev_Hash = Prev_Block.Block_Hash if Prev_Block else "0" * 64
+                Block_Number = (Prev_Block.Block_Number + 1) if Prev_Block else 1
+
+                # Create Block Hash (Simplified - In Real Blockchain Would Include Proof-Of-Work)
+                # Use A Consistent Timestamp For Both Hash And Storage
+                Block_Timestamp = datetime.utcnow()
+                Block_Content = f"{Block_Number}{Prev_Hash}{Data.hex()}{Block_Timestamp.isoformat()}".encode()
+                Block_Hash = hashlib.sha256(Block_Content).hexdigest()
+
+                # Find Nonce (Simplified Proof-Of-Work)
+                Difficulty = 4  # Require 4 Leading Zeros
+                Nonce = _Find_Nonce(Block_Hash, Difficulty)
+
+                # Create Block Record
+                Block_Obj = Blockchain_Record(
+                    Block_Hash=Block_Hash,
+                    Previous_Hash=Prev_Hash,
+                    Block_Number=Block_Number,
+                    Data=Data,
+                    Timestamp=Block_Timestamp,  # Use The Same Timestamp
+                    Nonce=Nonce,
+                    Difficulty=Difficulty,
+                    Validator=Validator
+                )
 
-            Result = Block_Hash  # Return Hash String Instead Of Object
-            Session.close()
+                Session.add(Block_Obj)
 
             logger.info(f"Block Added To Blockchain: #{Block_Number}")
-            return Result
+            return Block_Hash  # Return Hash String Instead Of Object
 
         except Exception as E:
             logger.error(f"Failed To Add Block: {E}")
-            Session.rollback()
-            Session.close()
             raise
 
     def Get_Blockchain(self, Limit: int = 50) -> List[Blockchain_Record]:
         """Get Blockchain Records"""
         try:
-            Session = self.DB.Get_Session()
-            Blocks = Session.query(Blockchain_Record).order_by(
-                Blockchain_Record.Block_Number.desc()
-            ).limit(Limit).all()
-            Session.close()
+            with self.DB.Session_Scope() as Session:
+                Blocks = Session.query(Blockchain_Record).order_by(
+                    Blockchain_Record.Block_Number.desc()
+                ).limit(Limit).all()
             return list(reversed(Blocks))  # Return In Ascending Order
 
         except Exception as E:
@@ -673,18 +1110,32 @@ class Blockchain_Operations:
             return []
 
     def Validate_Blockchain(self) -> bool:
-        """Validate Blockchain Integrity"""
+        """
+        Validate Blockchain Integrity
+
+        Only Blocks Appended Since The Last Successful Validation Are Re-Hashed;
+        If The Remembered Tip Is Gone Or Changed, The Whole Chain Is Checked Again.
+        """
         try:
-            Session = self.DB.Get_Session()
-            Blocks = Session.query(Blockchain_Record).order_by(Blockchain_Record.Block_Number).all()
-            Session.close()
+            with self.DB.Session_Scope() as Session:
+                Blocks = []
+                if self._Validated_Tip is not None:
+                    Blocks = Session.query(Blockchain_Record).filter(
+                        Blockchain_Record.Block_Number >= self._Validated_Tip[0]
+                    ).order_by(Blockchain_Record.Block_Number).all()
+
+                    if not Blocks or (Blocks[0].Block_Number, Blocks[0].Block_Hash) != self._Validated_Tip:
+                        self._Validated_Tip = None
+
+                if self._Validated_Tip is None:
+                    Blocks = Session.query(Blockchain_Record).order_by(Blockchain_Record.Block_Number).all()
 
             if not Blocks:
                 logger.info("Blockchain Is Empty - Validation Passed")
                 return True
 
             for i, Block in enumerate(Blocks):
-                if i == 0:  # Genesis Block - Skip Detailed Validation For Now
+                if i == 0:  # Genesis Block Or Already-Validated Tip
                     continue
 
                 # Verify Previous Hash  
@@ -725,6 +1176,7 @@ class Blockchain_Operations:
                     logger.error(f"Required Prefix: {'0' * Block.Difficulty}")
                     return False
 
+            self._Validated_Tip = (Blocks[-1].Block_Number, Blocks[-1].Block_Hash)
             logger.info("Blockchain Validation Successful")
             return True
 
@@ -735,18 +1187,15 @@ class Blockchain_Operations:
     def Get_Blockchain_Stats(self) -> dict:
         """Get Blockchain Statistics"""
         try:
-            Session = self.DB.Get_Session()
-
-            Total_Blocks = Session.query(Blockchain_Record).count()
-            Latest_Block = Session.query(Blockchain_Record).order_by(
-                Blockchain_Record.Block_Number.desc()
-            ).first()
-
-            Session.close()
+            with self.DB.Session_Scope() as Session:
+                Total_Blocks, Latest_Block = Session.execute(
+                    select(func.count(), func.max(Blockchain_Record.Block_Number))
+                    .select_from(Blockchain_Record)
+                ).one()
 
             return {
                 'total_blocks': Total_Blocks,
-                'latest_block': Latest_Block.Block_Number if Latest_Block else 0,
+                'latest_block': Latest_Block or 0,
                 'chain_size': Total_Blocks * 1024,  # Rough Estimate
                 'is_valid': self.Validate_Blockchain()
             }
@@ -758,10 +1207,9 @@ class Blockchain_Operations:
     def Clear_Blockchain(self):
         """Clear All Blockchain Records (For Testing/Reset Purposes)"""
         try:
-            Session = self.DB.Get_Session()
-            Session.query(Blockchain_Record).delete()
-            Session.commit()
-            Session.close()
+            with self.DB.Session_Scope() as Session:
+                Session.query(Blockchain_Record).delete()
+            self._Validated_Tip = None
             logger.info("Blockchain Cleared")
             return True
         except Exception as E:
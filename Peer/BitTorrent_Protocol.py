@@ -4,7 +4,7 @@ Full P2P File Sharing With Piece Verification
 """
 
 import asyncio
-import hashlib
+import hmac
 import struct
 import random
 import time
@@ -13,7 +13,8 @@ from dataclasses import dataclass
 from loguru import logger
 
 from Peer import Peer_Connection
-from Core import Torrent_Metadata
+from Core import Torrent_Metadata, Pieces_Bitmap_From_Indices, Iter_Present_Pieces
+from Crypto import Get_Hash_Constructor
 
 
 @dataclass
@@ -71,6 +72,7 @@ class BitTorrent_Protocol:
         # Piece Management
         self.total_pieces = len(torrent_metadata.Piece_Hashes)
         self.piece_size = torrent_metadata.Piece_Size
+        self.piece_hasher = Get_Hash_Constructor(torrent_metadata.Hash_Algo)
         self.have_pieces = set()  # Pieces We Have
         self.requested_pieces = set()  # Pieces We Have Requested
 
@@ -150,13 +152,9 @@ class BitTorrent_Protocol:
     def create_bitfield_message(self) -> bytes:
         """Create BITFIELD Message"""
         # Create BitField From Have_Pieces
-        bitfield = bytearray((self.total_pieces + 7) // 8)
-        for piece in self.have_pieces:
-            byte_index = piece // 8
-            bit_index = piece % 8
-            bitfield[byte_index] |= (1 << (7 - bit_index))
+        bitfield = Pieces_Bitmap_From_Indices(self.total_pieces, self.have_pieces)
 
-        return self.create_message(self.MSG_BITFIELD, bytes(bitfield))
+        return self.create_message(self.MSG_BITFIELD, bitfield)
 
     def create_request_message(self, piece_index: int, block_offset: int, block_length: int) -> bytes:
         """Create REQUEST Message"""
@@ -171,14 +169,7 @@ class BitTorrent_Protocol:
 
     def parse_bitfield_message(self, payload: bytes) -> Set[int]:
         """Parse BITFIELD Message"""
-        pieces = set()
-        for byte_index, byte_value in enumerate(payload):
-            for bit_index in range(8):
-                if byte_value & (1 << (7 - bit_index)):
-                    piece_index = byte_index * 8 + bit_index
-                    if piece_index < self.total_pieces:
-                        pieces.add(piece_index)
-        return pieces
+        return set(Iter_Present_Pieces(payload, self.total_pieces))
 
     def parse_request_message(self, payload: bytes) -> Optional[Tuple[int, int, int]]:
         """Parse REQUEST Message"""
@@ -530,13 +521,13 @@ class BitTorrent_Protocol:
         for offset in sorted(piece_buffer.keys()):
             piece_data += piece_buffer[offset]
 
-        # Calculate SHA-1 Hash
-        piece_hash = hashlib.sha1(piece_data).digest()
+        # Hash With The Torrent's Piece Algorithm (SHA-256 Unless The Torrent Declares BLAKE3)
+        piece_hash = self.piece_hasher(piece_data).digest()
 
         # Compare With Expected Hash From Torrent
-        expected_hash = bytes.fromhex(self.metadata.Piece_Hashes[piece_index])
+        expected_hash = self.metadata.Get_Piece_Digest(piece_index)
 
-        return piece_hash == expected_hash
+        return hmac.compare_digest(piece_hash, expected_hash)
 
     async def _write_piece_to_files(self, piece_index: int):
         """Write Completed Piece Data To Appropriate Files"""
@@ -679,11 +670,11 @@ class BitTorrent_Protocol:
 
             # Verify Piece Data
             if len(piece_data) == piece_size:
-                # Calculate SHA-256 Hash
-                piece_hash = hashlib.sha256(piece_data).digest()
-                expected_hash = bytes.fromhex(self.metadata.Piece_Hashes[piece_index])
+                # Hash With The Torrent's Piece Algorithm
+                piece_hash = self.piece_hasher(piece_data).digest()
+                expected_hash = self.metadata.Get_Piece_Digest(piece_index)
 
-                return piece_hash == expected_hash
+                return hmac.compare_digest(piece_hash, expected_hash)
             else:
                 return False
 
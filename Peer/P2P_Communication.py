@@ -92,19 +92,16 @@ class Compact_Peer_List:
             Compact Peer Data
         """
         try:
-            Compact_Data = b''
+            # Filled In Place - Appending To bytes Would Copy The Whole List Per Peer
+            Compact_Data = bytearray(6 * len(Peers))
             
-            for IP, Port in Peers:
-                # Convert IP To 4 Bytes
-                IP_Bytes = socket.inet_aton(IP)
-                
-                # Convert Port To 2 Bytes (Big Endian)
-                Port_Bytes = struct.pack('>H', Port)
-                
-                Compact_Data += IP_Bytes + Port_Bytes
+            for Offset, (IP, Port) in zip(range(0, len(Compact_Data), 6), Peers):
+                # 4-Byte IP Then 2-Byte Big-Endian Port
+                Compact_Data[Offset:Offset + 4] = socket.inet_aton(IP)
+                struct.pack_into('>H', Compact_Data, Offset + 4, Port)
             
             logger.debug(f"Encoded {len(Peers)} Peers To Compact Format")
-            return Compact_Data
+            return bytes(Compact_Data)
             
         except Exception as E:
             logger.error(f"Failed To Encode Compact Peers: {E}")
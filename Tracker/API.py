@@ -230,9 +230,12 @@ class Tracker_API:
                 if not Info_Hash or not Peer_Id or not Port:
                     return jsonify({'Failure Reason': 'Missing Required Parameters'}), 400
                 
-                # Ensure Torrent Exists
-                Torrent = self.Torrent_Ops.Get_Torrent(Info_Hash)
-                if not Torrent:
+                # Info Hashes Are Stored As Raw SHA-256 Digests
+                if not self._Validate_Info_Hash(Info_Hash):
+                    return jsonify({'Failure Reason': 'Invalid Info Hash'}), 400
+                
+                # Ensure Torrent Exists (Known Hashes Are Answered From Memory)
+                if not self.DB.Has_Torrent(Info_Hash):
                     from Database.Models import Torrent
                     Session = self.DB.Get_Session()
                     Torrent = Torrent(
@@ -245,9 +248,10 @@ class Tracker_API:
                     Session.add(Torrent)
                     Session.commit()
                     Session.close()
+                    self.DB.Remember_Torrent(Info_Hash)
                 
-                # Add/Update Peer
-                self.Peer_Ops.Add_Or_Update_Peer(
+                # Add/Update Peer (Batched With Concurrent Announces Into One Transaction)
+                self.Peer_Ops.Queue_Peer(
                     Peer_Id=Peer_Id,
                     IP_Address=IP,
                     Port=Port,
@@ -267,9 +271,6 @@ class Tracker_API:
                     'Event': Event
                 })
                 
-                # Get Torrent Stats
-                Torrent = self.Torrent_Ops.Get_Torrent(Info_Hash)
-                
                 # Get Peers
                 Peers = self.Peer_Ops.Get_Peers(Info_Hash, Limit=Numwant)
                 